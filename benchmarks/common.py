@@ -0,0 +1,128 @@
+import math
+import os
+import resource
+import sys
+from collections import Counter
+from typing import Dict, List, Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Compute a percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: Sample values
+        q: Percentile in the range [0, 100]
+
+    Returns:
+        Percentile value, or 0.0 for an empty sample
+    """
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(latencies: Sequence[float]) -> Dict[str, float]:
+    """
+    Summarize a list of latencies in seconds.
+
+    Args:
+        latencies: Latencies in seconds
+
+    Returns:
+        Dictionary with count, mean, p50, p95 and max in milliseconds
+    """
+
+    return {
+        'count': len(latencies),
+        'mean_ms': 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+        'p50_ms': 1000 * percentile(latencies, 50),
+        'p95_ms': 1000 * percentile(latencies, 95),
+        'max_ms': 1000 * max(latencies) if latencies else 0.0
+    }
+
+
+def current_rss_mb() -> float:
+    """
+    Get the current resident set size of this process.
+
+    Returns:
+        RSS in megabytes (peak RSS on platforms without /proc)
+    """
+
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    """
+    Get the peak resident set size of this process.
+
+    Returns:
+        Peak RSS in megabytes
+    """
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+def sentence_bleu(hypothesis: str, reference: str, max_order: int = 4) -> float:
+    """
+    Compute a smoothed sentence-level BLEU score between two strings.
+    Tokens are whitespace separated; add-one smoothing keeps short
+    sentences from scoring zero on a single missing n-gram order.
+
+    Args:
+        hypothesis: Candidate text
+        reference: Reference text
+        max_order: Highest n-gram order (default: 4)
+
+    Returns:
+        BLEU score in the range [0, 1]
+    """
+
+    hyp = hypothesis.split()
+    ref = reference.split()
+    if not hyp or not ref:
+        return float(hyp == ref)
+
+    log_precision = 0.0
+    for n in range(1, max_order + 1):
+        hyp_ngrams = Counter(tuple(hyp[i:i + n]) for i in range(len(hyp) - n + 1))
+        ref_ngrams = Counter(tuple(ref[i:i + n]) for i in range(len(ref) - n + 1))
+        matches = sum((hyp_ngrams & ref_ngrams).values())
+        total = max(len(hyp) - n + 1, 0)
+        log_precision += math.log((matches + 1) / (total + 1)) / max_order
+
+    brevity = min(0.0, 1 - len(ref) / len(hyp))
+    return math.exp(log_precision + brevity)
+
+
+def corpus_agreement(hypotheses: List[str], references: List[str]) -> Dict[str, float]:
+    """
+    Compare two lists of outputs sentence by sentence.
+
+    Args:
+        hypotheses: Candidate outputs
+        references: Reference outputs
+
+    Returns:
+        Dictionary with mean sentence BLEU and exact match rate
+    """
+
+    pairs = list(zip(hypotheses, references))
+    if not pairs:
+        return {'bleu': 0.0, 'exact_match': 0.0}
+    return {
+        'bleu': sum(sentence_bleu(h, r) for h, r in pairs) / len(pairs),
+        'exact_match': sum(h == r for h, r in pairs) / len(pairs)
+    }
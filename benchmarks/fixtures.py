@@ -0,0 +1,140 @@
+"""
+Offline fixtures for benchmarks: synthetic WAV recordings with transcripts and
+tiny randomly initialized Marian models that stand in for downloaded weights.
+"""
+
+import os
+import wave
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from benchmarks.quantization import SENTENCES
+from benchmarks.silence import synthesize_recording
+
+SPECIAL_TOKENS = ["<pad>", "</s>", "<unk>"]
+
+
+def write_wav_fixtures(path: str, count: int, min_seconds: float = 1.0, max_seconds: float = 6.0,
+                       sample_rate: int = 44100, language: str = 'italian', seed: int = 0) -> List[str]:
+    """
+    Write synthetic speech-like recordings as name.wav / name.txt fixture pairs,
+    the layout read by StubRecognizer.from_directory.
+
+    Args:
+        path: Directory the fixtures are written to
+        count: Number of recordings
+        min_seconds: Shortest recording in seconds (default: 1.0)
+        max_seconds: Longest recording in seconds (default: 6.0)
+        sample_rate: Sample rate in Hz (default: 44100)
+        language: Language of the transcripts, a key of SENTENCES (default: 'italian')
+        seed: Random seed (default: 0)
+
+    Returns:
+        Paths of the WAV files in order
+    """
+
+    os.makedirs(path, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    sentences = SENTENCES[language]
+    paths = []
+    for i in range(count):
+        seconds = rng.uniform(min_seconds, max_seconds)
+        audio = synthesize_recording(seconds, sample_rate, seed=seed + i)
+        wav_path = os.path.join(path, f"utterance_{i:04d}.wav")
+        with wave.open(wav_path, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(audio.sample_width)
+            wav_file.setframerate(audio.sample_rate)
+            wav_file.writeframes(audio.frame_data)
+        with open(os.path.splitext(wav_path)[0] + ".txt", 'w', encoding='utf-8') as f:
+            f.write(sentences[i % len(sentences)])
+        paths.append(wav_path)
+    return paths
+
+
+def build_tiny_translator(vocabulary: Iterable[str], d_model: int = 64, layers: int = 2,
+                          length_ratio: float = 1.2, num_beams: int = 4, seed: int = 0):
+    """
+    Build a translation pipeline around a randomly initialized Marian model.
+    The architecture, tokenization and beam search match the real models at a
+    fraction of the size, so the code around the model is exercised without
+    downloading weights. Random weights never learn when to stop, so the
+    output length is fixed to a multiple of the input length instead of
+    running to max_length.
+
+    Args:
+        vocabulary: Words known to the word-level tokenizer
+        d_model: Hidden size (default: 64)
+        layers: Encoder and decoder layers (default: 2)
+        length_ratio: Generated tokens per input token (default: 1.2)
+        num_beams: Beam width, 4 like the Opus-MT models (default: 4)
+        seed: Random seed for the weights (default: 0)
+
+    Returns:
+        Translation pipeline with .model and .tokenizer
+    """
+
+    import torch
+    from tokenizers import Tokenizer
+    from tokenizers.models import WordLevel
+    from tokenizers.pre_tokenizers import Whitespace
+    from tokenizers.processors import TemplateProcessing
+    from transformers import MarianConfig, MarianMTModel, PreTrainedTokenizerFast, pipeline
+
+    words = SPECIAL_TOKENS + sorted(set(vocabulary) - set(SPECIAL_TOKENS))
+    vocab = {word: i for i, word in enumerate(words)}
+    backend = Tokenizer(WordLevel(vocab, unk_token="<unk>"))
+    backend.pre_tokenizer = Whitespace()
+    backend.post_processor = TemplateProcessing(single="$A </s>", special_tokens=[("</s>", vocab["</s>"])])
+    tokenizer = PreTrainedTokenizerFast(tokenizer_object=backend, pad_token="<pad>", eos_token="</s>",
+                                        unk_token="<unk>", model_input_names=["input_ids", "attention_mask"],
+                                        clean_up_tokenization_spaces=False)
+
+    config = MarianConfig(
+        vocab_size=len(words), d_model=d_model,
+        encoder_layers=layers, decoder_layers=layers,
+        encoder_attention_heads=4, decoder_attention_heads=4,
+        encoder_ffn_dim=4 * d_model, decoder_ffn_dim=4 * d_model,
+        pad_token_id=vocab["<pad>"], eos_token_id=vocab["</s>"], decoder_start_token_id=vocab["<pad>"],
+        max_position_embeddings=512
+    )
+    torch.manual_seed(seed)
+    model = MarianMTModel(config).eval()
+    model.generation_config.num_beams = num_beams
+    generate = model.generate
+
+    def fixed_length_generate(input_ids=None, **kwargs):
+        kwargs.pop('max_length', None)
+        kwargs['max_new_tokens'] = max(1, round(input_ids.shape[1] * length_ratio))
+        return generate(input_ids, **kwargs)
+
+    model.generate = fixed_length_generate
+    with torch.no_grad():
+        model.final_logits_bias[0, vocab["</s>"]] = -1e4
+        model.final_logits_bias[0, vocab["<pad>"]] = -1e4
+    return pipeline("translation", model=model, tokenizer=tokenizer, device=-1)
+
+
+def install_tiny_models(translator_model, pairs: Sequence[Tuple[str, str]],
+                        **options) -> Dict[Tuple[str, str], object]:
+    """
+    Put tiny random models in a TranslatorModel's cache so that load_model
+    returns them instead of downloading the real weights.
+
+    Args:
+        translator_model: TranslatorModel to install the models into
+        pairs: (source_lang, target_lang) pairs to install
+        **options: Extra arguments for build_tiny_translator
+
+    Returns:
+        Mapping of pair to installed pipeline
+    """
+
+    vocabulary = {word for sentences in SENTENCES.values() for sentence in sentences
+                  for word in sentence.replace('?', ' ? ').replace(',', ' , ').replace('.', ' . ').split()}
+    installed = {}
+    for seed, pair in enumerate(pairs):
+        installed[pair] = build_tiny_translator(vocabulary, **{'seed': seed, **options})
+        translator_model.loaded_models.put(pair, installed[pair])
+    return installed
\ No newline at end of file
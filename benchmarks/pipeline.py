@@ -0,0 +1,294 @@
+"""
+End-to-end benchmark of the recording → silence removal → recognition →
+translation → storage path, runnable fully offline.
+
+Synthetic WAV fixtures are recognized by the stub recognizer, translated by tiny
+randomly initialized Marian models (or the downloaded Opus-MT weights with
+--pretrained) and saved to a temporary SQLite database. Each stage is first
+timed on its own over every utterance, then the stages are chained per
+utterance as AudioThread does. Reports p50/p95 latency, throughput and peak RSS
+per stage and end to end, writes the results as JSON and compares them with a
+previous run.
+
+Usage:
+    python -m benchmarks.pipeline --utterances 40 --output base.json
+    python -m benchmarks.pipeline --utterances 40 --baseline base.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Sequence
+
+import speech_recognition as sr
+
+from benchmarks.common import current_rss_mb, peak_rss_mb, summarize
+from benchmarks.fixtures import install_tiny_models, write_wav_fixtures
+from src.audio.recognizers import StubRecognizer
+from src.audio.recorder import AudioThread
+from src.database.manager import DatabaseManager
+from src.translator.model import TranslatorModel
+
+
+STAGES = ['remove_silence', 'recognize', 'translate', 'save']
+COMPARED_METRICS = ['p50_ms', 'p95_ms', 'throughput_per_s']
+
+
+def load_wav(path: str) -> sr.AudioData:
+    """
+    Read a WAV file into an AudioData object.
+
+    Args:
+        path: Path of the WAV file
+
+    Returns:
+        AudioData object with the file's samples
+    """
+
+    with wave.open(path, 'rb') as wav_file:
+        return sr.AudioData(wav_file.readframes(wav_file.getnframes()),
+                            wav_file.getframerate(), wav_file.getsampwidth())
+
+
+def run_stage(function: Callable[[Any], Any], inputs: Sequence[Any], latencies: List[float]) -> tuple:
+    """
+    Time a stage over every input and track how much memory it needs.
+
+    Args:
+        function: Stage function applied to each input
+        inputs: Stage inputs
+        latencies: List the per-item latencies in seconds are appended to
+
+    Returns:
+        Tuple of (outputs in input order, megabytes the stage raised the peak RSS by)
+    """
+
+    peak_before = peak_rss_mb()
+    outputs = []
+    for item in inputs:
+        start = time.perf_counter()
+        outputs.append(function(item))
+        latencies.append(time.perf_counter() - start)
+    return outputs, peak_rss_mb() - peak_before
+
+
+def stage_result(latencies: List[float], peak_growth: float) -> Dict[str, float]:
+    """
+    Summarize the latencies of one stage.
+
+    Args:
+        latencies: Per-item latencies in seconds
+        peak_growth: Megabytes the stage raised the peak RSS by
+
+    Returns:
+        Latency summary with throughput in items per second, the peak RSS
+        growth and the process peak RSS once the stage has run
+    """
+
+    result = summarize(latencies)
+    total = sum(latencies)
+    result['throughput_per_s'] = len(latencies) / total if total else 0.0
+    result['peak_rss_growth_mb'] = peak_growth
+    result['peak_rss_mb'] = peak_rss_mb()
+    return result
+
+
+def git_revision() -> str:
+    """
+    Get the commit the benchmark runs on.
+
+    Returns:
+        Short commit hash with a '+dirty' suffix for uncommitted changes, or
+        'unknown' outside a git checkout
+    """
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=root,
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return revision + ('+dirty' if dirty else '')
+
+
+def run_benchmark(args: argparse.Namespace, workdir: str) -> Dict[str, Any]:
+    """
+    Build the fixtures and run every stage, then the chained pipeline.
+
+    Args:
+        args: Parsed command line arguments
+        workdir: Temporary directory for fixtures and the database
+
+    Returns:
+        Benchmark results
+    """
+
+    fixtures = os.path.join(workdir, "fixtures")
+    paths = write_wav_fixtures(fixtures, args.utterances, args.min_seconds, args.max_seconds,
+                               language=args.source, seed=args.seed)
+    recordings = [load_wav(path) for path in paths]
+    audio_seconds = sum(len(audio.frame_data) / audio.sample_width / audio.sample_rate
+                        for audio in recordings)
+
+    recognizer = StubRecognizer.from_directory(fixtures, default_text=None)
+    audio_thread = AudioThread(backend=recognizer)
+    audio_thread.set_language(args.source)
+    translator_model = TranslatorModel()
+    rss_before_models = current_rss_mb()
+    if args.pretrained:
+        translator_model.load_model(args.source, args.target)
+    else:
+        install_tiny_models(translator_model, [(args.source, args.target)])
+    backend_rss_mb = current_rss_mb() - rss_before_models
+    db_manager = DatabaseManager(os.path.join(workdir, "benchmark.db"), write_behind=args.write_behind)
+
+    def recognize(audio: sr.AudioData) -> str:
+        return recognizer.recognize(audio, audio_thread.language)
+
+    def translate(text: str) -> str:
+        return translator_model.translate(text, args.source, args.target)
+
+    def save(pair: tuple) -> None:
+        db_manager.save_translation(pair[0], pair[1], args.source, args.target)
+
+    # Warm up every stage once so lazy imports and first allocations aren't timed
+    text = recognize(audio_thread.remove_silence(recordings[0]))
+    save((text, translate(text)))
+
+    latencies = {name: [] for name in STAGES}
+    growth = dict.fromkeys(STAGES, 0.0)
+    for _ in range(args.repeats):
+        trimmed, grown = run_stage(audio_thread.remove_silence, recordings, latencies['remove_silence'])
+        growth['remove_silence'] += grown
+        texts, grown = run_stage(recognize, trimmed, latencies['recognize'])
+        growth['recognize'] += grown
+        translations, grown = run_stage(translate, texts, latencies['translate'])
+        growth['translate'] += grown
+        _, grown = run_stage(save, list(zip(texts, translations)), latencies['save'])
+        growth['save'] += grown
+    stages = {name: stage_result(latencies[name], growth[name]) for name in STAGES}
+
+    def chained(audio: sr.AudioData) -> None:
+        text = recognize(audio_thread.remove_silence(audio))
+        save((text, translate(text)))
+
+    end_to_end = []
+    grown = sum(run_stage(chained, recordings, end_to_end)[1] for _ in range(args.repeats))
+    stages['end_to_end'] = stage_result(end_to_end, grown)
+    stages['end_to_end']['realtime_factor'] = sum(end_to_end) / (audio_seconds * args.repeats)
+
+    db_manager.close()
+    return {
+        'metadata': {
+            'revision': git_revision(),
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'device': translator_model.device
+        },
+        'config': vars(args),
+        'audio_seconds': audio_seconds,
+        'backend_rss_mb': backend_rss_mb,
+        'model_bytes': translator_model.get_cache_info()['resident_bytes'],
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': stages
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float,
+            min_delta_ms: float) -> List[tuple]:
+    """
+    Compare stage metrics with a previous run.
+
+    Args:
+        results: Results of this run
+        baseline: Results of the previous run
+        tolerance: Relative change tolerated before flagging a regression
+        min_delta_ms: Latency changes smaller than this are never flagged
+
+    Returns:
+        List of (stage, metric, baseline value, current value, relative change,
+        regressed) tuples
+    """
+
+    rows = []
+    for stage, current in results['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if previous is None:
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = previous.get(metric), current.get(metric)
+            if not before or after is None:
+                continue
+            change = after / before - 1
+            if metric.endswith('_ms'):
+                regressed = change > tolerance and after - before > min_delta_ms
+            else:
+                slower_ms = 1000 / after - 1000 / before if after else float('inf')
+                regressed = change < 1 / (1 + tolerance) - 1 and slower_ms > min_delta_ms
+            rows.append((stage, metric, before, after, change, regressed))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline end-to-end pipeline benchmark")
+    parser.add_argument("--utterances", type=int, default=20, help="synthetic recordings (default: 20)")
+    parser.add_argument("--min-seconds", type=float, default=1.0, help="shortest recording (default: 1)")
+    parser.add_argument("--max-seconds", type=float, default=6.0, help="longest recording (default: 6)")
+    parser.add_argument("--repeats", type=int, default=3, help="passes over the recordings (default: 3)")
+    parser.add_argument("--source", default="italian", help="source language (default: italian)")
+    parser.add_argument("--target", default="english", help="target language (default: english)")
+    parser.add_argument("--pretrained", action="store_true",
+                        help="use the downloaded Opus-MT weights instead of tiny random models")
+    parser.add_argument("--write-behind", action="store_true", help="buffer database writes")
+    parser.add_argument("--seed", type=int, default=0, help="fixture random seed (default: 0)")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="relative slowdown flagged as a regression (default: 0.2)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5,
+                        help="latency changes below this are never flagged (default: 0.5)")
+    args = parser.parse_args()
+    args.source, args.target = args.source.lower(), args.target.lower()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run_benchmark(args, workdir)
+
+    print(f"{args.utterances} utterances x {args.repeats}, {results['audio_seconds']:.1f} s of audio, "
+          f"revision {results['metadata']['revision']}")
+    print(f"{'stage':<16}{'p50 ms':>10}{'p95 ms':>10}{'items/s':>10}{'peak RSS MB':>13}{'growth MB':>11}")
+    for name, stage in results['stages'].items():
+        print(f"{name:<16}{stage['p50_ms']:>10.2f}{stage['p95_ms']:>10.2f}{stage['throughput_per_s']:>10.1f}"
+              f"{stage['peak_rss_mb']:>13.1f}{stage['peak_rss_growth_mb']:>11.1f}")
+    print(f"real-time factor: {results['stages']['end_to_end']['realtime_factor']:.4f}, "
+          f"RSS added by the models and their libraries {results['backend_rss_mb']:.1f} MB")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        print(f"\ncompared with {baseline.get('metadata', {}).get('revision', args.baseline)}")
+        print(f"{'stage':<16}{'metric':<18}{'baseline':>11}{'current':>11}{'change':>9}")
+        for stage, metric, before, after, change, regressed in rows:
+            print(f"{stage:<16}{metric:<18}{before:>11.2f}{after:>11.2f}{change:>+9.0%}"
+                  + ("  REGRESSION" if regressed else ""))
+        if any(row[-1] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
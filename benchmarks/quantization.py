@@ -0,0 +1,150 @@
+"""
+Compare fp32 and int8 dynamically quantized translation models.
+
+Each mode runs in its own process so that load time and resident memory are
+measured independently. Reports per-sentence latency, RSS after loading and
+BLEU-style agreement of the quantized outputs against the fp32 outputs.
+
+Usage:
+    python -m benchmarks.quantization --source italian --target english
+"""
+
+import argparse
+import json
+import multiprocessing
+import time
+from typing import Any, Dict, List
+
+from benchmarks.common import corpus_agreement, current_rss_mb, summarize
+
+
+SENTENCES = {
+    'italian': [
+        "Buongiorno, come stai oggi?",
+        "Il treno per Milano parte alle otto e mezza.",
+        "Vorrei prenotare un tavolo per due persone stasera.",
+        "La riunione è stata rinviata a giovedì prossimo.",
+        "Non riesco a trovare le chiavi della macchina.",
+        "Questo ristorante serve la migliore pizza della città.",
+        "Puoi aiutarmi a tradurre questo documento?",
+        "Il museo è chiuso il lunedì.",
+        "Domani pioverà tutto il giorno nel nord del paese.",
+        "Ho letto un libro molto interessante sulla storia di Roma."
+    ],
+    'english': [
+        "Good morning, how are you today?",
+        "The train to Milan leaves at half past eight.",
+        "I would like to book a table for two tonight.",
+        "The meeting has been postponed to next Thursday.",
+        "I can't find the car keys.",
+        "This restaurant serves the best pizza in town.",
+        "Can you help me translate this document?",
+        "The museum is closed on Mondays.",
+        "Tomorrow it will rain all day in the north of the country.",
+        "I read a very interesting book about the history of Rome."
+    ],
+    'spanish': [
+        "Buenos días, ¿cómo estás hoy?",
+        "El tren a Milán sale a las ocho y media.",
+        "Quisiera reservar una mesa para dos esta noche.",
+        "La reunión se ha aplazado al próximo jueves.",
+        "No encuentro las llaves del coche."
+    ],
+    'french': [
+        "Bonjour, comment vas-tu aujourd'hui ?",
+        "Le train pour Milan part à huit heures et demie.",
+        "Je voudrais réserver une table pour deux ce soir.",
+        "La réunion a été reportée à jeudi prochain.",
+        "Je ne trouve pas les clés de la voiture."
+    ],
+    'german': [
+        "Guten Morgen, wie geht es dir heute?",
+        "Der Zug nach Mailand fährt um halb neun ab.",
+        "Ich möchte heute Abend einen Tisch für zwei reservieren.",
+        "Die Besprechung wurde auf nächsten Donnerstag verschoben.",
+        "Ich kann die Autoschlüssel nicht finden."
+    ]
+}
+
+
+def run_mode(quantize: bool, source_lang: str, target_lang: str,
+             sentences: List[str], repeats: int) -> Dict[str, Any]:
+    """
+    Load a model in the given mode and translate the sentence set.
+
+    Args:
+        quantize: Use the int8 quantized model
+        source_lang: Source language name
+        target_lang: Target language name
+        sentences: Sentences to translate one at a time
+        repeats: Number of timed passes over the sentence set
+
+    Returns:
+        Dictionary with load time, RSS, latency summary and outputs
+    """
+
+    from src.translator.model import TranslatorModel
+
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    model = TranslatorModel(quantize=quantize)
+    translator = model.load_model(source_lang, target_lang)
+    load_seconds = time.perf_counter() - start
+    rss_loaded = current_rss_mb()
+
+    model._generate(translator, sentences[:1], batch_size=1)
+
+    latencies = []
+    outputs = []
+    for _ in range(repeats):
+        outputs = []
+        for sentence in sentences:
+            start = time.perf_counter()
+            outputs.append(model.translate_batch([sentence], source_lang, target_lang)[0])
+            latencies.append(time.perf_counter() - start)
+
+    return {
+        'load_seconds': load_seconds,
+        'model_rss_mb': rss_loaded - rss_before,
+        'rss_mb': current_rss_mb(),
+        'model_bytes': model.get_cache_info()['resident_bytes'],
+        'latency': summarize(latencies),
+        'outputs': outputs
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare fp32 and int8 quantized translation")
+    parser.add_argument("--source", default="italian", help="source language (default: italian)")
+    parser.add_argument("--target", default="english", help="target language (default: english)")
+    parser.add_argument("--repeats", type=int, default=3, help="timed passes over the sentences")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    sentences = SENTENCES[args.source.lower()]
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        for mode, quantize in (('fp32', False), ('int8', True)):
+            results[mode] = pool.apply(run_mode, (quantize, args.source, args.target, sentences, args.repeats))
+
+    agreement = corpus_agreement(results['int8']['outputs'], results['fp32']['outputs'])
+    fp32_p50 = results['fp32']['latency']['p50_ms']
+    int8_p50 = results['int8']['latency']['p50_ms']
+
+    print(f"{'mode':<6}{'load s':>9}{'p50 ms':>10}{'p95 ms':>10}{'model MB':>11}{'RSS MB':>10}")
+    for mode, result in results.items():
+        print(f"{mode:<6}{result['load_seconds']:>9.2f}{result['latency']['p50_ms']:>10.1f}"
+              f"{result['latency']['p95_ms']:>10.1f}{result['model_bytes'] / 2 ** 20:>11.1f}"
+              f"{result['rss_mb']:>10.1f}")
+    print(f"speedup (p50): {fp32_p50 / int8_p50:.2f}x" if int8_p50 else "speedup (p50): n/a")
+    print(f"agreement vs fp32: BLEU {agreement['bleu']:.3f}, exact match {agreement['exact_match']:.0%}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'pair': [args.source, args.target], 'results': results,
+                       'agreement': agreement}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
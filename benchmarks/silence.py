@@ -0,0 +1,136 @@
+"""
+Benchmark silence removal: the original pydub WAV round-trip against the
+vectorized NumPy trimmer, on synthetic speech-like recordings.
+
+Usage:
+    python -m benchmarks.silence --minutes 1 5 10
+"""
+
+import argparse
+import io
+import time
+import wave
+from typing import Callable
+
+import numpy as np
+import speech_recognition as sr
+from pydub import AudioSegment
+from pydub.silence import split_on_silence
+
+from src.audio.silence import remove_silence
+
+
+def synthesize_recording(seconds: float, sample_rate: int = 44100, seed: int = 0) -> sr.AudioData:
+    """
+    Build a recording alternating speech-like bursts with pauses.
+    Bursts are amplitude-modulated noise of 0.3-3 s, pauses last 0.1-1.5 s
+    and carry a low noise floor, so both short and long silences occur.
+
+    Args:
+        seconds: Length of the recording in seconds
+        sample_rate: Sample rate in Hz (default: 44100)
+        seed: Random seed (default: 0)
+
+    Returns:
+        AudioData object with 16-bit mono samples
+    """
+
+    rng = np.random.default_rng(seed)
+    total = int(seconds * sample_rate)
+    samples = (rng.standard_normal(total) * 30).astype(np.float32)
+
+    position = 0
+    while position < total:
+        pause = int(rng.uniform(0.1, 1.5) * sample_rate)
+        burst = int(rng.uniform(0.3, 3.0) * sample_rate)
+        start = min(position + pause, total)
+        end = min(start + burst, total)
+        envelope = np.abs(np.sin(np.linspace(0, np.pi * rng.integers(2, 8), end - start)))
+        samples[start:end] += rng.standard_normal(end - start) * 6000 * envelope
+        position = end
+
+    samples = np.clip(samples, -32768, 32767).astype(np.int16)
+    return sr.AudioData(samples.tobytes(), sample_rate, 2)
+
+
+def pydub_remove_silence(audio: sr.AudioData) -> sr.AudioData:
+    """
+    Reference implementation: the previous pydub-based silence removal.
+
+    Args:
+        audio: AudioData object containing the recorded audio
+
+    Returns:
+        AudioData object with silence removed
+    """
+
+    wav_io = io.BytesIO(audio.get_wav_data())
+    with wave.open(wav_io, 'rb') as wav_file:
+        params = wav_file.getparams()
+        frames = wav_file.readframes(wav_file.getnframes())
+        audio_segment = AudioSegment(
+            data=frames,
+            sample_width=params.sampwidth,
+            frame_rate=params.framerate,
+            channels=params.nchannels
+        )
+    chunks = split_on_silence(audio_segment, min_silence_len=500, silence_thresh=-40)
+    output_audio = sum(chunks, AudioSegment.silent(duration=1000))
+    wav_io = io.BytesIO()
+    output_audio.export(wav_io, format="wav")
+    wav_io.seek(0)
+    with wave.open(wav_io, 'rb') as wav_file:
+        frames = wav_file.readframes(wav_file.getnframes())
+        return sr.AudioData(frames, wav_file.getframerate(), wav_file.getsampwidth())
+
+
+def time_call(function: Callable[[sr.AudioData], sr.AudioData], audio: sr.AudioData,
+              repeats: int) -> tuple:
+    """
+    Time the fastest of several calls.
+
+    Args:
+        function: Silence removal function
+        audio: Input audio
+        repeats: Number of calls
+
+    Returns:
+        Tuple of (best time in seconds, output audio)
+    """
+
+    best = float('inf')
+    output = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = function(audio)
+        best = min(best, time.perf_counter() - start)
+    return best, output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark silence removal")
+    parser.add_argument("--minutes", type=float, nargs="+", default=[1, 5],
+                        help="recording lengths in minutes (default: 1 5)")
+    parser.add_argument("--repeats", type=int, default=3, help="calls per implementation")
+    parser.add_argument("--skip-pydub", action="store_true",
+                        help="only time the NumPy implementation (pydub is slow on long inputs)")
+    args = parser.parse_args()
+
+    print(f"{'minutes':>8}{'pydub s':>10}{'numpy s':>10}{'speedup':>9}{'kept s (pydub/numpy)':>24}")
+    for minutes in args.minutes:
+        audio = synthesize_recording(minutes * 60)
+        numpy_time, numpy_out = time_call(remove_silence, audio, args.repeats)
+        numpy_kept = len(numpy_out.frame_data) / 2 / audio.sample_rate
+
+        if args.skip_pydub:
+            print(f"{minutes:>8g}{'-':>10}{numpy_time:>10.3f}{'-':>9}{numpy_kept:>24.1f}")
+            continue
+
+        pydub_time, pydub_out = time_call(pydub_remove_silence, audio, 1)
+        pydub_kept = len(pydub_out.frame_data) / 2 / audio.sample_rate
+        print(f"{minutes:>8g}{pydub_time:>10.3f}{numpy_time:>10.3f}{pydub_time / numpy_time:>8.0f}x"
+              f"{f'{pydub_kept:.1f}/{numpy_kept:.1f}':>24}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Profile application start-up: per-module import times (from `python -X importtime`)
+and the wall-clock time until the main window is shown.
+
+Usage:
+    python -m benchmarks.startup --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["torch", "transformers", "speech_recognition", "pydub", "PyQt6.QtCharts"]
+
+SHOW_WINDOW = """
+import sys, time
+started = time.perf_counter()
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv[:1])
+from src.gui.main_window import TranslatorApp
+window = TranslatorApp(asr_backend="stub")
+window.show()
+loaded = [name for name in {heavy!r} if name in sys.modules]
+app.processEvents()
+shown = time.perf_counter() - started
+print(f"shown {{shown}} " + " ".join(loaded))
+window.close()
+"""
+
+
+def profile_imports(module: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Import a module in a fresh interpreter under -X importtime.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        List of (module, nesting depth, self microseconds, cumulative microseconds)
+    """
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def time_to_window(env: dict) -> Tuple[float, float, List[str]]:
+    """
+    Launch the main window offscreen in a fresh interpreter.
+
+    Args:
+        env: Environment of the child process
+
+    Returns:
+        Tuple of (process wall time in seconds, which includes the background
+        imports finishing before exit, in-process time to show in seconds,
+        and heavy modules already imported when the window was shown)
+    """
+
+    with tempfile.TemporaryDirectory() as workdir:
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", SHOW_WINDOW.format(heavy=HEAVY_MODULES)],
+                                cwd=workdir, env=env, capture_output=True, text=True, check=True)
+        wall = time.perf_counter() - started
+    line = next(line for line in result.stdout.splitlines() if line.startswith("shown "))
+    shown, *loaded = line.split()[1:]
+    return wall, float(shown), loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile start-up time")
+    parser.add_argument("--module", default="src.gui.main_window", help="module whose imports are profiled")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest packages listed")
+    parser.add_argument("--repeats", type=int, default=3, help="window launches to time")
+    args = parser.parse_args()
+
+    entries = profile_imports(args.module)
+    total = sum(self_us for _, _, self_us, _ in entries)
+    packages = {}
+    for name, _, self_us, _ in entries:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    print(f"import {args.module}: {total / 1e6:.3f} s across {len(entries)} modules")
+    print(f"{'package':<28}{'self ms':>10}")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{package:<28}{self_us / 1000:>10.1f}")
+    imported = {name for name, _, _, _ in entries}
+    print("heavy modules imported: " + (", ".join(name for name in HEAVY_MODULES if name in imported) or "none"))
+
+    env = dict(os.environ, PYTHONPATH=ROOT, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    print(f"\n{'run':>4}{'process s':>11}{'to show s':>11}  heavy modules loaded at show")
+    for run in range(1, args.repeats + 1):
+        wall, shown, loaded = time_to_window(env)
+        print(f"{run:>4}{wall:>11.3f}{shown:>11.3f}  {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
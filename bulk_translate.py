@@ -0,0 +1,67 @@
+import argparse
+import sys
+from src.translator.bulk import FORMATS, BulkTranslator, RecordFormat, detect_format, route_cache_size
+from src.translator.memory import TranslationMemory
+from src.translator.model import TranslatorModel
+from src.translator.parallel import ParallelTranslator
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Translate text, JSONL or CSV files without the GUI")
+    parser.add_argument("input", help="input file, or - for standard input")
+    parser.add_argument("-o", "--output", default="-", help="output file, or - for standard output (default: -)")
+    parser.add_argument("-s", "--source", required=True, help="source language, e.g. italian")
+    parser.add_argument("-t", "--target", required=True, help="target language, e.g. english")
+    parser.add_argument("--format", choices=FORMATS,
+                        help="record format (default: inferred from the file extension, else txt)")
+    parser.add_argument("--field", default="text", help="JSONL key or CSV column to translate (default: text)")
+    parser.add_argument("--output-field", default="translation",
+                        help="JSONL key or CSV column for the translation (default: translation)")
+    parser.add_argument("--chunk-size", type=int, default=256,
+                        help="records translated and written together (default: 256)")
+    parser.add_argument("--batch-size", type=int, default=32, help="sentences per forward pass (default: 32)")
+    parser.add_argument("--no-resume", action="store_true", help="overwrite the output instead of resuming")
+    parser.add_argument("--quantize", action="store_true", help="run int8 quantized models on the CPU")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="translate in this many processes, each with its own model (default: 1)")
+    parser.add_argument("--threads-per-worker", type=int,
+                        help="CPU threads per worker process (default: CPU count divided by workers)")
+    return parser.parse_args()
+
+def report(stats):
+    print(f"\r{stats['records']} records, {stats['records_per_second']:.1f} records/s",
+          end="", file=sys.stderr, flush=True)
+
+def main():
+    args = parse_args()
+    path = args.input if args.input != "-" else args.output
+    record_format = RecordFormat(args.format or detect_format(path), field=args.field,
+                                 output_field=args.output_field)
+
+    source_lang, target_lang = args.source.lower(), args.target.lower()
+    max_models = route_cache_size(source_lang, target_lang)
+    if args.workers > 1:
+        translator_model = ParallelTranslator(workers=args.workers, threads_per_worker=args.threads_per_worker,
+                                              max_models=max_models, quantize=args.quantize)
+    else:
+        translator_model = TranslatorModel(memory=TranslationMemory(), max_models=max_models, quantize=args.quantize)
+    bulk = BulkTranslator(translator_model, source_lang, target_lang,
+                          chunk_size=args.chunk_size, batch_size=args.batch_size)
+    try:
+        stats = bulk.translate_file(args.input, args.output, record_format,
+                                    resume=not args.no_resume, progress=report)
+    except KeyboardInterrupt:
+        print("\nInterrupted; run again with the same output to resume.", file=sys.stderr)
+        sys.exit(130)
+    except ValueError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        translator_model.shutdown()
+
+    if stats['skipped']:
+        print(f"\nResumed after {stats['skipped']} records already translated", end="", file=sys.stderr)
+    print(f"\nTranslated {stats['records']} records in {stats['seconds']:.1f} s "
+          f"({stats['records_per_second']:.1f} records/s)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,11 +1,6 @@
 import speech_recognition as sr
-from transformers import pipeline, AutoModelForSeq2SeqLM, AutoTokenizer
-import torch
-import wave
-import io
-from pydub import AudioSegment
-from pydub.silence import split_on_silence
-import numpy as np
+from src.audio.silence import remove_silence
+from src.translator.model import TranslatorModel
 
 def record_audio():
     recognizer = sr.Recognizer()
@@ -25,39 +20,10 @@ def speech_to_text(audio):
     except sr.RequestError:
         print("Errore nel servizio di riconosciemento vocale")
 
-def remove_silence(audio):
-    wav_io = io.BytesIO(audio.get_wav_data())
-    with wave.open(wav_io, 'rb') as wav_file:
-        params = wav_file.getparams()
-        frames = wav_file.readframes(wav_file.getnframes())
-    
-    audio_segment = AudioSegment(
-        data=frames,
-        sample_width=params.sampwidth,
-        frame_rate=params.framerate,
-        channels=params.nchannels
-    )
-    
-    chunks = split_on_silence(audio_segment, min_silence_len=500, silence_thresh=-40)
-    output_audio = sum(chunks, AudioSegment.silent(duration=1000))
-    wav_io = io.BytesIO()
-    output_audio.export(wav_io, format="wav")
-    wav_io.seek(0)
-    with wave.open(wav_io, 'rb') as wav_file:
-        frames = wav_file.readframes(wav_file.getnframes())
-        sample_rate = wav_file.getframerate()
-        sample_width = wav_file.getsampwidth()
-    
-    return sr.AudioData(frames, sample_rate, sample_width)
+translator_model = TranslatorModel(max_models=1)
 
 def translate_text(text):
-
-    device = "cuda" if torch.cuda.is_available() else "cpu"
-    model = AutoModelForSeq2SeqLM.from_pretrained("Helsinki-NLP/opus-mt-it-en").to(device)
-    tokenizer = AutoTokenizer.from_pretrained("Helsinki-NLP/opus-mt-it-en")
-    translator = pipeline("translation", model = model, tokenizer=tokenizer, device=0 if device == "cuda" else -1)
-    translation = translator(text)[0]["translation_text"]
-    return translation
+    return translator_model.translate_batch([text], "italian", "english")[0]
 
 def main():
     while True:
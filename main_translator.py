@@ -1,10 +1,36 @@
+import argparse
+import os
 import sys
 from PyQt6.QtWidgets import QApplication
+from src.audio.recognizers import RECOGNIZER_BACKENDS
 from src.gui.main_window import TranslatorApp
+from src.monitoring.metrics import METRICS
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Voice Translator")
+    parser.add_argument("--preload", action="store_true",
+                        help="load the models for the selected source language in the background")
+    parser.add_argument("--asr", choices=sorted(RECOGNIZER_BACKENDS),
+                        default=os.environ.get("VOICE_TRANSLATOR_ASR", "google"),
+                        help="speech recognition backend (default: $VOICE_TRANSLATOR_ASR or google)")
+    parser.add_argument("--capture-rate", type=int, default=44100,
+                        help="microphone sample rate in Hz (default: 44100)")
+    parser.add_argument("--sample-rate", type=int, default=16000,
+                        help="rate audio is resampled to for recognition, in Hz (default: 16000)")
+    parser.add_argument("--stream-tokens", action="store_true",
+                        help="stream translations token by token with faster, lower quality greedy decoding")
+    parser.add_argument("--metrics", action="store_true",
+                        help="time the hot paths and show them in the status bar (or set VOICE_TRANSLATOR_METRICS=1)")
+    return parser.parse_known_args()
 
 def main():
-    app = QApplication(sys.argv)
-    window = TranslatorApp()
+    args, qt_args = parse_args()
+    if args.metrics:
+        METRICS.enable()
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = TranslatorApp(preload=args.preload, asr_backend=args.asr,
+                           capture_rate=args.capture_rate, sample_rate=args.sample_rate,
+                           stream_tokens=args.stream_tokens)
     window.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,114 @@
+import threading
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+
+class NoiseCalibration:
+    """
+    Cached ambient-noise energy threshold shared across recordings.
+
+    A full calibration records ambient noise for about a second before the user
+    can speak, so its result is kept and reused while it is fresh. Frames known
+    to be silent (pauses between utterances, the wait before speech in
+    Recognizer.listen) keep refining the threshold and its age, using the same
+    asymmetric weighted average as speech_recognition's dynamic energy
+    threshold. Only once no silence has been observed for max_age seconds is
+    a new full calibration needed.
+    """
+
+    def __init__(self, max_age: float = 300.0, damping: float = 0.15, ratio: float = 1.5,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize an empty calibration.
+
+        Args:
+            max_age: Seconds a threshold stays valid without new silent frames (default: 300)
+            damping: Weight of the previous threshold after one second of silence (default: 0.15,
+                speech_recognition's dynamic_energy_adjustment_damping)
+            ratio: Threshold as a multiple of the ambient energy (default: 1.5,
+                speech_recognition's dynamic_energy_ratio)
+            clock: Monotonic clock in seconds (default: time.monotonic)
+        """
+
+        self.max_age = max_age
+        self.damping = damping
+        self.ratio = ratio
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.threshold: Optional[float] = None
+        self.updated_at = 0.0
+
+    def is_fresh(self) -> bool:
+        """
+        Check whether the cached threshold can be used without recalibrating.
+
+        Returns:
+            True if a threshold exists and was updated less than max_age seconds ago
+        """
+
+        with self.lock:
+            return self.threshold is not None and self.clock() - self.updated_at < self.max_age
+
+    def get_threshold(self) -> Optional[float]:
+        """
+        Get the cached threshold, fresh or not.
+
+        Returns:
+            Energy threshold in int16 RMS units, or None before the first calibration
+        """
+
+        with self.lock:
+            return self.threshold
+
+    def set_threshold(self, threshold: float) -> None:
+        """
+        Store the result of a calibration.
+
+        Args:
+            threshold: Energy threshold in int16 RMS units
+        """
+
+        with self.lock:
+            self.threshold = float(threshold)
+            self.updated_at = self.clock()
+
+    def observe_silence(self, samples: np.ndarray, sample_rate: int) -> Optional[float]:
+        """
+        Refine the threshold with samples known to contain no speech.
+        Samples louder than the current threshold are ignored, as
+        speech_recognition stops adapting once the energy exceeds it, so a
+        sudden noise cannot raise the threshold above speech.
+
+        Args:
+            samples: Mono int16 samples of ambient noise
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            The current threshold, or None if there is no calibration to refine
+        """
+
+        if len(samples) == 0:
+            return self.get_threshold()
+        values = samples.astype(np.float32)
+        energy = float(np.sqrt(np.dot(values, values) / len(values)))
+        damping = self.damping ** (len(samples) / sample_rate)
+
+        with self.lock:
+            if self.threshold is None:
+                return None
+            if energy > self.threshold:
+                return self.threshold
+            self.threshold = self.threshold * damping + energy * self.ratio * (1 - damping)
+            self.updated_at = self.clock()
+            return self.threshold
+
+    def invalidate(self) -> None:
+        """
+        Force a full calibration before the next recording, e.g. after the
+        input device changed.
+        """
+
+        with self.lock:
+            self.threshold = None
\ No newline at end of file
@@ -0,0 +1,238 @@
+import hashlib
+import os
+import time
+import wave
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Type
+
+import speech_recognition as sr
+
+from .silence import remove_silence
+
+
+class RecognizerBackend(ABC):
+    """
+    Interface of a speech recognition engine used by AudioThread.
+    Implementations raise sr.UnknownValueError when no speech is understood
+    and sr.RequestError when the engine itself fails.
+    """
+
+    @abstractmethod
+    def recognize(self, audio: sr.AudioData, language: str) -> str:
+        """
+        Transcribe recorded audio.
+
+        Args:
+            audio: AudioData object containing the recorded audio
+            language: Recognition language code (e.g. 'it-IT')
+
+        Returns:
+            Transcribed text
+        """
+
+
+class GoogleRecognizer(RecognizerBackend):
+    """
+    Recognizer backed by the Google Web Speech API (requires network access).
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the Google recognizer.
+        """
+
+        self.recognizer = sr.Recognizer()
+
+    def recognize(self, audio: sr.AudioData, language: str) -> str:
+        """
+        Transcribe audio with the Google Web Speech API.
+
+        Args:
+            audio: AudioData object containing the recorded audio
+            language: Recognition language code (e.g. 'it-IT')
+
+        Returns:
+            Transcribed text
+        """
+
+        return self.recognizer.recognize_google(audio, language=language)
+
+
+class WhisperRecognizer(RecognizerBackend):
+    """
+    Local recognizer running an OpenAI Whisper model on this machine.
+    Requires the optional openai-whisper package; the model is loaded on first use
+    and kept in memory for later utterances.
+    """
+
+    def __init__(self, model: str = "base") -> None:
+        """
+        Initialize the Whisper recognizer.
+
+        Args:
+            model: Whisper model size, e.g. 'tiny', 'base', 'small' (default: 'base')
+        """
+
+        self.recognizer = sr.Recognizer()
+        self.model = model
+
+    def recognize(self, audio: sr.AudioData, language: str) -> str:
+        """
+        Transcribe audio with a local Whisper model.
+
+        Args:
+            audio: AudioData object containing the recorded audio
+            language: Recognition language code (e.g. 'it-IT')
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            sr.UnknownValueError: If the transcription is empty
+            sr.RequestError: If openai-whisper is not installed
+        """
+
+        try:
+            text = self.recognizer.recognize_whisper(audio, model=self.model,
+                                                     language=language.split('-')[0])
+        except ImportError as e:
+            raise sr.RequestError(f"Whisper backend unavailable: {str(e)}")
+        text = text.strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+class StubRecognizer(RecognizerBackend):
+    """
+    Deterministic offline recognizer for tests and benchmarks.
+    Audio registered as a fixture is mapped back to its transcript by content
+    hash, both as recorded and after silence removal; any other audio gets a
+    generated transcript describing its duration, or is rejected.
+    """
+
+    def __init__(self, fixtures: Optional[Dict[str, str]] = None, default_text: Optional[str] = "utterance",
+                 latency: float = 0.0) -> None:
+        """
+        Initialize the stub recognizer.
+
+        Args:
+            fixtures: Mapping of audio content hash to transcript (optional)
+            default_text: Prefix of transcripts for unknown audio, or None to raise
+                sr.UnknownValueError instead (default: 'utterance')
+            latency: Seconds to sleep per call, to simulate a real engine (default: 0)
+        """
+
+        self.fixtures = dict(fixtures or {})
+        self.default_text = default_text
+        self.latency = latency
+        self.calls = 0
+
+    @staticmethod
+    def audio_key(audio: sr.AudioData) -> str:
+        """
+        Compute the content hash identifying an audio fixture.
+
+        Args:
+            audio: AudioData object
+
+        Returns:
+            Hex digest of the sample rate, sample width and raw samples
+        """
+
+        digest = hashlib.sha256(f"{audio.sample_rate}:{audio.sample_width}:".encode())
+        digest.update(audio.frame_data)
+        return digest.hexdigest()
+
+    def register(self, audio: sr.AudioData, text: str) -> None:
+        """
+        Register an audio fixture and its transcript.
+
+        Args:
+            audio: AudioData object of the fixture
+            text: Transcript returned for this audio
+        """
+
+        self.fixtures[self.audio_key(audio)] = text
+        self.fixtures[self.audio_key(remove_silence(audio))] = text
+
+    @classmethod
+    def from_directory(cls, path: str, **kwargs) -> 'StubRecognizer':
+        """
+        Build a stub recognizer from a directory of WAV fixtures, each with a
+        transcript in a .txt file of the same name.
+
+        Args:
+            path: Directory containing name.wav / name.txt pairs
+            **kwargs: Extra arguments for the constructor
+
+        Returns:
+            Stub recognizer with every fixture registered
+        """
+
+        recognizer = cls(**kwargs)
+        for name in sorted(os.listdir(path)):
+            base, extension = os.path.splitext(name)
+            transcript = os.path.join(path, base + ".txt")
+            if extension.lower() != ".wav" or not os.path.exists(transcript):
+                continue
+            with wave.open(os.path.join(path, name), 'rb') as wav_file:
+                audio = sr.AudioData(wav_file.readframes(wav_file.getnframes()),
+                                     wav_file.getframerate(), wav_file.getsampwidth())
+            with open(transcript, encoding='utf-8') as f:
+                recognizer.register(audio, f.read().strip())
+        return recognizer
+
+    def recognize(self, audio: sr.AudioData, language: str) -> str:
+        """
+        Return the transcript of a registered fixture.
+
+        Args:
+            audio: AudioData object containing the recorded audio
+            language: Recognition language code (ignored)
+
+        Returns:
+            Fixture transcript, or a generated transcript for unknown audio
+
+        Raises:
+            sr.UnknownValueError: If the audio is unknown and default_text is None
+        """
+
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        text = self.fixtures.get(self.audio_key(audio))
+        if text is not None:
+            return text
+        if self.default_text is None:
+            raise sr.UnknownValueError()
+        duration = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        return f"{self.default_text} {duration:.2f}s"
+
+
+RECOGNIZER_BACKENDS: Dict[str, Type[RecognizerBackend]] = {
+    'google': GoogleRecognizer,
+    'whisper': WhisperRecognizer,
+    'stub': StubRecognizer
+}
+
+
+def create_recognizer(name: str, **options) -> RecognizerBackend:
+    """
+    Create a recognizer backend by name.
+
+    Args:
+        name: Backend name, one of RECOGNIZER_BACKENDS
+        **options: Backend specific constructor arguments
+
+    Returns:
+        Recognizer backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+
+    if name.lower() not in RECOGNIZER_BACKENDS:
+        raise ValueError(f"Unknown recognizer backend: {name}")
+    return RECOGNIZER_BACKENDS[name.lower()](**options)
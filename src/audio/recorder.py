@@ -1,34 +1,72 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 import speech_recognition as sr
-from pydub import AudioSegment
-from pydub.silence import split_on_silence
-import io
-import wave
 import numpy as np
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from src.monitoring.metrics import METRICS
+from .calibration import NoiseCalibration
+from .recognizers import RecognizerBackend, create_recognizer
+from .resample import PolyphaseResampler, resample
+from .silence import remove_silence
+from .vad import UtteranceSegmenter, VoiceActivityDetector
 
 
 class AudioThread(QThread):
     """
     A QThread subclass that handles real-time audio recording and speech recognition.
     Supports multiple languages and emits signals for detected text and audio data.
+    In continuous mode the microphone stays open and every utterance detected by
+    the voice activity detector is recognized as soon as it ends, and every
+    chunk read from the microphone is emitted for live visualization.
+
+    Audio is captured at capture_rate and converted once, right after capture,
+    to mono 16-bit samples at sample_rate, the rate speech recognizers work at,
+    so silence removal, recognition and uploads handle less data.
+
+    The microphone stream is opened once and only stopped between recordings,
+    and the ambient-noise calibration is cached and kept up to date from
+    silent frames, so a new recording can start without the one-second
+    calibration pause.
     """
     textDetected = pyqtSignal(str)
     audioDataReady = pyqtSignal(np.ndarray)
+    audioFrameReady = pyqtSignal(np.ndarray)
     
-    def __init__(self, parent: Optional[QThread] = None, language: str = 'it-IT') -> None:
+    def __init__(self, parent: Optional[QThread] = None, language: str = 'it-IT',
+                 continuous: bool = False, backend: Optional[RecognizerBackend] = None,
+                 calibration: Optional[NoiseCalibration] = None, keep_stream_open: bool = True,
+                 capture_rate: int = 44100, sample_rate: int = 16000) -> None:
         """
         Initialize the audio thread with specified language settings.
 
         Args:
             parent: Parent QThread object (default: None)
             language: Language code for speech recognition (default: 'it-IT')
+            continuous: Keep recording utterances until stop() is called (default: False)
+            backend: Speech recognition engine (default: Google Web Speech API)
+            calibration: Cached ambient-noise calibration (default: a new one)
+            keep_stream_open: Keep the microphone open between recordings until
+                close_microphone() is called (default: True)
+            capture_rate: Sample rate the microphone is opened at, in Hz (default: 44100)
+            sample_rate: Sample rate of the audio passed on to silence removal,
+                recognition and visualization, in Hz (default: 16000)
         """
 
         super().__init__(parent)
         self.recognizer = sr.Recognizer()
+        self.capture_rate = capture_rate
+        self.sample_rate = sample_rate
+        self.calibration = calibration if calibration is not None else NoiseCalibration()
+        self.calibration_duration = 1.0
+        self.stop_poll_interval = 0.5
+        self.phrase_time_limit = 30.0
+        self.keep_stream_open = keep_stream_open
+        self.microphone = None
+        self.backend = backend if backend is not None else create_recognizer('google')
         self.is_recording = False
         self.language = language
+        self.continuous = continuous
+        self.text_sink = None
         
         self.supported_languages = {
             'italian': 'it-IT',
@@ -54,31 +92,262 @@ class AudioThread(QThread):
         else:
             raise ValueError(f"Language not supported: {language}")
     
+    def set_continuous(self, continuous: bool) -> None:
+        """
+        Enable or disable continuous recording for the next run.
+
+        Args:
+            continuous: Keep recording utterances until stop() is called
+        """
+
+        self.continuous = continuous
+
+    def set_text_sink(self, sink: Optional[Callable[[str], None]]) -> None:
+        """
+        Set a callback that receives every recognized text on the recognition thread,
+        in addition to the textDetected signal. A blocking sink slows recognition
+        down, which lets a downstream bounded queue apply back-pressure.
+
+        Args:
+            sink: Callback receiving recognized text, or None to remove it
+        """
+
+        self.text_sink = sink
+
+    def stop(self) -> None:
+        """
+        Ask a recording to stop: a continuous recording stops after the current
+        audio chunk, a single-shot recording stops waiting for speech to start
+        within stop_poll_interval seconds and recognizes nothing. A phrase already
+        started ends within phrase_time_limit seconds.
+        """
+
+        self.is_recording = False
+
     def run(self) -> None:
         """
         Start audio recording and speech recognition process.
         Emits signals for detected audio data and transcribed text.
         """
 
+        if self.continuous:
+            self.run_continuous()
+            return
+
         self.is_recording = True
-        with sr.Microphone(sample_rate=44100) as source:
+        source = self.open_microphone()
+        try:
             print(f"Speak now in {self.language}...")
-            self.recognizer.adjust_for_ambient_noise(source)
-            audio = self.recognizer.listen(source)
-            
-            wav_data = np.frombuffer(audio.get_wav_data(), dtype=np.int16)
-            self.audioDataReady.emit(wav_data)
-            
-            audio = self.remove_silence(audio)
-            
-            try:
-                text = self.recognizer.recognize_google(audio, language=self.language)
-                self.textDetected.emit(text)
-            except sr.UnknownValueError:
+            self.calibrate(source)
+            threshold = self.recognizer.energy_threshold
+            audio = None
+            with METRICS.span('audio.listen'):
+                # Wait for speech in short slices so that stop() is noticed
+                while audio is None and self.is_recording:
+                    try:
+                        audio = self.recognizer.listen(source, timeout=self.stop_poll_interval,
+                                                       phrase_time_limit=self.phrase_time_limit)
+                    except sr.WaitTimeoutError:
+                        pass
+            # listen() adapts the threshold to the silence before speech starts
+            if self.recognizer.energy_threshold != threshold:
+                self.calibration.set_threshold(self.recognizer.energy_threshold)
+        except OSError:
+            self.close_microphone()
+            raise
+        finally:
+            self.release_microphone()
+
+        if audio is None:
+            return
+        audio = self.convert_audio(audio)
+        samples = np.frombuffer(audio.get_raw_data(), dtype=np.int16)
+        self.audioDataReady.emit(samples)
+        self.recognize(audio)
+
+    def run_continuous(self) -> None:
+        """
+        Keep the microphone open and segment the stream into utterances until
+        stop() is called. Recognition runs on a separate worker so that reading
+        from the microphone never stalls while an utterance is being recognized.
+        """
+
+        self.is_recording = True
+        source = self.open_microphone()
+        try:
+            print(f"Speak now in {self.language}...")
+            self.calibrate(source)
+            vad = VoiceActivityDetector(self.sample_rate, energy_threshold=self.recognizer.energy_threshold)
+            segmenter = UtteranceSegmenter(vad)
+            resampler = None
+            if source.SAMPLE_RATE != self.sample_rate:
+                resampler = PolyphaseResampler(source.SAMPLE_RATE, self.sample_rate)
+
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="recognizer") as executor:
+                while self.is_recording:
+                    captured = np.frombuffer(source.stream.read(source.CHUNK), dtype=np.int16)
+                    chunk = captured
+                    if resampler is not None:
+                        with METRICS.span('audio.resample'):
+                            chunk = resampler.process(captured)
+                    self.audioFrameReady.emit(chunk)
+                    for utterance in segmenter.feed(chunk):
+                        executor.submit(self.process_utterance, utterance, self.sample_rate)
+                    if not segmenter.in_speech:
+                        # Calibrate on captured audio, like adjust_for_ambient_noise and listen()
+                        threshold = self.calibration.observe_silence(captured, source.SAMPLE_RATE)
+                        if threshold is not None:
+                            vad.energy_threshold = threshold
+
+                if resampler is not None:
+                    for utterance in segmenter.feed(resampler.flush()):
+                        executor.submit(self.process_utterance, utterance, self.sample_rate)
+                utterance = segmenter.flush()
+                if utterance is not None:
+                    executor.submit(self.process_utterance, utterance, self.sample_rate)
+            self.recognizer.energy_threshold = vad.energy_threshold
+        except OSError:
+            self.close_microphone()
+            raise
+        finally:
+            self.release_microphone()
+
+    def open_microphone(self) -> sr.Microphone:
+        """
+        Start the microphone stream. The device is opened on first use only;
+        later recordings restart the stream kept open by release_microphone(),
+        which skips re-initializing the audio backend.
+
+        Returns:
+            Microphone source with a running stream
+
+        Raises:
+            OSError: If the microphone cannot be opened
+        """
+
+        if self.microphone is not None and self.microphone.SAMPLE_RATE != self.capture_rate:
+            self.close_microphone()
+        if self.microphone is not None:
+            stream = self.microphone.stream.pyaudio_stream
+            if stream.is_stopped():
+                stream.start_stream()
+            return self.microphone
+
+        with METRICS.span('audio.open'):
+            microphone = sr.Microphone(sample_rate=self.capture_rate)
+            microphone.__enter__()
+        if microphone.stream is None:
+            raise OSError("Could not open the microphone")
+        self.microphone = microphone
+        return microphone
+
+    def release_microphone(self) -> None:
+        """
+        Stop the microphone stream after a recording. The stream stays open for
+        the next recording unless keep_stream_open is False; a stopped stream
+        doesn't buffer audio, so the next recording never starts with stale input.
+        """
+
+        if self.microphone is None:
+            return
+        if not self.keep_stream_open:
+            self.close_microphone()
+            return
+        stream = self.microphone.stream.pyaudio_stream
+        if not stream.is_stopped():
+            stream.stop_stream()
+
+    def close_microphone(self) -> None:
+        """
+        Close the microphone stream and release the audio device.
+        Must not be called while the thread is recording.
+        """
+
+        if self.microphone is None:
+            return
+        microphone, self.microphone = self.microphone, None
+        try:
+            microphone.__exit__(None, None, None)
+        except OSError:
+            pass
+
+    def convert_audio(self, audio: sr.AudioData) -> sr.AudioData:
+        """
+        Convert captured audio to mono 16-bit samples at sample_rate.
+
+        Args:
+            audio: AudioData object as captured
+
+        Returns:
+            AudioData object at sample_rate, or the input if it already matches
+        """
+
+        if audio.sample_rate == self.sample_rate and audio.sample_width == 2:
+            return audio
+        with METRICS.span('audio.resample'):
+            samples = np.frombuffer(audio.get_raw_data(convert_width=2), dtype=np.int16)
+            samples = resample(samples, audio.sample_rate, self.sample_rate)
+        return sr.AudioData(samples.tobytes(), self.sample_rate, 2)
+
+    def calibrate(self, source: sr.Microphone) -> None:
+        """
+        Set the recognizer's energy threshold, reusing the cached calibration
+        while it is fresh and recording ambient noise only when it is not.
+
+        Args:
+            source: Microphone source with a running stream
+        """
+
+        if self.calibration.is_fresh():
+            self.recognizer.energy_threshold = self.calibration.get_threshold()
+            METRICS.increment('audio.calibration_cache_hits')
+            return
+
+        with METRICS.span('audio.calibrate'):
+            self.recognizer.adjust_for_ambient_noise(source, duration=self.calibration_duration)
+        self.calibration.set_threshold(self.recognizer.energy_threshold)
+
+    def process_utterance(self, samples: np.ndarray, sample_rate: int) -> None:
+        """
+        Emit and recognize one utterance cut from the continuous stream.
+
+        Args:
+            samples: Mono int16 samples of the utterance
+            sample_rate: Sample rate in Hz
+        """
+
+        self.audioDataReady.emit(samples)
+        self.recognize(sr.AudioData(samples.tobytes(), sample_rate, 2), report_unrecognized=False)
+
+    def recognize(self, audio: sr.AudioData, report_unrecognized: bool = True) -> None:
+        """
+        Remove silence from recorded audio, transcribe it and emit the text.
+
+        Args:
+            audio: AudioData object containing the recorded audio
+            report_unrecognized: Emit a message when no speech is understood, which
+                continuous mode disables so background noise doesn't flood the output
+                (default: True)
+        """
+
+        audio = self.remove_silence(audio)
+        METRICS.increment('audio.utterances')
+        try:
+            if not audio.frame_data:
+                raise sr.UnknownValueError()
+            with METRICS.span('audio.recognize'):
+                text = self.backend.recognize(audio, self.language)
+            self.textDetected.emit(text)
+            if self.text_sink is not None:
+                self.text_sink(text)
+        except sr.UnknownValueError:
+            METRICS.increment('audio.unrecognized')
+            if report_unrecognized:
                 self.textDetected.emit(f"Could not understand the audio in {self.language}")
-            except sr.RequestError:
-                self.textDetected.emit("Error in the voice recognition service")
+        except sr.RequestError:
+            self.textDetected.emit("Error in the voice recognition service")
 
+    @METRICS.timed('audio.remove_silence')
     def remove_silence(self, audio: sr.AudioData) -> sr.AudioData:
         """
         Remove silence from the recorded audio.
@@ -90,23 +359,4 @@ class AudioThread(QThread):
             AudioData object with silence removed
         """
         
-        wav_io = io.BytesIO(audio.get_wav_data())
-        with wave.open(wav_io, 'rb') as wav_file:
-            params = wav_file.getparams()
-            frames = wav_file.readframes(wav_file.getnframes())
-            audio_segment = AudioSegment(
-                data=frames,
-                sample_width=params.sampwidth,
-                frame_rate=params.framerate,
-                channels=params.nchannels
-            )
-            chunks = split_on_silence(audio_segment, min_silence_len=500, silence_thresh=-40)
-            output_audio = sum(chunks, AudioSegment.silent(duration=1000))
-            wav_io = io.BytesIO()
-            output_audio.export(wav_io, format="wav")
-            wav_io.seek(0)
-            with wave.open(wav_io, 'rb') as wav_file:
-                frames = wav_file.readframes(wav_file.getnframes())
-                sample_rate = wav_file.getframerate()
-                sample_width = wav_file.getsampwidth()
-                return sr.AudioData(frames, sample_rate, sample_width)
\ No newline at end of file
+        return remove_silence(audio, min_silence_len=500, silence_thresh=-40)
\ No newline at end of file
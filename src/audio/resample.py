@@ -0,0 +1,176 @@
+from math import gcd
+
+import numpy as np
+
+
+def downmix(samples: np.ndarray, channels: int) -> np.ndarray:
+    """
+    Average interleaved channels into one.
+
+    Args:
+        samples: Interleaved int16 samples
+        channels: Number of interleaved channels
+
+    Returns:
+        Mono int16 samples; trailing samples of an incomplete frame are dropped
+    """
+
+    if channels == 1:
+        return samples
+    frames = len(samples) // channels
+    mixed = samples[:frames * channels].reshape(frames, channels).mean(axis=1)
+    return np.round(mixed).astype(np.int16)
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational-ratio resampler for int16 audio.
+
+    The rate ratio is reduced to up/down; every output sample is the dot product
+    of a few dozen input samples with one phase of a Kaiser-windowed sinc
+    low-pass filter, computed for a whole block of outputs at once with NumPy.
+    The filter cuts off just below the lower Nyquist frequency, so downsampling
+    does not alias. Input can arrive in chunks of any size: the samples still
+    needed by the filter are kept between calls, and the output is identical to
+    resampling the whole signal at once.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int, channels: int = 1,
+                 zero_crossings: int = 16, rolloff: float = 0.95, beta: float = 8.6,
+                 block_size: int = 4096) -> None:
+        """
+        Initialize the resampler and design its filter.
+
+        Args:
+            source_rate: Input sample rate in Hz
+            target_rate: Output sample rate in Hz
+            channels: Interleaved input channels, downmixed to mono first (default: 1)
+            zero_crossings: Sinc zero crossings on each side of the filter; more gives
+                a sharper cutoff at a higher cost (default: 16)
+            rolloff: Cutoff as a fraction of the lower Nyquist frequency (default: 0.95)
+            beta: Kaiser window shape; 8.6 gives about 80 dB stopband attenuation (default: 8.6)
+            block_size: Outputs computed per vectorized step, bounding memory (default: 4096)
+
+        Raises:
+            ValueError: If a rate or the channel count is not positive
+        """
+
+        if source_rate <= 0 or target_rate <= 0 or channels <= 0:
+            raise ValueError("Sample rates and channel count must be positive")
+
+        divisor = gcd(source_rate, target_rate)
+        self.source_rate = source_rate
+        self.target_rate = target_rate
+        self.channels = channels
+        self.up = target_rate // divisor
+        self.down = source_rate // divisor
+        self.block_size = block_size
+
+        cutoff = min(1.0, self.up / self.down) * rolloff
+        half_width = int(np.ceil(zero_crossings / cutoff))
+        self.taps = 2 * half_width
+        self.center = half_width * self.up
+
+        # Phase p, tap j holds the kernel at (p + j * up - center) / up input samples
+        offsets = (np.arange(self.up)[:, None] + np.arange(self.taps)[None, :] * self.up - self.center) / self.up
+        window = np.i0(beta * np.sqrt(np.clip(1 - (offsets / half_width) ** 2, 0, None))) / np.i0(beta)
+        phases = cutoff * np.sinc(cutoff * offsets) * window
+        self.phases = (phases / phases.sum(axis=1, keepdims=True)).astype(np.float32)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget buffered input to start a new, unrelated signal.
+        """
+
+        # Buffer index i holds input sample i + offset - half_width; the filter
+        # looks half_width samples back, which the leading zeros provide
+        self.buffer = np.zeros(self.taps // 2, dtype=np.float32)
+        self.offset = 0
+        self.consumed = 0
+        self.produced = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk of a stream.
+
+        Args:
+            samples: Interleaved int16 input samples
+
+        Returns:
+            Int16 output samples that are fully determined by the input so far
+        """
+
+        samples = downmix(np.asarray(samples), self.channels)
+        self.consumed += len(samples)
+        self.buffer = np.concatenate((self.buffer, samples.astype(np.float32)))
+        # Output n needs input samples up to index (n * down + center) // up
+        last = (self.consumed * self.up - 1 - self.center) // self.down
+        return self._produce(max(last + 1, self.produced))
+
+    def flush(self) -> np.ndarray:
+        """
+        Resample the end of the stream, padding it with silence.
+
+        Returns:
+            The remaining int16 output samples
+        """
+
+        total = -(-self.consumed * self.up // self.down)
+        self.buffer = np.concatenate((self.buffer, np.zeros(self.taps, dtype=np.float32)))
+        output = self._produce(total)
+        self.reset()
+        return output
+
+    def _produce(self, end: int) -> np.ndarray:
+        """
+        Compute outputs up to, excluding, index end and drop input no longer needed.
+
+        Args:
+            end: Index of the first output not computed
+
+        Returns:
+            Int16 output samples
+        """
+
+        blocks = []
+        taps = np.arange(self.taps)
+        for start in range(self.produced, end, self.block_size):
+            n = np.arange(start, min(start + self.block_size, end))
+            position = n * self.down + self.center
+            newest = position // self.up - self.offset + self.taps // 2
+            window = self.buffer[newest[:, None] - taps[None, :]]
+            blocks.append(np.einsum('ij,ij->i', self.phases[position % self.up], window))
+        self.produced = max(self.produced, end)
+
+        oldest = (self.produced * self.down + self.center) // self.up - self.taps + 1
+        keep_from = oldest - self.offset + self.taps // 2
+        if keep_from > 0:
+            self.buffer = self.buffer[keep_from:]
+            self.offset += keep_from
+
+        if not blocks:
+            return np.zeros(0, dtype=np.int16)
+        output = np.concatenate(blocks)
+        return np.clip(np.round(output), -32768, 32767).astype(np.int16)
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int, channels: int = 1) -> np.ndarray:
+    """
+    Resample a complete int16 signal, downmixing it to mono first.
+
+    Args:
+        samples: Interleaved int16 samples
+        source_rate: Input sample rate in Hz
+        target_rate: Output sample rate in Hz
+        channels: Interleaved input channels (default: 1)
+
+    Returns:
+        Mono int16 samples at target_rate
+    """
+
+    if source_rate == target_rate:
+        return downmix(np.asarray(samples), channels)
+    resampler = PolyphaseResampler(source_rate, target_rate, channels)
+    return np.concatenate((resampler.process(samples), resampler.flush()))
\ No newline at end of file
@@ -0,0 +1,120 @@
+import numpy as np
+import speech_recognition as sr
+
+
+def frame_rms(samples: np.ndarray, frame_length: int) -> np.ndarray:
+    """
+    Compute the RMS energy of consecutive, non-overlapping frames in one pass.
+    A trailing partial frame is included.
+
+    Args:
+        samples: Mono int16 samples
+        frame_length: Number of samples per frame
+
+    Returns:
+        Float array with the RMS of each frame
+    """
+
+    n_frames = -(-len(samples) // frame_length)
+    padded = samples
+    if len(samples) % frame_length:
+        padded = np.zeros(n_frames * frame_length, dtype=samples.dtype)
+        padded[:len(samples)] = samples
+    frames = padded.reshape(n_frames, frame_length).astype(np.float32)
+    energy = np.einsum('ij,ij->i', frames, frames)
+    counts = np.full(n_frames, frame_length, dtype=np.float32)
+    if len(samples) % frame_length:
+        counts[-1] = len(samples) % frame_length
+    return np.sqrt(energy / counts)
+
+
+def find_voiced_spans(samples: np.ndarray, sample_rate: int, min_silence_len: int = 500,
+                      silence_thresh: float = -40, keep_silence: int = 100,
+                      frame_ms: int = 10) -> np.ndarray:
+    """
+    Locate the spans of a recording that are not part of a long silence.
+    A silence is a run of frames whose RMS level is below silence_thresh dBFS
+    lasting at least min_silence_len milliseconds; keep_silence milliseconds
+    are preserved on each side of every voiced span.
+
+    Args:
+        samples: Mono int16 samples
+        sample_rate: Sample rate in Hz
+        min_silence_len: Minimum silence length in milliseconds (default: 500)
+        silence_thresh: Silence threshold in dBFS (default: -40)
+        keep_silence: Silence kept around voiced spans in milliseconds (default: 100)
+        frame_ms: Analysis frame length in milliseconds (default: 10)
+
+    Returns:
+        Array of shape (n, 2) with [start, end) sample indices of the spans to keep
+    """
+
+    if len(samples) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    frame_length = max(1, sample_rate * frame_ms // 1000)
+    threshold = 32768 * 10 ** (silence_thresh / 20)
+    silent = frame_rms(samples, frame_length) < threshold
+
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], silent.view(np.int8), [0]))))
+    run_starts, run_ends = edges[::2], edges[1::2]
+    min_frames = max(1, -(-min_silence_len // frame_ms))
+    long_runs = (run_ends - run_starts) >= min_frames
+    keep_frames = keep_silence // frame_ms
+
+    keep = np.ones(len(silent), dtype=bool)
+    for start, end in zip(run_starts[long_runs], run_ends[long_runs]):
+        cut_start = start + keep_frames if start > 0 else start
+        cut_end = end - keep_frames if end < len(silent) else end
+        if cut_start < cut_end:
+            keep[cut_start:cut_end] = False
+
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], keep.view(np.int8), [0]))))
+    spans = edges.reshape(-1, 2) * frame_length
+    return np.minimum(spans, len(samples))
+
+
+def trim_silence(samples: np.ndarray, sample_rate: int, min_silence_len: int = 500,
+                 silence_thresh: float = -40, keep_silence: int = 100) -> np.ndarray:
+    """
+    Remove long silences from a recording.
+    When a single voiced span remains the result is a view of the input buffer;
+    otherwise the spans are joined with a single copy.
+
+    Args:
+        samples: Mono int16 samples
+        sample_rate: Sample rate in Hz
+        min_silence_len: Minimum silence length in milliseconds (default: 500)
+        silence_thresh: Silence threshold in dBFS (default: -40)
+        keep_silence: Silence kept around voiced spans in milliseconds (default: 100)
+
+    Returns:
+        Samples with silences removed (empty if the recording is entirely silent)
+    """
+
+    spans = find_voiced_spans(samples, sample_rate, min_silence_len, silence_thresh, keep_silence)
+    if len(spans) == 1:
+        return samples[spans[0, 0]:spans[0, 1]]
+    return np.concatenate([samples[start:end] for start, end in spans]) if len(spans) else samples[:0]
+
+
+def remove_silence(audio: sr.AudioData, min_silence_len: int = 500,
+                   silence_thresh: float = -40, keep_silence: int = 100) -> sr.AudioData:
+    """
+    Remove long silences from recorded audio without decoding or re-encoding WAV data.
+
+    Args:
+        audio: AudioData object containing the recorded audio
+        min_silence_len: Minimum silence length in milliseconds (default: 500)
+        silence_thresh: Silence threshold in dBFS (default: -40)
+        keep_silence: Silence kept around voiced spans in milliseconds (default: 100)
+
+    Returns:
+        AudioData object with 16-bit samples and silence removed; its frame
+        data is a byte view of the trimmed samples rather than a copy
+    """
+
+    raw = audio.frame_data if audio.sample_width == 2 else audio.get_raw_data(convert_width=2)
+    samples = np.frombuffer(raw, dtype=np.int16)
+    trimmed = trim_silence(samples, audio.sample_rate, min_silence_len, silence_thresh, keep_silence)
+    return sr.AudioData(memoryview(trimmed).cast('B'), audio.sample_rate, 2)
@@ -0,0 +1,213 @@
+import numpy as np
+from typing import List, Optional
+
+
+class VoiceActivityDetector:
+    """
+    Frame-level voice activity detector based on RMS energy and zero-crossing rate.
+    A frame is speech when it is louder than the energy threshold and its
+    zero-crossing rate is below that of broadband noise, or when it is loud
+    enough that the zero-crossing test is skipped (fricatives, sibilants).
+    """
+
+    def __init__(self, sample_rate: int, frame_ms: int = 30, energy_threshold: float = 300,
+                 max_zero_crossing_rate: float = 0.35, loud_factor: float = 3.0) -> None:
+        """
+        Initialize the detector.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            frame_ms: Analysis frame length in milliseconds (default: 30)
+            energy_threshold: Minimum RMS level of speech, in int16 units (default: 300)
+            max_zero_crossing_rate: Maximum fraction of sign changes for speech (default: 0.35)
+            loud_factor: Frames louder than energy_threshold times this are speech
+                regardless of zero-crossing rate (default: 3.0)
+        """
+
+        self.sample_rate = sample_rate
+        self.frame_length = max(1, sample_rate * frame_ms // 1000)
+        self.energy_threshold = energy_threshold
+        self.max_zero_crossing_rate = max_zero_crossing_rate
+        self.loud_factor = loud_factor
+
+    def classify(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Classify a block of frames in one vectorized pass.
+
+        Args:
+            frames: Int16 array of shape (n_frames, frame_length)
+
+        Returns:
+            Boolean array, True for speech frames
+        """
+
+        values = frames.astype(np.float32)
+        rms = np.sqrt(np.einsum('ij,ij->i', values, values) / frames.shape[1])
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / max(1, frames.shape[1] - 1)
+        loud = rms >= self.energy_threshold
+        return (loud & (zcr <= self.max_zero_crossing_rate)) | (rms >= self.energy_threshold * self.loud_factor)
+
+
+class UtteranceSegmenter:
+    """
+    Cuts a continuous stream of samples into utterances.
+    Samples are written into a fixed-size ring buffer; an utterance starts at
+    the first speech frame (plus some pre-roll) and ends after a run of
+    non-speech frames, so memory stays constant however long the stream runs.
+    """
+
+    def __init__(self, vad: VoiceActivityDetector, pre_roll_ms: int = 300, end_silence_ms: int = 700,
+                 min_speech_ms: int = 200, max_utterance_s: float = 30, buffer_s: float = 60) -> None:
+        """
+        Initialize the segmenter.
+
+        Args:
+            vad: Voice activity detector classifying the frames
+            pre_roll_ms: Audio kept before the first speech frame (default: 300)
+            end_silence_ms: Non-speech duration that ends an utterance (default: 700)
+            min_speech_ms: Utterances with less speech than this are dropped (default: 200)
+            max_utterance_s: Utterances longer than this are cut (default: 30)
+            buffer_s: Ring buffer length in seconds, must exceed max_utterance_s (default: 60)
+
+        Raises:
+            ValueError: If the ring buffer cannot hold a maximum-length utterance
+        """
+
+        if buffer_s <= max_utterance_s + pre_roll_ms / 1000:
+            raise ValueError("buffer_s must be longer than max_utterance_s plus the pre-roll")
+
+        rate = vad.sample_rate
+        self.vad = vad
+        self.pre_roll = rate * pre_roll_ms // 1000
+        self.end_silence = rate * end_silence_ms // 1000
+        self.min_speech = rate * min_speech_ms // 1000
+        self.max_utterance = int(rate * max_utterance_s)
+        self.buffer = np.zeros(int(rate * buffer_s), dtype=np.int16)
+        self.pending = np.zeros(0, dtype=np.int16)
+        self.written = 0
+        self.processed = 0
+        self.in_speech = False
+        self.utterance_start = 0
+        self.last_speech_end = 0
+        self.speech_samples = 0
+
+    def feed(self, samples: np.ndarray) -> List[np.ndarray]:
+        """
+        Add samples to the stream and return the utterances they complete.
+
+        Args:
+            samples: Mono int16 samples
+
+        Returns:
+            Completed utterances, in order
+        """
+
+        self._write(samples)
+        if len(self.pending):
+            samples = np.concatenate((self.pending, samples))
+
+        frame_length = self.vad.frame_length
+        n_frames = len(samples) // frame_length
+        self.pending = samples[n_frames * frame_length:].copy()
+        if n_frames == 0:
+            return []
+
+        frames = samples[:n_frames * frame_length].reshape(n_frames, frame_length)
+        utterances = []
+        for is_speech in self.vad.classify(frames):
+            frame_start = self.processed
+            frame_end = frame_start + frame_length
+            self.processed = frame_end
+
+            if is_speech:
+                if not self.in_speech:
+                    self.in_speech = True
+                    self.speech_samples = 0
+                    self.utterance_start = max(frame_start - self.pre_roll, self.written - len(self.buffer), 0)
+                self.speech_samples += frame_length
+                self.last_speech_end = frame_end
+            elif self.in_speech and frame_end - self.last_speech_end >= self.end_silence:
+                utterance = self._finish(frame_end)
+                if utterance is not None:
+                    utterances.append(utterance)
+                continue
+
+            if self.in_speech and frame_end - self.utterance_start >= self.max_utterance:
+                utterance = self._finish(frame_end)
+                if utterance is not None:
+                    utterances.append(utterance)
+                if is_speech:
+                    self.in_speech = True
+                    self.speech_samples = 0
+                    self.utterance_start = frame_end
+                    self.last_speech_end = frame_end
+
+        return utterances
+
+    def flush(self) -> Optional[np.ndarray]:
+        """
+        End the stream, returning the utterance in progress if it has enough speech.
+
+        Returns:
+            The last utterance, or None
+        """
+
+        if not self.in_speech:
+            return None
+        return self._finish(self.processed)
+
+    def _finish(self, end: int) -> Optional[np.ndarray]:
+        """
+        Close the current utterance.
+
+        Args:
+            end: Absolute sample index where the utterance ends
+
+        Returns:
+            Utterance samples, or None if it had too little speech
+        """
+
+        self.in_speech = False
+        if self.speech_samples < self.min_speech:
+            return None
+        return self._read(self.utterance_start, end)
+
+    def _write(self, samples: np.ndarray) -> None:
+        """
+        Append samples to the ring buffer, overwriting the oldest ones.
+
+        Args:
+            samples: Mono int16 samples
+        """
+
+        size = len(self.buffer)
+        if len(samples) > size:
+            self.written += len(samples) - size
+            samples = samples[-size:]
+        start = self.written % size
+        first = min(len(samples), size - start)
+        self.buffer[start:start + first] = samples[:first]
+        self.buffer[:len(samples) - first] = samples[first:]
+        self.written += len(samples)
+
+    def _read(self, start: int, end: int) -> np.ndarray:
+        """
+        Copy a range of absolute sample indices out of the ring buffer.
+
+        Args:
+            start: First absolute sample index
+            end: Absolute sample index after the last one
+
+        Returns:
+            Copy of the samples in the range
+        """
+
+        size = len(self.buffer)
+        start = max(start, self.written - size)
+        first, last = start % size, end % size
+        if end - start <= 0:
+            return np.zeros(0, dtype=np.int16)
+        if first < last:
+            return self.buffer[first:last].copy()
+        return np.concatenate((self.buffer[first:], self.buffer[:last]))
@@ -0,0 +1,117 @@
+import numpy as np
+from typing import Optional
+
+
+def min_max_envelope(samples: np.ndarray, points: int = 1000) -> np.ndarray:
+    """
+    Decimate a buffer to at most `points` buckets, keeping each bucket's minimum
+    and maximum so that short peaks survive the reduction.
+
+    Args:
+        samples: Mono int16 samples of any length
+        points: Maximum number of buckets (default: 1000)
+
+    Returns:
+        Float32 array of shape (buckets, 2) with the minimum and maximum of each
+        bucket, scaled to [-1, 1] by the buffer's peak; all zeros for silence and
+        empty for an empty buffer
+    """
+
+    samples = np.asarray(samples).reshape(-1)
+    buckets = min(points, len(samples))
+    if buckets == 0:
+        return np.zeros((0, 2), dtype=np.float32)
+
+    starts = np.linspace(0, len(samples), buckets, endpoint=False).astype(np.intp)
+    envelope = np.empty((buckets, 2), dtype=np.float32)
+    envelope[:, 0] = np.minimum.reduceat(samples, starts)
+    envelope[:, 1] = np.maximum.reduceat(samples, starts)
+    return normalize_envelope(envelope)
+
+
+def normalize_envelope(envelope: np.ndarray, peak: Optional[float] = None) -> np.ndarray:
+    """
+    Scale an envelope in place to [-1, 1].
+
+    Args:
+        envelope: Float array of (minimum, maximum) pairs
+        peak: Value mapped to 1 (default: the envelope's own absolute peak)
+
+    Returns:
+        The scaled envelope; silence stays at zero instead of dividing by zero
+    """
+
+    if peak is None:
+        peak = float(np.abs(envelope).max()) if envelope.size else 0.0
+    if peak > 0:
+        envelope *= 1.0 / peak
+    return envelope
+
+
+class ScrollingEnvelope:
+    """
+    Min/max envelope of the most recent seconds of a live stream.
+    Frames are reduced into fixed-width buckets as they arrive and stored in
+    a fixed number of slots, so each update costs the same however long the
+    recording has been running.
+    """
+
+    def __init__(self, sample_rate: int, points: int = 1000, window_s: float = 5.0) -> None:
+        """
+        Initialize an empty, silent envelope.
+
+        Args:
+            sample_rate: Sample rate of the stream in Hz
+            points: Number of buckets shown (default: 1000)
+            window_s: Seconds of audio covered by the buckets (default: 5.0)
+        """
+
+        self.points = points
+        self.bucket_length = max(1, int(sample_rate * window_s / points))
+        self.envelope = np.zeros((points, 2), dtype=np.float32)
+        self.pending = np.zeros(0, dtype=np.int16)
+        self.peak = 0.0
+
+    def push(self, samples: np.ndarray) -> None:
+        """
+        Append frames to the stream, scrolling the oldest buckets out.
+
+        Args:
+            samples: Mono int16 samples
+        """
+
+        if len(self.pending):
+            samples = np.concatenate((self.pending, samples))
+        complete = len(samples) // self.bucket_length
+        self.pending = samples[complete * self.bucket_length:].copy()
+        if complete == 0:
+            return
+
+        buckets = samples[:complete * self.bucket_length].reshape(complete, self.bucket_length)
+        if complete >= self.points:
+            buckets = buckets[-self.points:]
+            complete = self.points
+        else:
+            self.envelope[:-complete] = self.envelope[complete:]
+        self.envelope[-complete:, 0] = buckets.min(axis=1)
+        self.envelope[-complete:, 1] = buckets.max(axis=1)
+        self.peak = max(self.peak, float(np.abs(self.envelope[-complete:]).max()))
+
+    def get_envelope(self) -> np.ndarray:
+        """
+        Get the current envelope scaled by the loudest sample seen so far.
+
+        Returns:
+            Float32 array of shape (points, 2) in [-1, 1]
+        """
+
+        return normalize_envelope(self.envelope.copy(), self.peak)
+
+    def reset(self) -> None:
+        """
+        Clear the envelope for a new recording.
+        """
+
+        self.envelope[:] = 0
+        self.pending = np.zeros(0, dtype=np.int16)
+        self.peak = 0.0
\ No newline at end of file
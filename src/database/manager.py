@@ -1,6 +1,14 @@
+import atexit
+import logging
+import re
 import sqlite3
+import threading
 from datetime import datetime
-from typing import List, Optional, Tuple, Union
+from typing import Iterable, List, Optional, Tuple
+from src.monitoring.metrics import METRICS
+from .pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
 
 class DatabaseManager:
     """
@@ -8,16 +16,41 @@ class DatabaseManager:
     Handles database connections, table creation, and CRUD operations.
     """
 
-    def __init__(self, db_name: str = 'translations.db') -> None:
+    def __init__(self, db_name: str = 'translations.db', write_behind: bool = False,
+                 flush_size: int = 100, flush_interval: float = 1.0) -> None:
         """
-        Initialize database connection and ensure required table exists.
+        Initialize the connection pool and ensure required table exists.
+        Queries use a per-thread reader connection and writes a shared writer
+        connection, so the manager can be used from worker threads. The database
+        uses write-ahead logging, so commits append to the log instead of
+        rewriting pages and readers don't block the writer.
+
+        In write-behind mode saved translations are buffered in memory and written
+        in a single transaction once flush_size records are pending, after
+        flush_interval seconds, before any read or delete, and on close.
 
         Args:
             db_name: Name of the SQLite database file (default: 'translations.db')
+            write_behind: Buffer saved translations and write them in batches (default: False)
+            flush_size: Pending records that trigger a flush (default: 100)
+            flush_interval: Maximum seconds a record stays buffered (default: 1.0)
         """
 
-        self.conn = sqlite3.connect(db_name)
+        self.pool = ConnectionPool(db_name)
         self.create_table()
+
+        self.write_behind = write_behind
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.pending = []
+        self.pending_lock = threading.Lock()
+        self.flush_event = threading.Event()
+        self.closed = False
+        self.flush_thread = None
+        if write_behind:
+            self.flush_thread = threading.Thread(target=self._flush_loop, name="db-write-behind", daemon=True)
+            self.flush_thread.start()
+            atexit.register(self.close)
         
     def create_table(self) -> None:
         """
@@ -25,20 +58,111 @@ class DatabaseManager:
         Sets up the schema for storing translation records with timestamps.
         """
 
-        cursor = self.conn.cursor()
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS translations
+                (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                 source_text TEXT,
+                 target_text TEXT,
+                 source_lang TEXT,
+                 target_lang TEXT,
+                 timestamp DATETIME)
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_source_text ON translations(source_text)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_target_text ON translations(target_text)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON translations(timestamp)')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS translation_memory
+                (key TEXT PRIMARY KEY,
+                 source_text TEXT,
+                 target_text TEXT,
+                 source_lang TEXT,
+                 target_lang TEXT,
+                 model_id TEXT,
+                 timestamp DATETIME)
+            ''')
+            self.fts_enabled = self.create_search_index(cursor)
+
+    def create_search_index(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the FTS5 full-text index over translations and the triggers that
+        keep it in sync. Existing rows are indexed when the index is first created
+        or when its triggers were missing. If this SQLite build lacks FTS5 the
+        triggers are removed so inserts keep working, and searches fall back to LIKE.
+
+        Args:
+            cursor: Cursor used to run the schema statements
+
+        Returns:
+            True if full-text search is available
+        """
+
+        triggers = {
+            'translations_fts_insert': '''
+                AFTER INSERT ON translations BEGIN
+                    INSERT INTO translations_fts(rowid, source_text, target_text)
+                    VALUES (new.id, new.source_text, new.target_text);
+                END''',
+            'translations_fts_delete': '''
+                AFTER DELETE ON translations BEGIN
+                    INSERT INTO translations_fts(translations_fts, rowid, source_text, target_text)
+                    VALUES ('delete', old.id, old.source_text, old.target_text);
+                END''',
+            'translations_fts_update': '''
+                AFTER UPDATE ON translations BEGIN
+                    INSERT INTO translations_fts(translations_fts, rowid, source_text, target_text)
+                    VALUES ('delete', old.id, old.source_text, old.target_text);
+                    INSERT INTO translations_fts(rowid, source_text, target_text)
+                    VALUES (new.id, new.source_text, new.target_text);
+                END'''
+        }
+
+        try:
+            cursor.execute('CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(content)')
+            cursor.execute('DROP TABLE temp.fts5_probe')
+        except sqlite3.OperationalError:
+            for name in triggers:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            return False
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger') AND name LIKE 'translations_fts%'")
+        existing = {row[0] for row in cursor.fetchall()}
+
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS translations
-            (id INTEGER PRIMARY KEY AUTOINCREMENT,
-             source_text TEXT,
-             target_text TEXT,
-             source_lang TEXT,
-             target_lang TEXT,
-             timestamp DATETIME)
+            CREATE VIRTUAL TABLE IF NOT EXISTS translations_fts USING fts5(
+                source_text, target_text,
+                content='translations', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2')
         ''')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_source_text ON translations(source_text)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_target_text ON translations(target_text)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON translations(timestamp)')
-        self.conn.commit()
+        for name, body in triggers.items():
+            cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {body}')
+
+        if not existing.issuperset(['translations_fts', *triggers]):
+            cursor.execute("INSERT INTO translations_fts(translations_fts) VALUES ('rebuild')")
+        return True
+
+    @staticmethod
+    def build_match_query(search_text: str) -> Optional[str]:
+        """
+        Turn user input into an FTS5 query. Quoted text is matched as a phrase,
+        other words as prefixes, and all terms must match.
+
+        Args:
+            search_text: Text typed by the user
+
+        Returns:
+            FTS5 MATCH expression, or None if the input has no searchable terms
+        """
+
+        terms = []
+        for phrase, word in re.findall(r'"([^"]*)"|(\S+)', search_text):
+            text = phrase or word
+            if not any(char.isalnum() for char in text):
+                continue
+            quoted = '"' + text.replace('"', '""') + '"'
+            terms.append(quoted if phrase else quoted + '*')
+        return ' '.join(terms) or None
 
     def save_translation(self, source_text: str, target_text: str, 
                        source_lang: str, target_lang: str) -> None:
@@ -52,13 +176,98 @@ class DatabaseManager:
             target_lang: Target language code
         """
 
-        cursor = self.conn.cursor()
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        cursor.execute('''
-            INSERT INTO translations (source_text, target_text, source_lang, target_lang, timestamp)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (source_text, target_text, source_lang, target_lang, timestamp))
-        self.conn.commit()
+        record = (source_text, target_text, source_lang, target_lang, timestamp)
+
+        if self.write_behind:
+            with self.pending_lock:
+                if self.closed:
+                    raise sqlite3.ProgrammingError("Cannot operate on a closed database manager.")
+                self.pending.append(record)
+                should_flush = len(self.pending) >= self.flush_size
+            if should_flush:
+                self.flush()
+            return
+
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO translations (source_text, target_text, source_lang, target_lang, timestamp)
+                VALUES (?, ?, ?, ?, ?)
+            ''', record)
+        METRICS.increment('db.rows_written')
+
+    def save_translations_bulk(self, records: Iterable[Tuple[str, str, str, str]]) -> int:
+        """
+        Save many translation records in a single transaction.
+
+        Args:
+            records: Tuples of (source_text, target_text, source_lang, target_lang)
+
+        Returns:
+            Number of records saved
+        """
+
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return self._insert_many([(*record, timestamp) for record in records])
+
+    def flush(self) -> None:
+        """
+        Write all buffered translations in a single transaction. Without
+        buffered records the writer lock isn't taken, so reads never queue
+        behind other writes just to flush an empty buffer. If the insert
+        fails, the records go back to the front of the buffer for the next flush.
+
+        Raises:
+            sqlite3.Error: If the buffered records could not be written
+        """
+
+        if not self.write_behind:
+            return
+        with self.pending_lock:
+            if not self.pending:
+                return
+        with self.pool.writer_lock:
+            with self.pending_lock:
+                records, self.pending = self.pending, []
+            if records:
+                try:
+                    self._insert_many(records)
+                except sqlite3.Error:
+                    with self.pending_lock:
+                        self.pending[:0] = records
+                    raise
+
+    def _insert_many(self, records: List[Tuple[str, str, str, str, str]]) -> int:
+        """
+        Insert complete translation rows with executemany and one commit.
+
+        Args:
+            records: Tuples of (source_text, target_text, source_lang, target_lang, timestamp)
+
+        Returns:
+            Number of records inserted
+        """
+
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT INTO translations (source_text, target_text, source_lang, target_lang, timestamp)
+                VALUES (?, ?, ?, ?, ?)
+            ''', records)
+        METRICS.increment('db.rows_written', len(records))
+        return len(records)
+
+    def _flush_loop(self) -> None:
+        """
+        Periodically flush buffered translations until the manager is closed.
+        """
+
+        while not self.flush_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error:
+                logger.exception("Write-behind flush failed; the records stay buffered")
 
     def search_translations(self, search_text: Optional[str] = None, 
                          source_lang: Optional[str] = None,
@@ -66,9 +275,12 @@ class DatabaseManager:
                          limit: int = 50) -> List[Tuple[int, str, str, str, str, str]]:
         """
         Search for translations with optional filtering criteria.
+        Text searches use the full-text index when available, ranking results by
+        relevance; otherwise they fall back to a substring scan.
 
         Args:
-            search_text: Text to search in source or target text (optional)
+            search_text: Text to search in source or target text; words match as
+                prefixes and quoted text as a phrase (optional)
             source_lang: Filter by source language (optional)
             target_lang: Filter by target language (optional)
             limit: Maximum number of results to return (default: 50)
@@ -77,18 +289,82 @@ class DatabaseManager:
             List of tuples containing (id, source_text, target_text, source_lang, target_lang, timestamp)
         """
 
-        cursor = self.conn.cursor()
+        self.flush()
+        with self.pool.reader() as conn:
+            cursor = conn.cursor()
+            match_query = self.build_match_query(search_text) if search_text and self.fts_enabled else None
+            params = []
+
+            if match_query:
+                query = '''
+                    SELECT t.id, t.source_text, t.target_text, t.source_lang, t.target_lang, t.timestamp
+                    FROM translations_fts JOIN translations t ON t.id = translations_fts.rowid
+                    WHERE translations_fts MATCH ?
+                '''
+                params.append(match_query)
+            else:
+                query = '''
+                    SELECT id, source_text, target_text, source_lang, target_lang, timestamp 
+                    FROM translations t WHERE 1=1
+                '''
+
+            if search_text and not match_query:
+                query += ''' AND (
+                    source_text LIKE ? OR 
+                    target_text LIKE ?
+                )'''
+                search_pattern = f'%{search_text}%'
+                params.extend([search_pattern, search_pattern])
+
+            if source_lang:
+                query += ' AND t.source_lang = ?'
+                params.append(source_lang.lower())
+
+            if target_lang:
+                query += ' AND t.target_lang = ?'
+                params.append(target_lang.lower())
+
+            query += ' ORDER BY translations_fts.rank, t.timestamp DESC' if match_query else ' ORDER BY timestamp DESC'
+            query += ' LIMIT ?'
+            params.append(limit)
+
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    def fetch_translations_page(self, search_text: Optional[str] = None,
+                                source_lang: Optional[str] = None,
+                                target_lang: Optional[str] = None,
+                                after: Optional[Tuple[str, int]] = None,
+                                limit: int = 200) -> List[Tuple[int, str, str, str, str, str]]:
+        """
+        Fetch one page of translations, newest first, using keyset pagination.
+        Pages are anchored on the (timestamp, id) of the last row already shown,
+        so fetching a page deep into the history costs the same as the first one.
+
+        Args:
+            search_text: Text to search in source or target text (optional)
+            source_lang: Filter by source language (optional)
+            target_lang: Filter by target language (optional)
+            after: (timestamp, id) of the last row of the previous page (optional)
+            limit: Maximum number of rows in the page (default: 200)
+
+        Returns:
+            List of tuples containing (id, source_text, target_text, source_lang, target_lang, timestamp)
+        """
+
+        self.flush()
         query = '''
-            SELECT id, source_text, target_text, source_lang, target_lang, timestamp 
+            SELECT id, source_text, target_text, source_lang, target_lang, timestamp
             FROM translations WHERE 1=1
         '''
         params = []
 
-        if search_text:
-            query += ''' AND (
-                source_text LIKE ? OR 
-                target_text LIKE ?
-            )'''
+        match_query = self.build_match_query(search_text) if search_text and self.fts_enabled else None
+        if match_query:
+            query += ' AND id IN (SELECT rowid FROM translations_fts WHERE translations_fts MATCH ?)'
+            params.append(match_query)
+        elif search_text:
+            query += ' AND (source_text LIKE ? OR target_text LIKE ?)'
             search_pattern = f'%{search_text}%'
             params.extend([search_pattern, search_pattern])
 
@@ -100,11 +376,17 @@ class DatabaseManager:
             query += ' AND target_lang = ?'
             params.append(target_lang.lower())
 
-        query += ' ORDER BY timestamp DESC LIMIT ?'
+        if after is not None:
+            query += ' AND (timestamp, id) < (?, ?)'
+            params.extend(after)
+
+        query += ' ORDER BY timestamp DESC, id DESC LIMIT ?'
         params.append(limit)
 
-        cursor.execute(query, params)
-        return cursor.fetchall()
+        with self.pool.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return cursor.fetchall()
 
     def delete_translation(self, translation_id: int) -> None:
         """
@@ -114,12 +396,92 @@ class DatabaseManager:
             translation_id: ID of the translation record to delete
         """
 
-        cursor = self.conn.cursor()
-        cursor.execute('DELETE FROM translations WHERE id = ?', (translation_id,))
-        self.conn.commit()
+        self.flush()
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM translations WHERE id = ?', (translation_id,))
+
+    def get_memory_entry(self, key: str) -> Optional[str]:
+        """
+        Look up a cached translation in the translation memory table.
+
+        Args:
+            key: Hashed translation memory key
+
+        Returns:
+            Cached translated text, or None if the key is unknown
+        """
+
+        with self.pool.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT target_text FROM translation_memory WHERE key = ?', (key,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+    def save_memory_entry(self, key: str, source_text: str, target_text: str,
+                          source_lang: str, target_lang: str, model_id: str) -> None:
+        """
+        Store a translation in the translation memory table, replacing any
+        previous entry with the same key.
+
+        Args:
+            key: Hashed translation memory key
+            source_text: Normalized original text
+            target_text: Translated text
+            source_lang: Source language name
+            target_lang: Target language name
+            model_id: Identifier of the model that produced the translation
+        """
+
+        self.save_memory_entries([(key, source_text, target_text, source_lang, target_lang, model_id)])
+
+    def save_memory_entries(self, entries: Iterable[Tuple[str, str, str, str, str, str]]) -> int:
+        """
+        Store many translations in the translation memory table with
+        executemany and one commit, replacing previous entries with the same keys.
+
+        Args:
+            entries: Tuples of (key, source_text, target_text, source_lang, target_lang, model_id)
+
+        Returns:
+            Number of entries stored
+        """
+
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(*entry, timestamp) for entry in entries]
+        if not rows:
+            return 0
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT OR REPLACE INTO translation_memory
+                (key, source_text, target_text, source_lang, target_lang, model_id, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+        return len(rows)
+
+    def close(self) -> None:
+        """
+        Stop accepting translations, flush the buffered ones, stop the
+        write-behind thread and close all connections.
+        """
+
+        with self.pending_lock:
+            if self.closed:
+                return
+            self.closed = True
+        if self.write_behind:
+            atexit.unregister(self.close)
+        self.flush_event.set()
+        if self.flush_thread is not None and self.flush_thread is not threading.current_thread():
+            self.flush_thread.join()
+        try:
+            self.flush()
+        finally:
+            self.pool.close()
 
     def __del__(self) -> None:
         """
         Clean up database connection when object is destroyed.
         """
-        self.conn.close()
\ No newline at end of file
+        self.close()
\ No newline at end of file
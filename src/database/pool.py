@@ -0,0 +1,126 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from src.monitoring.metrics import METRICS
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of SQLite connections for one database file.
+    Every thread gets its own reader connection, so queries from the GUI and
+    from worker threads run concurrently under WAL. Writes go through a single
+    writer connection checked out under a lock, which matches SQLite's
+    one-writer-at-a-time model without serializing readers.
+    """
+
+    def __init__(self, db_name: str, timeout: float = 5.0) -> None:
+        """
+        Initialize the pool and open the writer connection.
+
+        Args:
+            db_name: Name of the SQLite database file; ':memory:' databases are
+                served by the writer connection alone, since separate connections
+                would each see a different empty database
+            timeout: Seconds a connection waits for a lock held by another one (default: 5.0)
+        """
+
+        self.db_name = db_name
+        self.timeout = timeout
+        self.in_memory = db_name == ':memory:'
+        self.local = threading.local()
+        self.readers: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self.readers_lock = threading.Lock()
+        self.writer_lock = threading.RLock()
+        self.closed = False
+
+        self.writer_conn = self._connect()
+        self.writer_conn.execute('PRAGMA journal_mode=WAL')
+        self.writer_conn.execute('PRAGMA synchronous=NORMAL')
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a new connection to the database.
+
+        Returns:
+            SQLite connection usable from any thread
+        """
+
+        return sqlite3.connect(self.db_name, timeout=self.timeout, check_same_thread=False)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Check out the writer connection. The transaction is committed when the
+        block exits normally and rolled back if it raises.
+
+        Yields:
+            The writer connection, held exclusively for the duration of the block
+        """
+
+        with self.writer_lock, METRICS.span('db.write'):
+            if self.closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed connection pool.")
+            try:
+                yield self.writer_conn
+                with METRICS.span('db.commit'):
+                    self.writer_conn.commit()
+            except BaseException:
+                self.writer_conn.rollback()
+                raise
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Check out the calling thread's reader connection, opening it on first use.
+
+        Yields:
+            A connection owned by the calling thread
+        """
+
+        if self.in_memory:
+            with self.writer() as conn:
+                yield conn
+            return
+
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            with self.readers_lock:
+                if self.closed:
+                    conn.close()
+                    raise sqlite3.ProgrammingError("Cannot operate on a closed connection pool.")
+                self._prune_readers()
+                self.readers.append((threading.current_thread(), conn))
+            self.local.conn = conn
+        with METRICS.span('db.query'):
+            yield conn
+
+    def _prune_readers(self) -> None:
+        """
+        Close reader connections whose threads have exited.
+        Must be called with readers_lock held.
+        """
+
+        alive = []
+        for thread, conn in self.readers:
+            if thread.is_alive():
+                alive.append((thread, conn))
+            else:
+                conn.close()
+        self.readers = alive
+
+    def close(self) -> None:
+        """
+        Close the writer and every reader connection.
+        """
+
+        with self.writer_lock, self.readers_lock:
+            if self.closed:
+                return
+            self.closed = True
+            for _, conn in self.readers:
+                conn.close()
+            self.readers = []
+            self.writer_conn.close()
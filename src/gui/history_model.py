@@ -0,0 +1,199 @@
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtWidgets import QWidget
+from typing import Any, List, Optional, Tuple
+from src.database.manager import DatabaseManager
+
+class TranslationHistoryModel(QAbstractTableModel):
+    """
+    Table model over the translation history, loaded one page at a time.
+    Rows are fetched newest first with keyset pagination as the view scrolls
+    (canFetchMore/fetchMore), and cell text is produced only for visible cells.
+    """
+
+    HEADERS = ["ID", "Source Text", "Target Text", "Source Lang", "Target Lang", "Timestamp"]
+
+    def __init__(self, db_manager: DatabaseManager, page_size: int = 200,
+                 parent: Optional[QWidget] = None) -> None:
+        """
+        Initialize an empty history model.
+
+        Args:
+            db_manager: Database manager instance for translations
+            page_size: Number of rows fetched per page (default: 200)
+            parent: Parent object (optional)
+        """
+
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.page_size = page_size
+        self.rows: List[Tuple[int, str, str, str, str, str]] = []
+        self.filters = {'search_text': None, 'source_lang': None, 'target_lang': None}
+        self.has_more = True
+
+    def set_filters(self, search_text: Optional[str] = None, source_lang: Optional[str] = None,
+                    target_lang: Optional[str] = None) -> None:
+        """
+        Replace the current filters and reload from the newest translation.
+
+        Args:
+            search_text: Text to search in source or target text (optional)
+            source_lang: Filter by source language (optional)
+            target_lang: Filter by target language (optional)
+        """
+
+        self.beginResetModel()
+        self.filters = {'search_text': search_text or None, 'source_lang': source_lang,
+                        'target_lang': target_lang}
+        self.rows = []
+        self.has_more = True
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Get the number of rows loaded so far.
+
+        Args:
+            parent: Parent index, always the root for a table
+
+        Returns:
+            Number of loaded rows, 0 for any other parent
+        """
+
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Get the number of columns.
+
+        Args:
+            parent: Parent index, always the root for a table
+
+        Returns:
+            Number of headers, 0 for any other parent
+        """
+
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """
+        Format a cell for display.
+
+        Args:
+            index: Cell index
+            role: Requested data role
+
+        Returns:
+            Cell text for the display role, None otherwise
+        """
+
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        value = self.rows[index.row()][index.column()]
+        if index.column() == 5:
+            return value[:16]
+        return str(value)
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """
+        Get the title of a column header.
+
+        Args:
+            section: Column or row number
+            orientation: Header orientation
+            role: Requested data role
+
+        Returns:
+            Column title for horizontal display headers, the default header data otherwise
+        """
+
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """
+        Get the item flags of a cell; cells are selectable but not editable.
+
+        Args:
+            index: Cell index
+
+        Returns:
+            Item flags of the cell
+        """
+
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """
+        Check whether more rows may be loaded.
+
+        Args:
+            parent: Parent index, always the root for a table
+
+        Returns:
+            True if the last fetched page was full
+        """
+
+        return not parent.isValid() and self.has_more
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """
+        Append the next page of rows, continuing after the last loaded row.
+
+        Args:
+            parent: Parent index, always the root for a table
+        """
+
+        if parent.isValid() or not self.has_more:
+            return
+        after = (self.rows[-1][5], self.rows[-1][0]) if self.rows else None
+        page = self.db_manager.fetch_translations_page(after=after, limit=self.page_size, **self.filters)
+        self.has_more = len(page) == self.page_size
+        if not page:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1)
+        self.rows.extend(page)
+        self.endInsertRows()
+
+    def translation_id(self, row: int) -> int:
+        """
+        Get the database id of a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            Translation id
+        """
+
+        return self.rows[row][0]
+
+    def text(self, row: int, column: int) -> str:
+        """
+        Get the unformatted text of a cell.
+
+        Args:
+            row: Row number
+            column: Column index
+
+        Returns:
+            Cell value as a string
+        """
+
+        return str(self.rows[row][column])
+
+    def remove_row(self, row: int) -> None:
+        """
+        Remove a loaded row from the model, without touching the database.
+
+        Args:
+            row: Row number
+        """
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[row]
+        self.endRemoveRows()
\ No newline at end of file
@@ -1,11 +1,10 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, 
-                            QPushButton, QTableWidget, QTableWidgetItem, QLabel,
+                            QPushButton, QTableView, QLabel, QAbstractItemView,
                             QComboBox, QHeaderView, QApplication)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QIcon
-from datetime import datetime
-from typing import Optional, Set
+from PyQt6.QtCore import QTimer
+from typing import Optional
 from src.database.manager import DatabaseManager
+from src.gui.history_model import TranslationHistoryModel
 
 class TranslationHistoryWindow(QDialog):
     """
@@ -59,12 +58,11 @@ class TranslationHistoryWindow(QDialog):
         
         layout.addLayout(search_layout)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Source Text", "Target Text", 
-            "Source Lang", "Target Lang", "Timestamp"
-        ])
+        self.model = TranslationHistoryModel(self.db_manager, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
@@ -98,35 +96,27 @@ class TranslationHistoryWindow(QDialog):
     def load_translations(self) -> None:
         """
         Load and display translations based on current search criteria and filters.
+        Only the first page is fetched here; older rows are loaded as the table scrolls.
         """
         search_text = self.search_input.text()
         source_lang = None if self.source_lang_combo.currentText() == "All Languages" else self.source_lang_combo.currentText()
         target_lang = None if self.target_lang_combo.currentText() == "All Languages" else self.target_lang_combo.currentText()
         
-        results = self.db_manager.search_translations(
+        self.model.set_filters(
             search_text=search_text,
             source_lang=source_lang,
             target_lang=target_lang
         )
-        
-        self.table.setRowCount(len(results))
-        for i, row in enumerate(results):
-            for j, value in enumerate(row):
-                if j == 5: 
-                    value = datetime.strptime(value, '%Y-%m-%d %H:%M:%S').strftime('%Y-%m-%d %H:%M')
-                item = QTableWidgetItem(str(value))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)  
-                self.table.setItem(i, j, item)
     
     def delete_selected(self) -> None:
         """
         Delete selected translation entries from both table and database.
         """
-        selected_rows = set(item.row() for item in self.table.selectedItems())
+        selected_rows = set(index.row() for index in self.table.selectionModel().selectedIndexes())
         for row in sorted(selected_rows, reverse=True):
-            translation_id = int(self.table.item(row, 0).text())
+            translation_id = self.model.translation_id(row)
             self.db_manager.delete_translation(translation_id)
-            self.table.removeRow(row)
+            self.model.remove_row(row)
     
     def copy_text(self, column: int) -> None:
         """
@@ -135,8 +125,8 @@ class TranslationHistoryWindow(QDialog):
         Args:
             column: Column index of the text to copy (1 for source, 2 for target)
         """
-        selected_items = self.table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            text = self.table.item(row, column).text()
+        selected_indexes = self.table.selectionModel().selectedIndexes()
+        if selected_indexes:
+            row = selected_indexes[0].row()
+            text = self.model.text(row, column)
             QApplication.clipboard().setText(text)
\ No newline at end of file
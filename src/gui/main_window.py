@@ -1,28 +1,54 @@
 from PyQt6.QtWidgets import (QMainWindow, QPushButton, QTextEdit, QVBoxLayout, QHBoxLayout, 
-                             QWidget, QLabel, QComboBox, QStatusBar, QFrame)
-from PyQt6.QtGui import QFont, QIcon, QPainter
-from PyQt6.QtCore import Qt
+                             QWidget, QLabel, QComboBox, QCheckBox)
+from PyQt6.QtGui import QFont, QIcon, QPainter, QTextCursor
+from PyQt6.QtCore import QPointF, Qt, QTimer, pyqtSignal
 from PyQt6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
 import numpy as np
+from src.audio.recognizers import create_recognizer
 from src.audio.recorder import AudioThread
+from src.audio.waveform import ScrollingEnvelope, min_max_envelope
+from src.translator.memory import TranslationMemory
 from src.translator.model import TranslatorModel
+from src.translator.worker import TranslationWorker
 from src.database.manager import DatabaseManager
-from typing import Dict, List, Optional
+from src.monitoring.metrics import METRICS
+from src.pipeline.stages import TranslationPipeline
 from .history_window import TranslationHistoryWindow 
 
+STATUS_SPANS = [
+    ('audio.calibrate', 'calibrate'),
+    ('audio.listen', 'listen'),
+    ('audio.recognize', 'recognize'),
+    ('translator.load_model', 'load'),
+    ('translator.generate', 'generate'),
+    ('db.write', 'db')
+]
+
 class TranslatorApp(QMainWindow):
     """
     Main application window for the Voice Translator application.
     Provides UI for voice recording, text translation, and translation history management.
     """
+    pipelineTranslated = pyqtSignal(str, str)
 
-    def __init__(self) -> None:
+    def __init__(self, preload: bool = False, asr_backend: str = 'google',
+                 capture_rate: int = 44100, sample_rate: int = 16000, stream_tokens: bool = False) -> None:
         """
         Initialize the translator application window with all UI components,
         audio processing thread, translation model, and database connection.
+
+        Args:
+            preload: Load the models reachable from the selected source language
+                in the background (default: False)
+            asr_backend: Name of the speech recognition backend (default: 'google')
+            capture_rate: Microphone sample rate in Hz (default: 44100)
+            sample_rate: Rate recorded audio is resampled to for recognition, in Hz (default: 16000)
+            stream_tokens: Stream translations token by token with greedy decoding
+                instead of sentence by sentence with beam search (default: False)
         """
 
         super().__init__()
+        self.preload = preload
         self.setWindowTitle("Vocal Translator")
         self.setGeometry(100, 100, 800, 600)
 
@@ -88,17 +114,39 @@ class TranslatorApp(QMainWindow):
         }
     """)
 
-        self.audio_thread = AudioThread(self)
+        self.audio_thread = AudioThread(self, backend=create_recognizer(asr_backend),
+                                        capture_rate=capture_rate, sample_rate=sample_rate)
         self.audio_thread.textDetected.connect(self.on_text_detected)
         self.audio_thread.audioDataReady.connect(self.update_waveform)
+        self.audio_thread.audioFrameReady.connect(self.on_audio_frame)
+        self.audio_thread.finished.connect(self.on_recording_finished)
 
-        self.translator_model = TranslatorModel()
         self.db_manager = DatabaseManager()
+        self.translation_memory = TranslationMemory(self.db_manager)
+        self.translator_model = TranslatorModel(memory=self.translation_memory, max_models=3)
+
+        self.translation_worker = TranslationWorker(self.translator_model, self, streaming=True,
+                                                    stream_tokens=stream_tokens)
+        self.translation_worker.translationStarted.connect(self.on_translation_started)
+        self.translation_worker.translationChunk.connect(self.on_translation_chunk)
+        self.translation_worker.translationProgress.connect(self.on_translation_progress)
+        self.translation_worker.translationFinished.connect(self.on_translation_finished)
+        self.translation_worker.start()
+        self.current_request_id = None
+
+        self.pipeline = TranslationPipeline(
+            self.translator_model, self.db_manager,
+            on_translated=lambda source, translation, *_: self.pipelineTranslated.emit(source, translation)
+        )
+        self.pipelineTranslated.connect(self.on_pipeline_translated)
 
         self.setup_audio_visualizer()
         self.setup_ui()
 
         self.statusBar().showMessage('Ready')
+        self.setup_metrics_status()
+        # torch and transformers load in the background once the window is on screen
+        QTimer.singleShot(0, self.translator_model.import_backends)
 
     def setup_ui(self) -> None:
         """
@@ -128,10 +176,21 @@ class TranslatorApp(QMainWindow):
         self.layout.addWidget(self.chart_view)
 
         input_layout = QHBoxLayout()
+        record_layout = QVBoxLayout()
         self.record_button = QPushButton("Record")
         self.record_button.setIcon(QIcon("assets/mic_icon.png"))
         self.record_button.clicked.connect(self.start_recording)
-        input_layout.addWidget(self.record_button)
+        record_layout.addWidget(self.record_button)
+
+        self.continuous_checkbox = QCheckBox("Continuous")
+        self.continuous_checkbox.setToolTip("Keep listening and transcribe every utterance until stopped")
+        record_layout.addWidget(self.continuous_checkbox)
+
+        self.pipeline_checkbox = QCheckBox("Auto translate && save")
+        self.pipeline_checkbox.setToolTip("Translate and save every recognized utterance in the background")
+        record_layout.addWidget(self.pipeline_checkbox)
+        record_layout.addStretch()
+        input_layout.addLayout(record_layout)
 
         self.input_text = QTextEdit()
         self.input_text.setPlaceholderText("Input text will appear here...")
@@ -189,6 +248,14 @@ class TranslatorApp(QMainWindow):
         Initialize the audio waveform visualization chart and its components.
         """
 
+        self.waveform_points = 1000
+        self.live_waveform = ScrollingEnvelope(self.audio_thread.sample_rate, self.waveform_points)
+        self.live_waveform_active = False
+        self.live_waveform_dirty = False
+        self.waveform_timer = QTimer(self)
+        self.waveform_timer.setInterval(33)
+        self.waveform_timer.timeout.connect(self.refresh_live_waveform)
+
         self.audio_chart = QChart()
         self.audio_series = QLineSeries()
         
@@ -199,7 +266,7 @@ class TranslatorApp(QMainWindow):
         
         self.axis_x = QValueAxis()
         self.axis_y = QValueAxis()
-        self.axis_x.setRange(0, 1000)
+        self.axis_x.setRange(0, self.waveform_points)
         self.axis_y.setRange(-1, 1)
         
         self.axis_x.setLabelsVisible(False)  
@@ -231,31 +298,87 @@ class TranslatorApp(QMainWindow):
     def update_waveform(self, audio_data: np.ndarray) -> None:
         """
         Update the audio waveform visualization with new audio data.
+        While the live waveform is scrolling, completed utterances are not redrawn.
 
         Args:
             audio_data: Numpy array containing audio waveform data
         """
 
-        normalized_data = audio_data / np.max(np.abs(audio_data))
-        
-        self.audio_series.clear()
-        step = len(normalized_data) // 1000
-        for i, value in enumerate(normalized_data[::step][:1000]):
-            self.audio_series.append(i, value)
-            
-        self.audio_chart.update()
+        if self.live_waveform_active:
+            return
+        self.show_envelope(min_max_envelope(audio_data, self.waveform_points))
+
+    def on_audio_frame(self, frame: np.ndarray) -> None:
+        """
+        Add a chunk of microphone samples to the live waveform.
+        The chart itself is redrawn by the waveform timer at a fixed rate.
+
+        Args:
+            frame: Mono int16 samples read from the microphone
+        """
+
+        if self.live_waveform_active:
+            self.live_waveform.push(frame)
+            self.live_waveform_dirty = True
+
+    def refresh_live_waveform(self) -> None:
+        """
+        Redraw the live waveform if frames arrived since the last redraw.
+        """
+
+        if self.live_waveform_dirty:
+            self.live_waveform_dirty = False
+            self.show_envelope(self.live_waveform.get_envelope())
+
+    def show_envelope(self, envelope: np.ndarray) -> None:
+        """
+        Draw a min/max envelope across the chart with a single series update.
+
+        Args:
+            envelope: Array of (minimum, maximum) pairs in [-1, 1]
+        """
+
+        if len(envelope) == 0:
+            self.audio_series.clear()
+            return
+        x = np.repeat(np.linspace(0, self.waveform_points, len(envelope), endpoint=False), 2)
+        self.audio_series.replace([QPointF(px, py) for px, py in zip(x.tolist(), envelope.ravel().tolist())])
 
     def start_recording(self) -> None:
         """
         Start the audio recording process with the selected source language.
+        In continuous mode, a second click stops the running recording.
         Updates UI elements to reflect recording state.
         """
 
+        if self.audio_thread.isRunning():
+            self.audio_thread.stop()
+            self.record_button.setEnabled(False)
+            self.record_button.setText("Stopping...")
+            return
+
         source_lang = self.source_lang_combo.currentText().lower()
+        target_lang = self.target_lang_combo.currentText().lower()
+        continuous = self.continuous_checkbox.isChecked()
         try:
             self.audio_thread.set_language(source_lang)
-            self.record_button.setEnabled(False)
-            self.record_button.setText("Recording...")
+            self.audio_thread.set_continuous(continuous)
+            if self.pipeline_checkbox.isChecked():
+                self.pipeline.start()
+                self.audio_thread.set_text_sink(
+                    lambda text: self.pipeline.submit(text, source_lang, target_lang))
+            else:
+                self.audio_thread.set_text_sink(None)
+            self.record_button.setEnabled(continuous)
+            self.record_button.setText("Stop" if continuous else "Recording...")
+            self.continuous_checkbox.setEnabled(False)
+            self.pipeline_checkbox.setEnabled(False)
+            if continuous:
+                self.input_text.clear()
+                self.output_text.clear()
+                self.live_waveform.reset()
+                self.live_waveform_active = True
+                self.waveform_timer.start()
             self.statusBar().showMessage('Recording...')
             self.audio_thread.start()
         except ValueError as e:
@@ -264,33 +387,80 @@ class TranslatorApp(QMainWindow):
     def on_text_detected(self, text: str) -> None:
         """
         Handle detected speech text from the audio thread.
+        In continuous mode each utterance is appended to the input text.
 
         Args:
             text: Detected speech text
         """
 
+        if self.audio_thread.continuous:
+            self.input_text.append(text)
+            return
+
         self.input_text.setPlainText(text)
         self.record_button.setEnabled(True)
         self.record_button.setText("Record")
         self.statusBar().showMessage('Recording completed')
 
+    def on_recording_finished(self) -> None:
+        """
+        Restore the recording controls once the audio thread has finished.
+        """
+
+        self.waveform_timer.stop()
+        self.live_waveform_active = False
+        self.record_button.setEnabled(True)
+        self.record_button.setText("Record")
+        self.continuous_checkbox.setEnabled(True)
+        self.pipeline_checkbox.setEnabled(True)
+        if self.audio_thread.continuous:
+            self.statusBar().showMessage('Recording completed')
+
+    def on_pipeline_translated(self, source_text: str, translation: str) -> None:
+        """
+        Show a translation produced by the background pipeline along with
+        the pipeline's stage latencies.
+
+        Args:
+            source_text: Recognized text
+            translation: Translated text
+        """
+
+        if self.audio_thread.continuous:
+            self.output_text.append(translation)
+        else:
+            self.output_text.setPlainText(translation)
+
+        metrics = self.pipeline.get_metrics()
+        self.statusBar().showMessage(
+            f"Translated and queued for saving "
+            f"(translate p50 {metrics['translation']['latency_p50_ms']:.0f} ms, "
+            f"save p50 {metrics['persistence']['latency_p50_ms']:.0f} ms, "
+            f"queued {metrics['translation']['queue_depth']})"
+        )
+
     def update_target_languages(self, source_lang: str) -> None:
         """
-        Update available target languages based on selected source language.
+        Update available target languages based on selected source language,
+        including those reached through a pivot language. In preload mode,
+        also starts loading the direct models in the background.
 
         Args:
             source_lang: Selected source language
         """
 
         self.target_lang_combo.clear()
-        supported_pairs = [target for (source, target) in self.translator_model.language_pairs.keys() 
-                         if source.lower() == source_lang.lower()]
+        supported_pairs = self.translator_model.get_target_languages(source_lang, include_pivot=True)
         self.target_lang_combo.addItems([lang.capitalize() for lang in supported_pairs])
 
+        if self.preload:
+            self.translator_model.preload(source_lang)
+
     def translate_text(self) -> None:
         """
-        Translate the input text using the selected language pair.
-        Updates the output text area with the translation result.
+        Queue a translation of the input text using the selected language pair.
+        The translation runs on the worker thread and supersedes any request
+        still in progress; the result arrives in on_translation_finished.
         """
 
         source_lang = self.source_lang_combo.currentText().lower()
@@ -299,7 +469,55 @@ class TranslatorApp(QMainWindow):
         
         if input_text:
             self.statusBar().showMessage('Translating...')
-            translation = self.translator_model.translate(input_text, source_lang, target_lang)
+            self.current_request_id = self.translation_worker.submit(input_text, source_lang, target_lang)
+
+    def on_translation_started(self, request_id: int) -> None:
+        """
+        Clear the output box when the current translation starts streaming.
+
+        Args:
+            request_id: Identifier of the translation request
+        """
+
+        if request_id == self.current_request_id:
+            self.output_text.clear()
+
+    def on_translation_chunk(self, request_id: int, chunk: str) -> None:
+        """
+        Append a piece of the current translation as soon as it is generated.
+
+        Args:
+            request_id: Identifier of the translation request
+            chunk: Next piece of the translated text
+        """
+
+        if request_id == self.current_request_id:
+            self.output_text.moveCursor(QTextCursor.MoveOperation.End)
+            self.output_text.insertPlainText(chunk)
+
+    def on_translation_progress(self, request_id: int, done: int, total: int) -> None:
+        """
+        Report the progress of the current translation in the status bar.
+
+        Args:
+            request_id: Identifier of the translation request
+            done: Number of sentences translated so far
+            total: Number of sentences to translate
+        """
+
+        if request_id == self.current_request_id:
+            self.statusBar().showMessage(f'Translating... {done}/{total} sentences')
+
+    def on_translation_finished(self, request_id: int, translation: str) -> None:
+        """
+        Show a completed translation if it belongs to the latest request.
+
+        Args:
+            request_id: Identifier of the translation request
+            translation: Translated text or error message
+        """
+
+        if request_id == self.current_request_id:
             self.output_text.setPlainText(translation)
             self.statusBar().showMessage('Translation completed')
 
@@ -316,4 +534,69 @@ class TranslatorApp(QMainWindow):
         
         if source_text and target_text:
             self.db_manager.save_translation(source_text, target_text, source_lang, target_lang)
-            self.statusBar().showMessage('Translation saved to database')
\ No newline at end of file
+            self.statusBar().showMessage('Translation saved to database')
+
+    def setup_metrics_status(self) -> None:
+        """
+        Add a permanent status bar label with the latest hot-path timings,
+        refreshed every second while metrics are enabled.
+        """
+
+        self.metrics_label = QLabel()
+        self.metrics_label.setStyleSheet("font-size: 12px; color: #555;")
+        self.statusBar().addPermanentWidget(self.metrics_label)
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.setInterval(1000)
+        self.metrics_timer.timeout.connect(self.refresh_metrics_status)
+        if METRICS.enabled:
+            self.metrics_timer.start()
+        else:
+            self.metrics_label.hide()
+
+    def refresh_metrics_status(self) -> None:
+        """
+        Show the last duration of each hot-path span in the status bar, with
+        percentiles of every recorded span in the tooltip.
+        """
+
+        spans = METRICS.snapshot()['spans']
+        parts = [f"{label} {self.format_ms(spans[name]['last_ms'])}"
+                 for name, label in STATUS_SPANS if name in spans]
+        self.metrics_label.setText(" · ".join(parts))
+        self.metrics_label.setToolTip("\n".join(
+            f"{name}: p50 {self.format_ms(stats['p50_ms'])}, p95 {self.format_ms(stats['p95_ms'])}, "
+            f"{stats['count']} calls" for name, stats in spans.items()))
+
+    @staticmethod
+    def format_ms(milliseconds: float) -> str:
+        """
+        Format a duration for the status bar.
+
+        Args:
+            milliseconds: Duration in milliseconds
+
+        Returns:
+            Duration in seconds from one second up, in milliseconds below
+        """
+
+        if milliseconds >= 1000:
+            return f"{milliseconds / 1000:.2f}s"
+        return f"{milliseconds:.1f}ms" if milliseconds < 10 else f"{milliseconds:.0f}ms"
+
+    def closeEvent(self, event) -> None:
+        """
+        Stop background workers before the window closes.
+
+        Args:
+            event: Close event
+        """
+
+        self.metrics_timer.stop()
+        self.audio_thread.stop()
+        self.audio_thread.wait()
+        self.audio_thread.close_microphone()
+        self.pipeline.stop()
+        self.translation_worker.stop()
+        self.translator_model.shutdown()
+        self.db_manager.close()
+        super().closeEvent(event)
\ No newline at end of file
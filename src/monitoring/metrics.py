@@ -0,0 +1,312 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Callable, Dict, Optional, TypeVar
+
+F = TypeVar('F', bound=Callable)
+
+QUANTILES = (0.5, 0.95)
+
+
+class SpanStats:
+    """
+    Timing statistics of one named span.
+    Counts and totals cover every recorded span; quantiles are estimated from
+    a sliding window of recent durations.
+    """
+
+    def __init__(self, window: int = 1000) -> None:
+        """
+        Initialize empty statistics.
+
+        Args:
+            window: Number of recent durations used for quantiles (default: 1000)
+        """
+
+        self.durations = deque(maxlen=window)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        """
+        Record one span. Must be called with the registry lock held.
+
+        Args:
+            seconds: Duration of the span
+            failed: The span exited with an exception (default: False)
+        """
+
+        self.durations.append(seconds)
+        self.count += 1
+        self.errors += failed
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Summarize the recorded spans. Must be called with the registry lock held.
+
+        Returns:
+            Dictionary with count, errors, total seconds and last, mean, max
+            and quantile durations in milliseconds
+        """
+
+        ordered = sorted(self.durations)
+        summary = {
+            'count': self.count,
+            'errors': self.errors,
+            'total_seconds': self.total,
+            'last_ms': 1000 * self.last,
+            'mean_ms': 1000 * self.total / self.count if self.count else 0.0,
+            'max_ms': 1000 * self.max
+        }
+        for q in QUANTILES:
+            value = ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+            summary[f'p{int(q * 100)}_ms'] = 1000 * value
+        return summary
+
+
+class Span:
+    """
+    Context manager timing one occurrence of a named span.
+    """
+
+    __slots__ = ('registry', 'name', 'started')
+
+    def __init__(self, registry: 'MetricsRegistry', name: str) -> None:
+        self.registry = registry
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self) -> 'Span':
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.registry.observe(self.name, time.perf_counter() - self.started, failed=exc_type is not None)
+
+
+class NullSpan:
+    """
+    Shared do-nothing span handed out while metrics are disabled.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> 'NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        pass
+
+
+NULL_SPAN = NullSpan()
+
+
+class MetricsRegistry:
+    """
+    Process-wide registry of timing spans and counters for the hot paths:
+    microphone calibration and listening, silence removal, recognition, model
+    loading, generation and database reads and writes.
+
+    While disabled, span() returns a shared no-op context manager and
+    increment() returns immediately, so instrumented code pays a single
+    attribute check. Snapshots can be exported as JSON or in the Prometheus
+    text exposition format.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 1000) -> None:
+        """
+        Initialize an empty registry.
+
+        Args:
+            enabled: Record spans and counters (default: False)
+            window: Number of recent durations per span used for quantiles (default: 1000)
+        """
+
+        self.enabled = enabled
+        self.window = window
+        self.lock = threading.Lock()
+        self.spans: Dict[str, SpanStats] = {}
+        self.counters: Dict[str, float] = {}
+
+    def enable(self, enabled: bool = True) -> None:
+        """
+        Start or stop recording. Recorded values are kept.
+
+        Args:
+            enabled: Record spans and counters (default: True)
+        """
+
+        self.enabled = enabled
+
+    def span(self, name: str):
+        """
+        Time a block of code.
+
+        Usage:
+            with METRICS.span('db.write'):
+                ...
+
+        Args:
+            name: Dotted span name, e.g. 'translator.generate'
+
+        Returns:
+            Context manager recording the block's duration and whether it raised
+        """
+
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name)
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        """
+        Decorator timing every call of a function as a span.
+
+        Args:
+            name: Dotted span name
+
+        Returns:
+            Decorator wrapping the function
+        """
+
+        def decorator(function: F) -> F:
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with Span(self, name):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def observe(self, name: str, seconds: float, failed: bool = False) -> None:
+        """
+        Record a duration measured elsewhere.
+
+        Args:
+            name: Dotted span name
+            seconds: Duration in seconds
+            failed: The operation failed (default: False)
+        """
+
+        if not self.enabled:
+            return
+        with self.lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats(self.window)
+            stats.record(seconds, failed)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Dotted counter name, e.g. 'db.rows_written'
+            value: Amount added (default: 1)
+        """
+
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Get a summary of every span and counter.
+
+        Returns:
+            Dictionary with 'spans' (name -> SpanStats summary) and 'counters'
+            (name -> value), both sorted by name
+        """
+
+        with self.lock:
+            return {
+                'spans': {name: self.spans[name].snapshot() for name in sorted(self.spans)},
+                'counters': dict(sorted(self.counters.items()))
+            }
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """
+        Export a snapshot as JSON.
+
+        Args:
+            indent: JSON indentation (default: compact)
+
+        Returns:
+            JSON document with 'enabled', 'spans' and 'counters'
+        """
+
+        return json.dumps({'enabled': self.enabled, **self.snapshot()}, indent=indent)
+
+    def to_prometheus(self, prefix: str = 'voice_translator') -> str:
+        """
+        Export a snapshot in the Prometheus text exposition format. Spans form
+        one summary labelled by span name; counters one counter labelled by name.
+
+        Args:
+            prefix: Metric name prefix (default: 'voice_translator')
+
+        Returns:
+            Exposition text ending with a newline
+        """
+
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_span_seconds Duration of instrumented operations.",
+            f"# TYPE {prefix}_span_seconds summary"
+        ]
+        for name, stats in snapshot['spans'].items():
+            label = f'span="{escape_label(name)}"'
+            for q in QUANTILES:
+                value = stats[f'p{int(q * 100)}_ms'] / 1000
+                lines.append(f'{prefix}_span_seconds{{{label},quantile="{q}"}} {value!r}')
+            lines.append(f"{prefix}_span_seconds_sum{{{label}}} {stats['total_seconds']!r}")
+            lines.append(f"{prefix}_span_seconds_count{{{label}}} {stats['count']}")
+
+        lines.append(f"# HELP {prefix}_span_errors_total Instrumented operations that raised.")
+        lines.append(f"# TYPE {prefix}_span_errors_total counter")
+        for name, stats in snapshot['spans'].items():
+            lines.append(f'{prefix}_span_errors_total{{span="{escape_label(name)}"}} {stats["errors"]}')
+
+        lines.append(f"# HELP {prefix}_events_total Counted events.")
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in snapshot['counters'].items():
+            lines.append(f'{prefix}_events_total{{event="{escape_label(name)}"}} {value!r}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """
+        Discard all recorded spans and counters.
+        """
+
+        with self.lock:
+            self.spans.clear()
+            self.counters.clear()
+
+
+def escape_label(value: str) -> str:
+    """
+    Escape a Prometheus label value.
+
+    Args:
+        value: Raw label value
+
+    Returns:
+        Value with backslashes, quotes and newlines escaped
+    """
+
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+METRICS = MetricsRegistry(enabled=os.environ.get('VOICE_TRANSLATOR_METRICS', '').lower() in ('1', 'true', 'yes'))
\ No newline at end of file
@@ -0,0 +1,298 @@
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.database.manager import DatabaseManager
+from src.translator.model import TranslatorModel
+
+
+STOP = object()
+
+
+class StageMetrics:
+    """
+    Thread-safe latency and throughput counters for a pipeline stage.
+    Keeps a sliding window of recent samples for percentile estimates.
+    """
+
+    def __init__(self, window: int = 1000) -> None:
+        """
+        Initialize empty metrics.
+
+        Args:
+            window: Number of recent samples used for percentiles (default: 1000)
+        """
+
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=window)
+        self.waits = deque(maxlen=window)
+        self.items = 0
+        self.batches = 0
+        self.errors = 0
+
+    def record(self, latency: float, items: int = 1, waits: Sequence[float] = ()) -> None:
+        """
+        Record one processed batch.
+
+        Args:
+            latency: Time spent processing the batch in seconds
+            items: Number of items in the batch (default: 1)
+            waits: Time each item spent queued before the stage, in seconds (optional)
+        """
+
+        with self.lock:
+            self.latencies.append(latency)
+            self.waits.extend(waits)
+            self.items += items
+            self.batches += 1
+
+    def record_error(self) -> None:
+        """
+        Count a batch that failed.
+        """
+
+        with self.lock:
+            self.errors += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Get a summary of the recorded samples.
+
+        Returns:
+            Dictionary with item/batch/error counts and batch latency and
+            queue wait percentiles in milliseconds
+        """
+
+        with self.lock:
+            latencies = sorted(self.latencies)
+            waits = sorted(self.waits)
+            return {
+                'items': self.items,
+                'batches': self.batches,
+                'errors': self.errors,
+                'latency_p50_ms': 1000 * self._percentile(latencies, 0.50),
+                'latency_p95_ms': 1000 * self._percentile(latencies, 0.95),
+                'queue_wait_p50_ms': 1000 * self._percentile(waits, 0.50),
+                'queue_wait_p95_ms': 1000 * self._percentile(waits, 0.95)
+            }
+
+    @staticmethod
+    def _percentile(ordered: List[float], q: float) -> float:
+        """
+        Nearest-rank percentile of an already sorted list.
+        """
+
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class TranslationPipeline:
+    """
+    Concurrent recognition → translation → persistence pipeline.
+    Recognized text is submitted to a bounded queue, translated in micro-batches
+    on one thread and saved in batches on another, so an utterance can be
+    recognized while the previous one is being translated. A full queue blocks
+    the producer, which provides back-pressure instead of unbounded buffering.
+    """
+
+    def __init__(self, translator_model: TranslatorModel, db_manager: Optional[DatabaseManager] = None,
+                 queue_size: int = 32, batch_size: int = 8, flush_interval: float = 1.0,
+                 on_translated: Optional[Callable[[str, str, str, str], None]] = None) -> None:
+        """
+        Initialize the pipeline without starting it.
+
+        Args:
+            translator_model: Translator model used by the translation stage
+            db_manager: Database manager used by the persistence stage (optional,
+                translations are not saved without it)
+            queue_size: Capacity of each inter-stage queue (default: 32)
+            batch_size: Maximum items per translation or persistence batch (default: 8)
+            flush_interval: Maximum seconds a translation waits before being saved (default: 1.0)
+            on_translated: Callback receiving (source_text, translation, source_lang,
+                target_lang), called on the translation thread (optional)
+        """
+
+        self.translator_model = translator_model
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_translated = on_translated
+
+        self.translate_queue = queue.Queue(maxsize=queue_size)
+        self.persist_queue = queue.Queue(maxsize=queue_size)
+        self.metrics = {
+            'translation': StageMetrics(),
+            'persistence': StageMetrics(),
+            'end_to_end': StageMetrics()
+        }
+        self.threads = []
+
+    def start(self) -> None:
+        """
+        Start the translation and persistence threads.
+        """
+
+        if self.threads:
+            return
+        self.threads = [
+            threading.Thread(target=self._translation_stage, name="pipeline-translate", daemon=True),
+            threading.Thread(target=self._persistence_stage, name="pipeline-persist", daemon=True)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def submit(self, text: str, source_lang: str, target_lang: str,
+               timeout: Optional[float] = None) -> bool:
+        """
+        Queue recognized text for translation, blocking while the queue is full.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language name
+            target_lang: Target language name
+            timeout: Maximum seconds to wait for queue space (default: wait forever)
+
+        Returns:
+            True if the text was queued, False if the timeout expired
+        """
+
+        try:
+            self.translate_queue.put((text, source_lang.lower(), target_lang.lower(), time.perf_counter()),
+                                     timeout=timeout)
+            return True
+        except queue.Full:
+            return False
+
+    def stop(self) -> None:
+        """
+        Drain both queues, then stop the stage threads.
+        """
+
+        if not self.threads:
+            return
+        self.translate_queue.put(STOP)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-stage and end-to-end metrics, including current queue depths.
+
+        Returns:
+            Dictionary of stage name to metrics summary
+        """
+
+        metrics = {name: stage.snapshot() for name, stage in self.metrics.items()}
+        metrics['translation']['queue_depth'] = self.translate_queue.qsize()
+        metrics['persistence']['queue_depth'] = self.persist_queue.qsize()
+        return metrics
+
+    def _take_batch(self, source: queue.Queue, timeout: Optional[float]) -> Tuple[List[tuple], bool]:
+        """
+        Block for one item, then collect more until the batch is full, the
+        queue is empty (timeout None) or the timeout expires.
+
+        Args:
+            source: Queue to read from
+            timeout: Seconds to keep collecting after the first item, or None
+                to only take what is already queued
+
+        Returns:
+            Tuple of (items, stop requested)
+        """
+
+        item = source.get()
+        if item is STOP:
+            return [], True
+
+        batch = [item]
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while len(batch) < self.batch_size:
+            try:
+                if deadline is None:
+                    item = source.get_nowait()
+                else:
+                    item = source.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                break
+            if item is STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _translation_stage(self) -> None:
+        """
+        Translate queued texts in micro-batches grouped by language pair.
+        """
+
+        stopping = False
+        while not stopping:
+            batch, stopping = self._take_batch(self.translate_queue, None)
+            started = time.perf_counter()
+            waits = [started - item[3] for item in batch]
+
+            groups = {}
+            for item in batch:
+                groups.setdefault((item[1], item[2]), []).append(item)
+
+            for (source_lang, target_lang), items in groups.items():
+                failed = False
+                try:
+                    translations = self.translator_model.translate_batch(
+                        [item[0] for item in items], source_lang, target_lang, batch_size=self.batch_size)
+                except Exception as e:
+                    self.metrics['translation'].record_error()
+                    translations = [f"Translation error: {str(e)}"] * len(items)
+                    failed = True
+
+                for item, translation in zip(items, translations):
+                    if self.on_translated is not None:
+                        self.on_translated(item[0], translation, source_lang, target_lang)
+                    if not failed:
+                        self.persist_queue.put((item[0], translation, source_lang, target_lang,
+                                                item[3], time.perf_counter()))
+
+            if batch:
+                self.metrics['translation'].record(time.perf_counter() - started, len(batch), waits)
+
+        self.persist_queue.put(STOP)
+
+    def _persistence_stage(self) -> None:
+        """
+        Save translated texts in batches, flushing on size or flush_interval.
+        """
+
+        stopping = False
+        while not stopping:
+            batch, stopping = self._take_batch(self.persist_queue, self.flush_interval)
+            if not batch:
+                continue
+
+            started = time.perf_counter()
+            waits = [started - item[5] for item in batch]
+            try:
+                self._save(batch)
+            except Exception:
+                self.metrics['persistence'].record_error()
+                continue
+
+            finished = time.perf_counter()
+            self.metrics['persistence'].record(finished - started, len(batch), waits)
+            for item in batch:
+                self.metrics['end_to_end'].record(finished - item[4])
+
+    def _save(self, batch: List[tuple]) -> None:
+        """
+        Persist a batch of translations in a single transaction.
+
+        Args:
+            batch: Items of (source_text, translation, source_lang, target_lang, ...)
+        """
+
+        if self.db_manager is None:
+            return
+        self.db_manager.save_translations_bulk(item[:4] for item in batch)
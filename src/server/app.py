@@ -0,0 +1,261 @@
+import asyncio
+import json
+from typing import Dict, Optional, Tuple, Union
+
+from src.monitoring.metrics import METRICS
+from src.translator.model import TranslatorModel
+from .batcher import MicroBatcher
+
+
+class HTTPError(Exception):
+    """
+    Raised by request handlers to answer with an HTTP error status.
+    """
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           408: "Request Timeout", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class TranslationServer:
+    """
+    Minimal asyncio HTTP/1.1 JSON server sharing one TranslatorModel.
+
+    Endpoints:
+        POST /translate        {"text", "source", "target"} -> {"translation"}
+        POST /translate/batch  {"texts", "source", "target"} -> {"translations"}
+        GET  /health           server and model cache status
+        GET  /metrics          micro-batching, latency and hot-path span metrics
+        GET  /metrics/prometheus  hot-path spans and counters in Prometheus text format
+    """
+
+    def __init__(self, translator_model: TranslatorModel, host: str = "127.0.0.1", port: int = 8765,
+                 max_batch_size: int = 32, max_delay: float = 0.005,
+                 max_body_bytes: int = 1 << 20, idle_timeout: float = 30.0) -> None:
+        """
+        Initialize the server without listening yet.
+
+        Args:
+            translator_model: Translator model shared by all requests
+            host: Interface to listen on (default: 127.0.0.1)
+            port: TCP port to listen on, 0 for any free port (default: 8765)
+            max_batch_size: Maximum number of texts merged into one batch (default: 32)
+            max_delay: Seconds a request waits for others to join its batch (default: 0.005)
+            max_body_bytes: Largest accepted request body (default: 1 MiB)
+            idle_timeout: Seconds an idle keep-alive connection stays open (default: 30)
+        """
+
+        self.translator_model = translator_model
+        self.host = host
+        self.port = port
+        self.max_body_bytes = max_body_bytes
+        self.idle_timeout = idle_timeout
+        self.batcher = MicroBatcher(translator_model, max_batch_size=max_batch_size, max_delay=max_delay)
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.routes = {
+            ('POST', '/translate'): self.handle_translate,
+            ('POST', '/translate/batch'): self.handle_batch,
+            ('GET', '/health'): self.handle_health,
+            ('GET', '/metrics'): self.handle_metrics,
+            ('GET', '/metrics/prometheus'): self.handle_prometheus
+        }
+
+    async def start(self) -> None:
+        """
+        Start listening. The bound port is stored in self.port.
+        """
+
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """
+        Start listening and serve until cancelled.
+        """
+
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Stop accepting connections and stop the model thread.
+        """
+
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.batcher.shutdown()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve requests on one connection until the client closes it or asks to.
+        """
+
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self.read_request(reader), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    break
+                except HTTPError as e:
+                    await self.write_response(writer, e.status, {'error': e.message}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+
+                method, path, headers, body, keep_alive = request
+                status, payload = await self.dispatch(method, path, body)
+                await self.write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def read_request(self, reader: asyncio.StreamReader) -> Optional[tuple]:
+        """
+        Read one request.
+
+        Args:
+            reader: Connection stream
+
+        Returns:
+            Tuple of (method, path, headers, body, keep_alive), or None when
+            the client closed the connection
+
+        Raises:
+            HTTPError: If the request is malformed or too large
+        """
+
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode('latin-1').split()
+        except ValueError:
+            raise HTTPError(400, "Malformed request line")
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length")
+        if length > self.max_body_bytes:
+            raise HTTPError(413, f"Request body larger than {self.max_body_bytes} bytes")
+        body = await reader.readexactly(length) if length else b''
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' and (version == 'HTTP/1.1' or connection == 'keep-alive')
+        return method.upper(), target.split('?', 1)[0], headers, body, keep_alive
+
+    async def write_response(self, writer: asyncio.StreamWriter, status: int, payload: Union[Dict, str],
+                             keep_alive: bool) -> None:
+        """
+        Write a JSON response, or a plain text one for string payloads.
+        """
+
+        if isinstance(payload, str):
+            body = payload.encode('utf-8')
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            content_type = "application/json; charset=utf-8"
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Union[Dict, str]]:
+        """
+        Route a request to its handler.
+
+        Returns:
+            Tuple of (status, JSON payload or plain text)
+        """
+
+        handler = self.routes.get((method, path.rstrip('/') or '/'))
+        if handler is None:
+            if any(route_path == path for _, route_path in self.routes):
+                return 405, {'error': f"Method {method} not allowed"}
+            return 404, {'error': f"No endpoint {path}"}
+        try:
+            return 200, await handler(body)
+        except HTTPError as e:
+            return e.status, {'error': e.message}
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            return 500, {'error': f"Translation error: {str(e)}"}
+
+    @staticmethod
+    def parse_json(body: bytes) -> Dict:
+        """
+        Decode a JSON object request body.
+
+        Raises:
+            HTTPError: If the body is not a JSON object
+        """
+
+        try:
+            data = json.loads(body or b'{}')
+        except ValueError:
+            raise HTTPError(400, "Body is not valid JSON")
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Body must be a JSON object")
+        for field in ('source', 'target'):
+            if not isinstance(data.get(field), str):
+                raise HTTPError(400, f"Missing '{field}' language")
+        return data
+
+    async def handle_translate(self, body: bytes) -> Dict:
+        data = self.parse_json(body)
+        if not isinstance(data.get('text'), str):
+            raise HTTPError(400, "Missing 'text'")
+        translations = await self.batcher.translate([data['text']], data['source'], data['target'])
+        return {'translation': translations[0]}
+
+    async def handle_batch(self, body: bytes) -> Dict:
+        data = self.parse_json(body)
+        texts = data.get('texts')
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise HTTPError(400, "'texts' must be a list of strings")
+        translations = await self.batcher.translate(texts, data['source'], data['target'])
+        return {'translations': translations}
+
+    async def handle_health(self, body: bytes) -> Dict:
+        return {
+            'status': 'ok',
+            'device': self.translator_model.device,
+            'loaded_models': [f"{s}-{t}" for s, t in self.translator_model.loaded_models.keys()]
+        }
+
+    async def handle_metrics(self, body: bytes) -> Dict:
+        cache = self.translator_model.get_cache_info()
+        cache['models'] = [f"{s}-{t}" for s, t in cache['models']]
+        cache['sizes'] = {f"{s}-{t}": size for (s, t), size in cache['sizes'].items()}
+        metrics = {'batcher': self.batcher.get_metrics(), 'model_cache': cache}
+        if self.translator_model.memory is not None:
+            metrics['translation_memory'] = self.translator_model.memory.get_stats()
+        if METRICS.enabled:
+            metrics.update(METRICS.snapshot())
+        return metrics
+
+    async def handle_prometheus(self, body: bytes) -> str:
+        return METRICS.to_prometheus()
\ No newline at end of file
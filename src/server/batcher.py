@@ -0,0 +1,170 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+from src.pipeline.stages import StageMetrics
+from src.translator.model import TranslatorModel
+
+
+class MicroBatcher:
+    """
+    Merges concurrent translation requests into shared forward passes.
+    Requests for the same language pair that arrive within max_delay of each
+    other, or while the model is busy with the previous batch, are translated
+    together, so throughput grows with concurrency instead of one forward pass
+    per request. The model runs on a single background thread, keeping the
+    event loop free to accept more requests meanwhile.
+    """
+
+    def __init__(self, translator_model: TranslatorModel, max_batch_size: int = 32,
+                 max_delay: float = 0.005, batch_size: int = 16) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            translator_model: Translator model shared by every request
+            max_batch_size: Maximum number of texts merged into one batch (default: 32)
+            max_delay: Seconds a request waits for others to join its batch (default: 0.005)
+            batch_size: Maximum sentences per forward pass inside a batch (default: 16)
+        """
+
+        self.translator_model = translator_model
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.batch_size = batch_size
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="micro-batcher")
+
+        self.pending: Dict[Tuple[str, str], List[tuple]] = {}
+        self.pending_texts: Dict[Tuple[str, str], int] = {}
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.running = False
+        self.metrics = {
+            'batches': StageMetrics(),
+            'requests': StageMetrics()
+        }
+
+    async def translate(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """
+        Translate texts as part of the next batch for their language pair.
+
+        Args:
+            texts: Texts to translate
+            source_lang: Source language name
+            target_lang: Target language name
+
+        Returns:
+            Translated texts, one per input text
+
+        Raises:
+            ValueError: If the language pair is not supported
+        """
+
+        pair = (source_lang.lower(), target_lang.lower())
+        self.translator_model.find_route(*pair)
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        future = loop.create_future()
+        self.pending.setdefault(pair, []).append((texts, future, started))
+        self.pending_texts[pair] = self.pending_texts.get(pair, 0) + len(texts)
+
+        if self.pending_texts[pair] >= self.max_batch_size:
+            loop.call_soon(self._dispatch)
+        elif self.timer is None:
+            self.timer = loop.call_later(self.max_delay, self._dispatch)
+
+        try:
+            return await future
+        finally:
+            self.metrics['requests'].record(time.perf_counter() - started, len(texts))
+
+    def _dispatch(self) -> None:
+        """
+        Start the next batch unless one is already running; it will be
+        started when the running batch completes.
+        """
+
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.running or not self.pending:
+            return
+
+        pair = next(iter(self.pending))
+        requests = self.pending[pair]
+        taken = 0
+        count = 0
+        while taken < len(requests) and (taken == 0 or count + len(requests[taken][0]) <= self.max_batch_size):
+            count += len(requests[taken][0])
+            taken += 1
+
+        batch = requests[:taken]
+        if taken == len(requests):
+            del self.pending[pair]
+            del self.pending_texts[pair]
+        else:
+            self.pending[pair] = requests[taken:]
+            self.pending_texts[pair] -= count
+
+        self.running = True
+        asyncio.get_running_loop().create_task(self._run(pair, batch))
+
+    async def _run(self, pair: Tuple[str, str], batch: List[tuple]) -> None:
+        """
+        Translate one batch on the model thread and resolve its requests.
+
+        Args:
+            pair: (source_lang, target_lang) of the batch
+            batch: Pending requests of (texts, future, enqueued_at)
+        """
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        texts = [text for request in batch for text in request[0]]
+        try:
+            translations = await loop.run_in_executor(
+                self.executor,
+                partial(self.translator_model.translate_batch, texts, pair[0], pair[1],
+                        batch_size=self.batch_size))
+        except Exception as e:
+            self.metrics['batches'].record_error()
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            self.metrics['batches'].record(time.perf_counter() - started, len(texts),
+                                           [started - request[2] for request in batch])
+            position = 0
+            for request_texts, future, _ in batch:
+                if not future.done():
+                    future.set_result(translations[position:position + len(request_texts)])
+                position += len(request_texts)
+        finally:
+            self.running = False
+            if self.pending:
+                self._dispatch()
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get batch and request metrics, including the number of queued texts.
+
+        Returns:
+            Dictionary with 'batches' and 'requests' summaries
+        """
+
+        metrics = {name: stage.snapshot() for name, stage in self.metrics.items()}
+        batches = metrics['batches']
+        batches['mean_batch_size'] = batches['items'] / batches['batches'] if batches['batches'] else 0.0
+        batches['queued_texts'] = sum(self.pending_texts.values())
+        return metrics
+
+    def shutdown(self) -> None:
+        """
+        Stop the model thread after the running batch.
+        """
+
+        self.executor.shutdown(wait=True)
\ No newline at end of file
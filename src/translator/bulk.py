@@ -0,0 +1,286 @@
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+from typing import Callable, Dict, IO, Iterator, List, Optional, Tuple, Union
+
+from .model import LANGUAGE_PAIRS, TranslatorModel, find_route
+from .parallel import ParallelTranslator
+
+
+FORMATS = ('txt', 'jsonl', 'csv')
+
+
+def detect_format(path: str, default: str = 'txt') -> str:
+    """
+    Infer the record format of a file from its extension.
+
+    Args:
+        path: File path, or '-' for standard input/output
+        default: Format used when the extension is not recognized (default: 'txt')
+
+    Returns:
+        One of FORMATS
+    """
+
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    if extension == 'json':
+        extension = 'jsonl'
+    return extension if extension in FORMATS else default
+
+
+def route_cache_size(source_lang: str, target_lang: str,
+                     language_pairs: Dict[Tuple[str, str], str] = LANGUAGE_PAIRS) -> int:
+    """
+    Get the number of models a bulk job needs loaded at once, so that the
+    hops of a pivot route do not evict each other between chunks.
+
+    Args:
+        source_lang: Source language name
+        target_lang: Target language name
+        language_pairs: Supported pairs the route is searched over (default: LANGUAGE_PAIRS)
+
+    Returns:
+        Number of models along the route, at least 1 (1 for unsupported pairs,
+        which fail when translated)
+    """
+
+    try:
+        route = find_route(language_pairs, source_lang, target_lang)
+    except ValueError:
+        return 1
+    return max(len(route) - 1, 1)
+
+
+class RecordFormat:
+    """
+    Reads records from and writes translated records to one file format.
+    A record carries the text to translate plus whatever else the format
+    stores with it, so the output keeps every input field.
+    """
+
+    def __init__(self, name: str, field: str = 'text', output_field: str = 'translation') -> None:
+        """
+        Initialize the format.
+
+        Args:
+            name: Format name, one of FORMATS
+            field: JSONL key or CSV column holding the text to translate (default: 'text')
+            output_field: JSONL key or CSV column receiving the translation (default: 'translation')
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+
+        if name not in FORMATS:
+            raise ValueError(f"Unsupported format: {name}")
+        self.name = name
+        self.field = field
+        self.output_field = output_field
+        self.columns: Optional[List[str]] = None
+
+    def read(self, stream: IO[str]) -> Iterator[Tuple[str, object]]:
+        """
+        Read records lazily.
+
+        Args:
+            stream: Text stream to read from
+
+        Yields:
+            Tuples of (text to translate, original record)
+
+        Raises:
+            ValueError: If a JSONL or CSV record lacks the text field
+        """
+
+        if self.name == 'txt':
+            for line in stream:
+                line = line.rstrip('\r\n')
+                yield line, line
+        elif self.name == 'jsonl':
+            for number, line in enumerate(stream, 1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if not isinstance(record, dict) or self.field not in record:
+                    raise ValueError(f"Line {number}: expected an object with a '{self.field}' field")
+                yield str(record[self.field]), record
+        else:
+            reader = csv.DictReader(stream)
+            if reader.fieldnames is None or self.field not in reader.fieldnames:
+                raise ValueError(f"CSV input has no '{self.field}' column")
+            self.columns = list(reader.fieldnames)
+            if self.output_field not in self.columns:
+                self.columns.append(self.output_field)
+            for row in reader:
+                yield row[self.field] or '', row
+
+    def write_header(self, stream: IO[str]) -> None:
+        """
+        Write the header of a new output file (CSV only).
+
+        Args:
+            stream: Output text stream
+        """
+
+        if self.name == 'csv':
+            csv.DictWriter(stream, fieldnames=self.columns, lineterminator='\n').writeheader()
+
+    def write(self, stream: IO[str], records: List[object], translations: List[str]) -> None:
+        """
+        Write translated records.
+
+        Args:
+            stream: Output text stream
+            records: Original records, as yielded by read
+            translations: Translation of each record
+        """
+
+        if self.name == 'txt':
+            stream.writelines(translation.replace('\n', ' ') + '\n' for translation in translations)
+        elif self.name == 'jsonl':
+            for record, translation in zip(records, translations):
+                stream.write(json.dumps({**record, self.output_field: translation}, ensure_ascii=False) + '\n')
+        else:
+            writer = csv.DictWriter(stream, fieldnames=self.columns, lineterminator='\n')
+            writer.writerows({**record, self.output_field: translation}
+                             for record, translation in zip(records, translations))
+
+    def count_completed(self, path: str) -> int:
+        """
+        Count the records already written to an output file, dropping a
+        trailing record that was only partially written.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Number of complete records in the file
+        """
+
+        records = 0
+        end = 0
+        position = 0
+        quotes = 0
+        with open(path, 'rb+') as f:
+            for line in f:
+                position += len(line)
+                if not line.endswith(b'\n'):
+                    break
+                # A CSV newline inside a quoted field does not end the record
+                quotes += line.count(b'"')
+                if self.name != 'csv' or quotes % 2 == 0:
+                    records += 1
+                    end = position
+            f.truncate(end)
+
+        if self.name == 'csv':
+            return max(0, records - 1)
+        return records
+
+
+class BulkTranslator:
+    """
+    Headless translation of large record files.
+    Records are streamed through TranslatorModel.translate_batch in chunks,
+    so memory stays bounded by the chunk size, and each chunk is written and
+    flushed before the next one is translated. An interrupted run resumes
+    after the last record found in the output file.
+    """
+
+    def __init__(self, translator_model: Union[TranslatorModel, ParallelTranslator], source_lang: str, target_lang: str,
+                 chunk_size: int = 256, batch_size: int = 32) -> None:
+        """
+        Initialize the bulk translator.
+
+        Args:
+            translator_model: Translator model, or pool of worker processes, used for every chunk
+            source_lang: Source language name
+            target_lang: Target language name
+            chunk_size: Records translated and written together (default: 256)
+            batch_size: Maximum sentences per forward pass (default: 32)
+        """
+
+        self.translator_model = translator_model
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+
+    def translate_stream(self, source: IO[str], target: IO[str], record_format: RecordFormat,
+                         skip: int = 0, write_header: bool = True,
+                         progress: Optional[Callable[[Dict[str, float]], None]] = None) -> Dict[str, float]:
+        """
+        Translate every record of an input stream into an output stream.
+
+        Args:
+            source: Input text stream
+            target: Output text stream
+            record_format: Format of both streams
+            skip: Number of leading records already translated (default: 0)
+            write_header: Whether to write the format header with the first record (default: True)
+            progress: Callback receiving the running statistics after every chunk (optional)
+
+        Returns:
+            Dictionary with records, skipped, seconds and records_per_second
+        """
+
+        records = record_format.read(source)
+        skipped = sum(1 for _ in islice(records, skip))
+
+        stats = {'records': 0, 'skipped': skipped, 'seconds': 0.0, 'records_per_second': 0.0}
+        started = time.perf_counter()
+        while True:
+            chunk = list(islice(records, self.chunk_size))
+            if not chunk:
+                break
+            if write_header:
+                record_format.write_header(target)
+                write_header = False
+            texts = [text for text, _ in chunk]
+            translations = self.translator_model.translate_batch(texts, self.source_lang, self.target_lang,
+                                                                 batch_size=self.batch_size)
+            record_format.write(target, [record for _, record in chunk], translations)
+            target.flush()
+
+            stats['records'] += len(chunk)
+            stats['seconds'] = time.perf_counter() - started
+            stats['records_per_second'] = stats['records'] / stats['seconds'] if stats['seconds'] else 0.0
+            if progress is not None:
+                progress(stats)
+        return stats
+
+    def translate_file(self, input_path: str, output_path: str, record_format: RecordFormat,
+                       resume: bool = True,
+                       progress: Optional[Callable[[Dict[str, float]], None]] = None) -> Dict[str, float]:
+        """
+        Translate a file, or standard input/output when a path is '-'.
+
+        Args:
+            input_path: Input file path, or '-' for standard input
+            output_path: Output file path, or '-' for standard output
+            record_format: Format of the input and output
+            resume: Continue after the records already in the output file instead
+                of overwriting it (default: True)
+            progress: Callback receiving the running statistics after every chunk (optional)
+
+        Returns:
+            Dictionary with records, skipped, seconds and records_per_second
+        """
+
+        skip = 0
+        if resume and output_path != '-' and os.path.exists(output_path):
+            skip = record_format.count_completed(output_path)
+
+        source = sys.stdin if input_path == '-' else open(input_path, encoding='utf-8', newline='')
+        try:
+            if output_path == '-':
+                return self.translate_stream(source, sys.stdout, record_format, progress=progress)
+            with open(output_path, 'a' if skip else 'w', encoding='utf-8', newline='') as target:
+                return self.translate_stream(source, target, record_format, skip=skip,
+                                             write_header=not skip, progress=progress)
+        finally:
+            if source is not sys.stdin:
+                source.close()
\ No newline at end of file
@@ -0,0 +1,255 @@
+import gc
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+
+def estimate_model_bytes(translator: Any) -> int:
+    """
+    Estimate the memory held by a translation pipeline's model weights.
+
+    Tensors are read from the state dict so that packed int8 weights of
+    quantized layers are counted, and shared (tied) storage is counted once.
+
+    Args:
+        translator: Translation pipeline (or any object exposing a torch model as .model)
+
+    Returns:
+        Number of bytes used by the model weights and buffers
+    """
+
+    # A torch model can only exist once torch is imported, so never import it here
+    torch = sys.modules.get('torch')
+    model = getattr(translator, 'model', None)
+    if torch is None or not isinstance(model, torch.nn.Module):
+        return 0
+
+    total = 0
+    seen = set()
+    pending = list(model.state_dict().values())
+    while pending:
+        value = pending.pop()
+        if isinstance(value, (tuple, list)):
+            pending.extend(value)
+        elif isinstance(value, torch.Tensor):
+            if value.is_quantized:
+                value = value.int_repr()
+                total += value.numel() * value.element_size()
+                continue
+            key = (value.untyped_storage().data_ptr(), value.storage_offset(), value.numel())
+            if key not in seen:
+                seen.add(key)
+                total += value.numel() * value.element_size()
+    return total
+
+
+class ModelCache:
+    """
+    Least-recently-used cache of loaded translation pipelines.
+    Enforces an optional maximum number of models and an optional byte budget,
+    evicting the pipelines that have gone unused the longest.
+    """
+
+    def __init__(self, max_models: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """
+        Initialize an empty model cache.
+
+        Args:
+            max_models: Maximum number of resident models (default: unlimited)
+            max_bytes: Maximum total size of resident models in bytes (default: unlimited)
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+
+        if max_models is not None and max_models < 1:
+            raise ValueError(f"max_models must be positive, got {max_models}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.max_models = max_models
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.evictions = 0
+        self.lock = threading.RLock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check whether a pipeline is cached without changing its recency.
+        """
+
+        with self.lock:
+            return key in self.entries
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached pipelines.
+        """
+
+        with self.lock:
+            return len(self.entries)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """
+        Get a cached pipeline and mark it as most recently used.
+
+        Args:
+            key: Cache key, usually a (source, target) language pair
+
+        Returns:
+            Cached pipeline
+
+        Raises:
+            KeyError: If the key is not cached
+        """
+
+        with self.lock:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def __setitem__(self, key: Hashable, translator: Any) -> None:
+        """
+        Add a pipeline to the cache, see put().
+        """
+
+        self.put(key, translator)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached pipeline, or a default value if it is not cached.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss (default: None)
+
+        Returns:
+            Cached pipeline or default
+        """
+
+        with self.lock:
+            if key not in self.entries:
+                return default
+            return self[key]
+
+    def put(self, key: Hashable, translator: Any) -> List[Hashable]:
+        """
+        Add a pipeline to the cache and evict least-recently-used entries until
+        the limits are respected. The pipeline just added is never evicted,
+        even if it alone exceeds the byte budget.
+
+        Args:
+            key: Cache key
+            translator: Pipeline to cache
+
+        Returns:
+            Keys of the evicted pipelines
+        """
+
+        with self.lock:
+            self.entries[key] = translator
+            self.entries.move_to_end(key)
+            self.sizes[key] = estimate_model_bytes(translator)
+
+            evicted = []
+            while len(self.entries) > 1 and self._over_budget():
+                old_key, _ = self.entries.popitem(last=False)
+                self.sizes.pop(old_key, None)
+                evicted.append(old_key)
+            self.evictions += len(evicted)
+
+        if evicted:
+            self._release_memory()
+        return evicted
+
+    def pop(self, key: Hashable) -> Any:
+        """
+        Remove a pipeline from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Removed pipeline, or None if it was not cached
+        """
+
+        with self.lock:
+            self.sizes.pop(key, None)
+            translator = self.entries.pop(key, None)
+        if translator is not None:
+            self._release_memory()
+        return translator
+
+    def clear(self) -> None:
+        """
+        Remove every pipeline from the cache.
+        """
+
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+        self._release_memory()
+
+    def keys(self) -> List[Hashable]:
+        """
+        Get the cached keys from least to most recently used.
+
+        Returns:
+            List of cache keys
+        """
+
+        with self.lock:
+            return list(self.entries.keys())
+
+    def resident_bytes(self) -> int:
+        """
+        Get the estimated memory held by all cached models.
+
+        Returns:
+            Total size in bytes
+        """
+
+        with self.lock:
+            return sum(self.sizes.values())
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get a summary of the cache state and limits.
+
+        Returns:
+            Dictionary with cached keys, per-model sizes, totals, limits and eviction count
+        """
+
+        with self.lock:
+            return {
+                'models': list(self.entries.keys()),
+                'sizes': dict(self.sizes),
+                'resident_bytes': sum(self.sizes.values()),
+                'max_models': self.max_models,
+                'max_bytes': self.max_bytes,
+                'evictions': self.evictions
+            }
+
+    def _over_budget(self) -> bool:
+        """
+        Check whether the cache exceeds its count or byte limit.
+        Must be called with the lock held.
+        """
+
+        if self.max_models is not None and len(self.entries) > self.max_models:
+            return True
+        if self.max_bytes is not None and sum(self.sizes.values()) > self.max_bytes:
+            return True
+        return False
+
+    @staticmethod
+    def _release_memory() -> None:
+        """
+        Return memory of evicted models to the allocator.
+        """
+
+        gc.collect()
+        torch = sys.modules.get('torch')
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
@@ -0,0 +1,191 @@
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.database.manager import DatabaseManager
+
+
+WHITESPACE = re.compile(r'\s+')
+
+
+class TranslationMemory:
+    """
+    Two-level cache of previously translated sentences.
+    An in-process LRU answers repeated sentences without touching the model,
+    and an optional SQLite table keeps entries across application restarts.
+    """
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, capacity: int = 10000) -> None:
+        """
+        Initialize the translation memory.
+
+        Args:
+            db_manager: Database manager used as persistent backing store (optional)
+            capacity: Maximum number of entries kept in memory (default: 10000)
+        """
+
+        self.db_manager = db_manager
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalize text so that trivially different inputs share a cache entry.
+        Applies Unicode NFKC normalization and collapses runs of whitespace.
+
+        Args:
+            text: Text to normalize
+
+        Returns:
+            Normalized text
+        """
+
+        return WHITESPACE.sub(' ', unicodedata.normalize('NFKC', text)).strip()
+
+    @staticmethod
+    def make_key(text: str, source_lang: str, target_lang: str, model_id: str) -> str:
+        """
+        Build the hashed key identifying a translation.
+
+        Args:
+            text: Normalized source text
+            source_lang: Source language name
+            target_lang: Target language name
+            model_id: Identifier of the translation model
+
+        Returns:
+            Hex digest of the key fields
+        """
+
+        raw = '\x1f'.join((model_id, source_lang.lower(), target_lang.lower(), text))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, text: str, source_lang: str, target_lang: str, model_id: str) -> Optional[str]:
+        """
+        Look up a translation, first in memory and then in the database.
+
+        Args:
+            text: Source text
+            source_lang: Source language name
+            target_lang: Target language name
+            model_id: Identifier of the translation model
+
+        Returns:
+            Cached translation, or None on a miss
+        """
+
+        key = self.make_key(self.normalize(text), source_lang, target_lang, model_id)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+
+        translation = None
+        if self.db_manager is not None:
+            translation = self.db_manager.get_memory_entry(key)
+
+        with self.lock:
+            if translation is None:
+                self.misses += 1
+            else:
+                self.db_hits += 1
+                self._remember(key, translation)
+        return translation
+
+    def put(self, text: str, translation: str, source_lang: str, target_lang: str, model_id: str) -> None:
+        """
+        Store a translation in memory and in the database.
+
+        Args:
+            text: Source text
+            translation: Translated text
+            source_lang: Source language name
+            target_lang: Target language name
+            model_id: Identifier of the translation model
+        """
+
+        normalized = self.normalize(text)
+        key = self.make_key(normalized, source_lang, target_lang, model_id)
+        with self.lock:
+            self._remember(key, translation)
+
+        if self.db_manager is not None:
+            self.db_manager.save_memory_entry(key, normalized, translation,
+                                              source_lang.lower(), target_lang.lower(), model_id)
+
+    def put_many(self, translations: Iterable[Tuple[str, str]], source_lang: str, target_lang: str,
+                 model_id: str) -> None:
+        """
+        Store several translations of one language pair and model in memory,
+        and in the database with a single transaction.
+
+        Args:
+            translations: Tuples of (source text, translated text)
+            source_lang: Source language name
+            target_lang: Target language name
+            model_id: Identifier of the translation model
+        """
+
+        entries = []
+        for text, translation in translations:
+            normalized = self.normalize(text)
+            key = self.make_key(normalized, source_lang, target_lang, model_id)
+            entries.append((key, normalized, translation, source_lang.lower(), target_lang.lower(), model_id))
+        with self.lock:
+            for key, _, translation, _, _, _ in entries:
+                self._remember(key, translation)
+
+        if self.db_manager is not None:
+            self.db_manager.save_memory_entries(entries)
+
+    def _remember(self, key: str, translation: str) -> None:
+        """
+        Insert an entry in the in-memory LRU, evicting the oldest if full.
+        Must be called with the lock held.
+
+        Args:
+            key: Hashed translation memory key
+            translation: Translated text
+        """
+
+        self.entries[key] = translation
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop all in-memory entries and reset the counters.
+        Persistent entries in the database are kept.
+        """
+
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.db_hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters of the translation memory.
+
+        Returns:
+            Dictionary with memory hits, database hits, misses and current size
+        """
+
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'db_hits': self.db_hits,
+                'misses': self.misses,
+                'size': len(self.entries)
+            }
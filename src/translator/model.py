@@ -1,39 +1,156 @@
-from transformers import pipeline, AutoModelForSeq2SeqLM, AutoTokenizer
-import torch
-from typing import Dict, List, Set, Tuple, Union
+import importlib
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
+from src.monitoring.metrics import METRICS
+from .cache import ModelCache
+from .memory import TranslationMemory
+from .quantization import DEFAULT_CACHE_DIR, load_quantized_model
+from .segmentation import split_lines
+
+if TYPE_CHECKING:
+    import torch
+    from transformers import Pipeline
+
+
+LANGUAGE_PAIRS = {
+    ('italian', 'english'): "Helsinki-NLP/opus-mt-it-en",
+    ('english', 'italian'): "Helsinki-NLP/opus-mt-en-it",
+    ('italian', 'spanish'): "Helsinki-NLP/opus-mt-it-es",
+    ('spanish', 'italian'): "Helsinki-NLP/opus-mt-es-it",
+    ('italian', 'french'): "Helsinki-NLP/opus-mt-it-fr",
+    ('french', 'italian'): "Helsinki-NLP/opus-mt-fr-it",
+    ('italian', 'german'): "Helsinki-NLP/opus-mt-it-de",
+    ('german', 'italian'): "Helsinki-NLP/opus-mt-de-it"
+}
+
+
+def find_route(language_pairs: Dict[Tuple[str, str], str], source_lang: str, target_lang: str) -> List[str]:
+    """
+    Find the shortest chain of models translating between two languages,
+    with a breadth-first search over the supported pairs. Pairs without a
+    direct model go through a pivot language (e.g. english → italian → german).
+
+    Args:
+        language_pairs: Mapping of (source, target) language names to model names
+        source_lang: Source language name
+        target_lang: Target language name
+
+    Returns:
+        Languages along the route, starting with the source and ending with the target
+
+    Raises:
+        ValueError: If no chain of supported pairs connects the two languages
+    """
+
+    pair = (source_lang.lower(), target_lang.lower())
+    graph = {}
+    for source, target in language_pairs:
+        graph.setdefault(source, []).append(target)
+
+    previous = {pair[0]: None}
+    queue = deque([pair[0]])
+    while queue and pair[1] not in previous:
+        language = queue.popleft()
+        for neighbour in graph.get(language, []):
+            if neighbour not in previous:
+                previous[neighbour] = language
+                queue.append(neighbour)
+
+    if pair[0] == pair[1] or pair[1] not in previous:
+        raise ValueError(f"Unsupported language pair: {pair}")
+
+    route = [pair[1]]
+    while previous[route[-1]] is not None:
+        route.append(previous[route[-1]])
+    route.reverse()
+    return route
+
+
+class TranslationCancelled(Exception):
+    """
+    Raised when a batched translation is cancelled before it completes.
+    """
+
+
+class CancelCriteria:
+    """
+    Generation stopping criterion that stops a running generate call as soon
+    as a cancellation callback returns True.
+    """
+
+    def __init__(self, should_cancel: Callable[[], bool]) -> None:
+        self.should_cancel = should_cancel
+
+    def __call__(self, input_ids: 'torch.LongTensor', scores: 'torch.FloatTensor', **kwargs) -> 'torch.BoolTensor':
+        return input_ids.new_full((input_ids.shape[0],), int(self.should_cancel())).bool()
 
 
 class TranslatorModel:
     """
     A translation model class that handles multiple language pairs using pre-trained models.
-    Supports dynamic model loading and GPU acceleration when available.
+    Supports dynamic model loading, GPU acceleration when available and an
+    optional int8 quantized mode for CPU-only hosts.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, memory: Optional[TranslationMemory] = None,
+                 max_models: Optional[int] = None, max_model_bytes: Optional[int] = None,
+                 quantize: bool = False, quantized_cache_dir: str = DEFAULT_CACHE_DIR,
+                 pivot_cache_size: int = 10000) -> None:
         """
         Initialize the translator model with device detection and language pair mappings.
-        Models are loaded dynamically when needed to optimize memory usage.
+        Models are loaded dynamically when needed to optimize memory usage, and the
+        least recently used ones are unloaded once the cache limits are exceeded.
+        Pairs without a direct model are translated through intermediate languages.
+
+        Args:
+            memory: Translation memory consulted before running the model (optional)
+            max_models: Maximum number of models kept loaded (default: unlimited)
+            max_model_bytes: Maximum total size of loaded models in bytes (default: unlimited)
+            quantize: Load int8 dynamically quantized models for CPU inference (default: False)
+            quantized_cache_dir: Directory where quantized weights are cached
+            pivot_cache_size: Intermediate translations kept for pivot routes when no
+                translation memory is given (default: 10000)
         """
 
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        print(f"Device used: {self.device}")
+        self.quantize = quantize
+        self.quantized_cache_dir = quantized_cache_dir
+        self._device = None
         
-        self.language_pairs = {
-            ('italian', 'english'): "Helsinki-NLP/opus-mt-it-en",
-            ('english', 'italian'): "Helsinki-NLP/opus-mt-en-it",
-            ('italian', 'spanish'): "Helsinki-NLP/opus-mt-it-es",
-            ('spanish', 'italian'): "Helsinki-NLP/opus-mt-es-it",
-            ('italian', 'french'): "Helsinki-NLP/opus-mt-it-fr",
-            ('french', 'italian'): "Helsinki-NLP/opus-mt-fr-it",
-            ('italian', 'german'): "Helsinki-NLP/opus-mt-it-de",
-            ('german', 'italian'): "Helsinki-NLP/opus-mt-de-it"
-        }
+        self.language_pairs = dict(LANGUAGE_PAIRS)
         
-        self.loaded_models = {}
+        self.loaded_models = ModelCache(max_models=max_models, max_bytes=max_model_bytes)
+        self.memory = memory
+        self.pivot_memory = memory if memory is not None else TranslationMemory(capacity=pivot_cache_size)
+        self.routes: Dict[Tuple[str, str], List[str]] = {}
+        self.loading = {}
+        self.loading_lock = threading.Lock()
+        self.preload_executor = None
+        self.preload_futures: List[Future] = []
 
-    def load_model(self, source_lang: str, target_lang: str) -> pipeline:
+    @property
+    def device(self) -> str:
+        """
+        Device the models run on, detected on first use so that constructing
+        the translator does not import torch.
+
+        Returns:
+            'cuda' when a GPU is available and quantization is off, else 'cpu'
+        """
+
+        if self._device is None:
+            import torch
+            self._device = "cuda" if torch.cuda.is_available() and not self.quantize else "cpu"
+            print(f"Device used: {self._device}")
+        return self._device
+
+    def load_model(self, source_lang: str, target_lang: str) -> 'Pipeline':
         """
         Load a translation model for a specific language pair if not already loaded.
+        Loading a new model may unload the least recently used ones to stay within
+        the configured cache limits.
 
         Args:
             source_lang: Source language name
@@ -49,23 +166,230 @@ class TranslatorModel:
         pair = (source_lang.lower(), target_lang.lower())
         if pair not in self.language_pairs:
             raise ValueError(f"Unsupported language pair: {pair}")
-            
-        if pair not in self.loaded_models:
-            model_name = self.language_pairs[pair]
-            model = AutoModelForSeq2SeqLM.from_pretrained(model_name).to(self.device)
-            tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.loaded_models[pair] = pipeline(
-                "translation", 
-                model=model, 
-                tokenizer=tokenizer, 
-                device=0 if self.device == "cuda" else -1
-            )
+
+        with self.loading_lock:
+            translator = self.loaded_models.get(pair)
+            if translator is not None:
+                return translator
+            future = self.loading.get(pair)
+            is_loader = future is None
+            if is_loader:
+                future = Future()
+                self.loading[pair] = future
+
+        if not is_loader:
+            return future.result()
+
+        try:
+            with METRICS.span('translator.load_model'):
+                translator = self._build_pipeline(self.language_pairs[pair])
+                self.loaded_models.put(pair, translator)
+            METRICS.increment('translator.model_loads')
+            future.set_result(translator)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.loading_lock:
+                self.loading.pop(pair, None)
         
-        return self.loaded_models[pair]
+        return translator
+
+    def _build_pipeline(self, model_name: str) -> 'Pipeline':
+        """
+        Load a model and its tokenizer from disk into a translation pipeline.
+
+        Args:
+            model_name: Hugging Face model name
+
+        Returns:
+            Translation pipeline on the detected device
+        """
+
+        from transformers import pipeline, AutoModelForSeq2SeqLM, AutoTokenizer
+
+        if self.quantize:
+            model = load_quantized_model(model_name, self.quantized_cache_dir)
+        else:
+            model = AutoModelForSeq2SeqLM.from_pretrained(model_name).to(self.device)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        return pipeline(
+            "translation", 
+            model=model, 
+            tokenizer=tokenizer, 
+            device=0 if self.device == "cuda" else -1
+        )
+
+    def get_model_id(self, source_lang: str, target_lang: str) -> str:
+        """
+        Get the identifier of the model serving a language pair, distinguishing
+        quantized models so their outputs are cached separately.
+
+        Args:
+            source_lang: Source language name
+            target_lang: Target language name
+
+        Returns:
+            Model identifier
+        """
+
+        model_name = self.language_pairs[(source_lang.lower(), target_lang.lower())]
+        return f"{model_name}:int8" if self.quantize else model_name
+
+    def find_route(self, source_lang: str, target_lang: str) -> List[str]:
+        """
+        Find the shortest chain of models translating between two languages
+        with the module-level find_route, caching routes per pair.
+
+        Args:
+            source_lang: Source language name
+            target_lang: Target language name
+
+        Returns:
+            Languages along the route, starting with the source and ending with the target
+
+        Raises:
+            ValueError: If no chain of supported pairs connects the two languages
+        """
+
+        pair = (source_lang.lower(), target_lang.lower())
+        route = self.routes.get(pair)
+        if route is not None:
+            return route
+
+        route = find_route(self.language_pairs, *pair)
+        self.routes[pair] = route
+        return route
+
+    def get_target_languages(self, source_lang: str, include_pivot: bool = False) -> List[str]:
+        """
+        Get the languages a source language can be translated into.
+
+        Args:
+            source_lang: Source language name
+            include_pivot: Also include targets only reachable through a pivot language (default: False)
+
+        Returns:
+            Target language names, direct pairs first in declaration order
+        """
+
+        source_lang = source_lang.lower()
+        targets = [target for (source, target) in self.language_pairs.keys() if source == source_lang]
+        if include_pivot:
+            for language in self.get_supported_languages():
+                if language != source_lang and language not in targets:
+                    try:
+                        self.find_route(source_lang, language)
+                    except ValueError:
+                        continue
+                    targets.append(language)
+        return targets
+
+    def preload(self, source_lang: str, warm_up: bool = True) -> List[Future]:
+        """
+        Load the models for every pair starting from a source language on a
+        background worker, optionally running a tiny inference to warm them up.
+        A translation requested while its model is still loading waits for the
+        background load instead of loading the model a second time. Loads still
+        queued by the previous call are cancelled, so switching languages quickly
+        doesn't load, and evict models for, languages no longer selected.
+
+        Args:
+            source_lang: Source language name
+            warm_up: Run a short translation after loading (default: True)
+
+        Returns:
+            One future per preloaded pair, resolving to its translation pipeline
+        """
+
+        targets = self.get_target_languages(source_lang)
+        if self.loaded_models.max_models is not None:
+            targets = targets[:self.loaded_models.max_models]
+
+        for future in self.preload_futures:
+            future.cancel()
+        executor = self._get_preload_executor()
+        self.preload_futures = [executor.submit(self._preload_pair, source_lang, target, warm_up)
+                                for target in targets]
+        return self.preload_futures
+
+    def import_backends(self) -> Future:
+        """
+        Import torch and transformers and detect the device on the background
+        worker, so an application can show its window first and the first
+        translation does not pay for the imports.
+
+        Returns:
+            Future resolving to the device name
+        """
+
+        return self._get_preload_executor().submit(self._import_backends)
+
+    def _import_backends(self) -> str:
+        """
+        Import the inference libraries and resolve the device.
+
+        Returns:
+            Device name
+        """
+
+        importlib.import_module('transformers')
+        return self.device
+
+    def _get_preload_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the background worker used for preloading, starting it on first use.
+
+        Returns:
+            Single-threaded executor
+        """
+
+        if self.preload_executor is None:
+            self.preload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-preload")
+        return self.preload_executor
+
+    def _preload_pair(self, source_lang: str, target_lang: str, warm_up: bool) -> 'Pipeline':
+        """
+        Load a single language pair and optionally warm it up.
+
+        Args:
+            source_lang: Source language name
+            target_lang: Target language name
+            warm_up: Run a short translation after loading
+
+        Returns:
+            Translation pipeline for the language pair
+        """
+
+        translator = self.load_model(source_lang, target_lang)
+        if warm_up:
+            self._generate(translator, ["Hello."], batch_size=1)
+        return translator
+
+    def shutdown(self) -> None:
+        """
+        Stop the background preloading worker, cancelling pending preloads.
+        """
+
+        if self.preload_executor is not None:
+            self.preload_executor.shutdown(wait=False, cancel_futures=True)
+            self.preload_executor = None
+
+    def get_cache_info(self) -> Dict[str, object]:
+        """
+        Get the state of the loaded model cache, including resident size.
+
+        Returns:
+            Dictionary with loaded pairs, per-model and total sizes in bytes,
+            configured limits and number of evictions
+        """
+
+        return self.loaded_models.get_info()
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """
         Translate text from source language to target language.
+        Long inputs are segmented into sentences so nothing is truncated.
 
         Args:
             text: Text to translate
@@ -77,13 +401,347 @@ class TranslatorModel:
         """
 
         try:
-            translator = self.load_model(source_lang, target_lang)
-            translation = translator(text, max_length=512)[0]['translation_text']
-            return translation
+            return self.translate_batch([text], source_lang, target_lang)[0]
         except ValueError as e:
             return f"Error: {str(e)}"
         except Exception as e:
             return f"Translation error: {str(e)}"
+
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str,
+                        batch_size: int = 16,
+                        should_cancel: Optional[Callable[[], bool]] = None,
+                        progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
+        """
+        Translate several texts at once. Every text is split into sentences,
+        sentences are sorted by length and grouped into padded batches so that
+        each forward pass wastes as little padding as possible, and the
+        outputs are reassembled in the original order and line layout.
+        Sentences found in the translation memory skip the model entirely.
+        Pairs without a direct model are translated hop by hop along find_route.
+
+        Args:
+            texts: Texts to translate
+            source_lang: Source language name
+            target_lang: Target language name
+            batch_size: Maximum number of sentences per forward pass (default: 16)
+            should_cancel: Callback checked before every batch; returning True aborts (optional)
+            progress: Callback receiving (translated sentences, total sentences) after every batch (optional)
+
+        Returns:
+            Translated texts, one per input text
+
+        Raises:
+            ValueError: If the language pair is not supported or batch_size is not positive
+            TranslationCancelled: If should_cancel returned True before the last batch
+        """
+
+        return self.translate_with_metadata(texts, source_lang, target_lang, batch_size,
+                                            should_cancel, progress)[0]
+
+    def translate_with_metadata(self, texts: List[str], source_lang: str, target_lang: str,
+                                batch_size: int = 16,
+                                should_cancel: Optional[Callable[[], bool]] = None,
+                                progress: Optional[Callable[[int, int], None]] = None
+                                ) -> Tuple[List[str], Dict[str, object]]:
+        """
+        Translate several texts like translate_batch, also reporting the route
+        taken and where the time went. On a pivot route every hop is batched
+        over all sentences, and intermediate results are cached so repeated
+        pivots skip the first hop.
+
+        Args:
+            texts: Texts to translate
+            source_lang: Source language name
+            target_lang: Target language name
+            batch_size: Maximum number of sentences per forward pass (default: 16)
+            should_cancel: Callback checked before every batch; returning True aborts (optional)
+            progress: Callback receiving (done, total) after every batch, counted over all hops (optional)
+
+        Returns:
+            Tuple of (translated texts, metadata). Metadata holds the 'route', whether
+            it is a 'pivot', per-hop 'hops' entries with the model, sentence counts
+            and seconds spent, and 'total_seconds'
+
+        Raises:
+            ValueError: If the language pair is not supported or batch_size is not positive
+            TranslationCancelled: If should_cancel returned True before the last batch
+        """
+
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        started = time.perf_counter()
+        route = self.find_route(source_lang, target_lang)
+        layouts = [split_lines(text) for text in texts]
+        translations = [sentence for layout in layouts for line in layout for sentence in line]
+
+        hops = []
+        hop_count = len(route) - 1
+        for hop, (hop_source, hop_target) in enumerate(zip(route, route[1:])):
+            hop_started = time.perf_counter()
+            translator = self.load_model(hop_source, hop_target)
+            loaded = time.perf_counter()
+
+            hop_progress = None
+            if progress is not None:
+                hop_progress = lambda done, total, hop=hop: progress(hop * total + done, hop_count * total)
+            memory = self.memory if hop == hop_count - 1 else self.pivot_memory
+            stats = {}
+            translations = self._translate_sentences(translator, translations, hop_source, hop_target,
+                                                     batch_size, should_cancel, hop_progress,
+                                                     memory=memory, stats=stats)
+            hops.append({
+                'source': hop_source,
+                'target': hop_target,
+                'model': self.get_model_id(hop_source, hop_target),
+                'sentences': stats['sentences'],
+                'generated': stats['generated'],
+                'load_seconds': loaded - hop_started,
+                'seconds': time.perf_counter() - hop_started
+            })
+
+        results = []
+        position = 0
+        for layout in layouts:
+            lines = []
+            for line in layout:
+                lines.append(' '.join(translations[position:position + len(line)]))
+                position += len(line)
+            results.append('\n'.join(lines))
+
+        metadata = {
+            'route': route,
+            'pivot': hop_count > 1,
+            'hops': hops,
+            'total_seconds': time.perf_counter() - started
+        }
+        return results, metadata
+
+    def translate_stream(self, text: str, source_lang: str, target_lang: str,
+                         num_beams: Optional[int] = None,
+                         should_cancel: Optional[Callable[[], bool]] = None,
+                         progress: Optional[Callable[[int, int], None]] = None) -> Iterator[str]:
+        """
+        Translate text incrementally, yielding pieces of the output as they are
+        produced. Sentences are translated in reading order; with greedy decoding
+        every sentence is streamed token by token, while beam search, which only
+        knows the best hypothesis at the end, yields one sentence at a time.
+        Joining the yielded pieces gives the full translation, with the same
+        sentence and line layout as translate_batch. Translations decoded with
+        an explicit num_beams are remembered separately from translate_batch's,
+        which decodes with the model's generation config.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language name
+            target_lang: Target language name
+            num_beams: Beam width; 1 streams tokens (default: the model's generation config)
+            should_cancel: Callback checked while generating; returning True aborts (optional)
+            progress: Callback receiving (translated sentences, total sentences) after every sentence (optional)
+
+        Yields:
+            Consecutive pieces of the translated text
+
+        Raises:
+            ValueError: If the language pair is not supported
+            TranslationCancelled: If should_cancel returned True before the end
+        """
+
+        route = self.find_route(source_lang, target_lang)
+        layout = split_lines(text)
+        total = sum(len(line) for line in layout)
+        done = 0
+
+        for line_number, line in enumerate(layout):
+            if line_number:
+                yield '\n'
+            for position, sentence in enumerate(line):
+                if should_cancel is not None and should_cancel():
+                    raise TranslationCancelled()
+                if position:
+                    yield ' '
+
+                for hop_source, hop_target in zip(route[:-2], route[1:-1]):
+                    translator = self.load_model(hop_source, hop_target)
+                    sentence = self._translate_sentences(translator, [sentence], hop_source, hop_target, 1,
+                                                         memory=self.pivot_memory)[0]
+
+                source, target = route[-2], route[-1]
+                model_id = self.get_model_id(source, target)
+                if num_beams is not None:
+                    model_id = f"{model_id}:beams={num_beams}"
+                cached = self.memory.get(sentence, source, target, model_id) if self.memory else None
+                if cached is not None:
+                    yield cached
+                else:
+                    pieces = []
+                    translator = self.load_model(source, target)
+                    for piece in self._generate_stream(translator, sentence, num_beams, should_cancel):
+                        pieces.append(piece)
+                        yield piece
+                    if self.memory:
+                        self.memory.put(sentence, ''.join(pieces), source, target, model_id)
+
+                done += 1
+                if progress is not None:
+                    progress(done, total)
+
+    def _generate_stream(self, translator: 'Pipeline', sentence: str, num_beams: Optional[int] = None,
+                         should_cancel: Optional[Callable[[], bool]] = None) -> Iterator[str]:
+        """
+        Translate one sentence, streaming decoded text when decoding greedily.
+
+        Args:
+            translator: Translation pipeline holding the model and tokenizer
+            sentence: Sentence to translate
+            num_beams: Beam width (default: the model's generation config)
+            should_cancel: Callback checked after every generated token (optional)
+
+        Yields:
+            Pieces of the translated sentence
+
+        Raises:
+            TranslationCancelled: If should_cancel returned True during generation
+        """
+
+        import torch
+        from transformers import StoppingCriteriaList, TextIteratorStreamer
+
+        if num_beams is None:
+            num_beams = translator.model.generation_config.num_beams or 1
+        encoded = translator.tokenizer(
+            [sentence],
+            return_tensors="pt",
+            truncation=True,
+            max_length=512
+        ).to(self.device)
+        stopping_criteria = StoppingCriteriaList([CancelCriteria(should_cancel)] if should_cancel else [])
+
+        if num_beams > 1:
+            with torch.no_grad(), METRICS.span('translator.generate'):
+                generated = translator.model.generate(**encoded, max_length=512, num_beams=num_beams,
+                                                      stopping_criteria=stopping_criteria)
+            if should_cancel is not None and should_cancel():
+                raise TranslationCancelled()
+            yield translator.tokenizer.batch_decode(generated, skip_special_tokens=True)[0]
+            return
+
+        streamer = TextIteratorStreamer(translator.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        errors = []
+
+        def run() -> None:
+            try:
+                with torch.no_grad(), METRICS.span('translator.generate'):
+                    translator.model.generate(**encoded, max_length=512, num_beams=1, do_sample=False,
+                                              streamer=streamer, stopping_criteria=stopping_criteria)
+            except Exception as e:
+                errors.append(e)
+                streamer.end()
+
+        thread = threading.Thread(target=run, name="translation-stream", daemon=True)
+        thread.start()
+        for piece in streamer:
+            if piece:
+                yield piece
+        thread.join()
+        if errors:
+            raise errors[0]
+        if should_cancel is not None and should_cancel():
+            raise TranslationCancelled()
+
+    def _translate_sentences(self, translator: 'Pipeline', sentences: List[str], source_lang: str,
+                             target_lang: str, batch_size: int,
+                             should_cancel: Optional[Callable[[], bool]] = None,
+                             progress: Optional[Callable[[int, int], None]] = None,
+                             memory: Optional[TranslationMemory] = None,
+                             stats: Optional[Dict[str, int]] = None) -> List[str]:
+        """
+        Translate sentences, serving repeats from the translation memory and
+        sending each distinct remaining sentence to the model only once.
+
+        Args:
+            translator: Translation pipeline holding the model and tokenizer
+            sentences: Sentences to translate
+            source_lang: Source language name
+            target_lang: Target language name
+            batch_size: Maximum number of sentences per forward pass
+            should_cancel: Callback checked before every batch (optional)
+            progress: Callback receiving (done, total) after every batch (optional)
+            memory: Translation memory to use instead of self.memory (optional)
+            stats: Dictionary filled with the number of input and generated sentences (optional)
+
+        Returns:
+            Translated sentences in the same order as the input
+        """
+
+        memory = memory if memory is not None else self.memory
+        model_id = self.get_model_id(source_lang, target_lang)
+        known = {}
+        missing = []
+        for sentence in dict.fromkeys(sentences):
+            cached = memory.get(sentence, source_lang, target_lang, model_id) if memory else None
+            if cached is None:
+                missing.append(sentence)
+            else:
+                known[sentence] = cached
+
+        generated = self._generate(translator, missing, batch_size, should_cancel, progress)
+        known.update(zip(missing, generated))
+        if memory:
+            memory.put_many(zip(missing, generated), source_lang, target_lang, model_id)
+
+        if stats is not None:
+            stats['sentences'] = len(sentences)
+            stats['generated'] = len(missing)
+        return [known[sentence] for sentence in sentences]
+
+    def _generate(self, translator: 'Pipeline', sentences: List[str], batch_size: int,
+                  should_cancel: Optional[Callable[[], bool]] = None,
+                  progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
+        """
+        Run sentences through the model in length-sorted, padded batches.
+
+        Args:
+            translator: Translation pipeline holding the model and tokenizer
+            sentences: Sentences to translate
+            batch_size: Maximum number of sentences per forward pass
+            should_cancel: Callback checked before every batch (optional)
+            progress: Callback receiving (done, total) after every batch (optional)
+
+        Returns:
+            Translated sentences in the same order as the input
+
+        Raises:
+            TranslationCancelled: If should_cancel returned True
+        """
+
+        import torch
+
+        order = sorted(range(len(sentences)), key=lambda i: len(sentences[i]))
+        outputs = [''] * len(sentences)
+
+        for start in range(0, len(order), batch_size):
+            if should_cancel is not None and should_cancel():
+                raise TranslationCancelled()
+            indices = order[start:start + batch_size]
+            batch = [sentences[i] for i in indices]
+            encoded = translator.tokenizer(
+                batch,
+                return_tensors="pt",
+                padding=True,
+                truncation=True,
+                max_length=512
+            ).to(self.device)
+            with torch.no_grad(), METRICS.span('translator.generate'):
+                generated = translator.model.generate(**encoded, max_length=512)
+            METRICS.increment('translator.sentences_generated', len(batch))
+            decoded = translator.tokenizer.batch_decode(generated, skip_special_tokens=True)
+            for i, translation in zip(indices, decoded):
+                outputs[i] = translation
+            if progress is not None:
+                progress(start + len(indices), len(sentences))
+
+        return outputs
             
     def get_supported_languages(self) -> List[str]:
         """
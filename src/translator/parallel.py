@@ -0,0 +1,227 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .memory import TranslationMemory
+from .model import TranslatorModel
+
+
+_worker_model: Optional[TranslatorModel] = None
+
+
+def default_model_factory(max_models: Optional[int] = None, quantize: bool = False) -> TranslatorModel:
+    """
+    Build the translator model of a worker process.
+
+    Args:
+        max_models: Maximum number of models kept loaded by the worker (default: unlimited)
+        quantize: Load int8 dynamically quantized models (default: False)
+
+    Returns:
+        Translator model with its own in-memory translation memory
+    """
+
+    return TranslatorModel(memory=TranslationMemory(), max_models=max_models, quantize=quantize)
+
+
+def _init_worker(threads: int, model_factory: Callable[[], TranslatorModel]) -> None:
+    """
+    Initialize a worker process: pin its share of CPU threads and build its model.
+
+    Args:
+        threads: Number of intra-op threads this worker may use
+        model_factory: Picklable callable returning the worker's translator model
+    """
+
+    global _worker_model
+    import torch
+    torch.set_num_threads(threads)
+    torch.set_num_interop_threads(1)
+    _worker_model = model_factory()
+
+
+def _translate_in_worker(texts: List[str], source_lang: str, target_lang: str,
+                         batch_size: int) -> List[str]:
+    """
+    Translate texts with the model of the current worker process.
+    """
+
+    return _worker_model.translate_batch(texts, source_lang, target_lang, batch_size=batch_size)
+
+
+class ParallelTranslator:
+    """
+    Pool of worker processes, each holding its own TranslatorModel.
+    Small Marian batches stop scaling after a few intra-op threads, so the
+    CPU is split between independent processes instead. Requests for a
+    language pair go to the workers that already loaded that pair, and a pair
+    only spreads to another worker when all of its workers are busy, so
+    models are not loaded everywhere for no reason.
+    """
+
+    def __init__(self, workers: Optional[int] = None, threads_per_worker: Optional[int] = None,
+                 max_models: Optional[int] = None, quantize: bool = False,
+                 model_factory: Optional[Callable[[], TranslatorModel]] = None) -> None:
+        """
+        Start the worker processes. Models are loaded by each worker on first use.
+
+        Args:
+            workers: Number of worker processes (default: CPU count divided by threads_per_worker)
+            threads_per_worker: Intra-op threads per worker (default: CPU count divided by
+                workers, or 2 when workers is not given either)
+            max_models: Maximum number of models kept loaded per worker (default: unlimited)
+            quantize: Load int8 dynamically quantized models in every worker (default: False)
+            model_factory: Picklable callable building each worker's model, replacing
+                the default TranslatorModel (optional)
+
+        Raises:
+            ValueError: If workers or threads_per_worker is not positive
+        """
+
+        cpus = os.cpu_count() or 1
+        if workers is None:
+            threads_per_worker = threads_per_worker or 2
+            workers = max(1, cpus // threads_per_worker)
+        elif threads_per_worker is None:
+            threads_per_worker = max(1, cpus // max(1, workers))
+        if workers < 1 or threads_per_worker < 1:
+            raise ValueError("workers and threads_per_worker must be positive")
+
+        if model_factory is None:
+            model_factory = partial(default_model_factory, max_models=max_models, quantize=quantize)
+
+        self.threads_per_worker = threads_per_worker
+        context = multiprocessing.get_context('spawn')
+        self.executors = [
+            ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_init_worker,
+                                initargs=(threads_per_worker, model_factory))
+            for _ in range(workers)
+        ]
+        self.outstanding = [0] * workers
+        self.affinity: Dict[Tuple[str, str], List[int]] = {}
+        self.lock = threading.Lock()
+
+    def _pick_worker(self, pair: Tuple[str, str]) -> int:
+        """
+        Choose the worker for a request. Must be called with lock held.
+
+        Args:
+            pair: (source_lang, target_lang) of the request
+
+        Returns:
+            Worker index
+        """
+
+        workers = self.affinity.setdefault(pair, [])
+        best = min(workers, key=lambda index: self.outstanding[index], default=None)
+        if best is None or self.outstanding[best] > 0:
+            # Prefer idle workers holding no other pair, then any idle worker
+            assigned: Set[int] = {index for indexes in self.affinity.values() for index in indexes}
+            idle = [index for index in range(len(self.executors))
+                    if self.outstanding[index] == 0 and index not in workers]
+            if idle:
+                best = min(idle, key=lambda index: index in assigned)
+                workers.append(best)
+            elif best is None:
+                best = min(range(len(self.executors)), key=lambda index: self.outstanding[index])
+                workers.append(best)
+        return best
+
+    def _release(self, index: int, _: Future) -> None:
+        """
+        Decrement a worker's count of outstanding requests once a request
+        finishes, so _pick_worker sees it as idle again. The worker stays in the
+        affinity list of the pairs it has loaded, so later requests for those
+        pairs keep going to it.
+
+        Args:
+            index: Index of the worker that ran the request
+            _: Completed future, unused
+        """
+
+        with self.lock:
+            self.outstanding[index] -= 1
+
+    def submit(self, texts: List[str], source_lang: str, target_lang: str,
+               batch_size: int = 16) -> Future:
+        """
+        Queue texts for translation on one worker.
+
+        Args:
+            texts: Texts to translate
+            source_lang: Source language name
+            target_lang: Target language name
+            batch_size: Maximum number of sentences per forward pass (default: 16)
+
+        Returns:
+            Future resolving to the translated texts, or raising the worker's exception
+        """
+
+        pair = (source_lang.lower(), target_lang.lower())
+        with self.lock:
+            index = self._pick_worker(pair)
+            self.outstanding[index] += 1
+        future = self.executors[index].submit(_translate_in_worker, texts, pair[0], pair[1], batch_size)
+        future.add_done_callback(partial(self._release, index))
+        return future
+
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str,
+                        batch_size: int = 16, min_chunk: int = 8) -> List[str]:
+        """
+        Translate several texts, split evenly across the workers.
+        Drop-in replacement for TranslatorModel.translate_batch in bulk jobs.
+
+        Args:
+            texts: Texts to translate
+            source_lang: Source language name
+            target_lang: Target language name
+            batch_size: Maximum number of sentences per forward pass (default: 16)
+            min_chunk: Minimum number of texts sent to one worker (default: 8)
+
+        Returns:
+            Translated texts, one per input text
+
+        Raises:
+            ValueError: If the language pair is not supported
+        """
+
+        if not texts:
+            return []
+        chunk = max(min_chunk, -(-len(texts) // len(self.executors)))
+        futures = [self.submit(texts[start:start + chunk], source_lang, target_lang, batch_size)
+                   for start in range(0, len(texts), chunk)]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def get_info(self) -> Dict[str, object]:
+        """
+        Get the pool layout and load.
+
+        Returns:
+            Dictionary with worker count, threads per worker, outstanding
+            requests per worker and the workers serving each language pair
+        """
+
+        with self.lock:
+            return {
+                'workers': len(self.executors),
+                'threads_per_worker': self.threads_per_worker,
+                'outstanding': list(self.outstanding),
+                'affinity': {f"{s}-{t}": list(workers) for (s, t), workers in self.affinity.items()}
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes.
+
+        Args:
+            wait: Wait for queued requests to finish (default: True)
+        """
+
+        for executor in self.executors:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
\ No newline at end of file
@@ -0,0 +1,42 @@
+import re
+from typing import List
+
+
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?…;])\s+(?=["«“\'(\[]?[^\s])')
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split a text into sentences on terminal punctuation followed by whitespace.
+    Line breaks are treated as hard boundaries so that lists and short lines
+    are never merged into a single sentence.
+
+    Args:
+        text: Text to segment
+
+    Returns:
+        List of non-empty, stripped sentences in their original order
+    """
+
+    sentences = []
+    for line in text.splitlines():
+        for sentence in SENTENCE_BOUNDARY.split(line.strip()):
+            sentence = sentence.strip()
+            if sentence:
+                sentences.append(sentence)
+    return sentences
+
+
+def split_lines(text: str) -> List[List[str]]:
+    """
+    Segment a text line by line, keeping the line structure so that a
+    translation can be reassembled with the same line breaks.
+
+    Args:
+        text: Text to segment
+
+    Returns:
+        One list of sentences per input line (empty for blank lines)
+    """
+
+    return [split_sentences(line) for line in text.split('\n')]
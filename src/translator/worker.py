@@ -0,0 +1,150 @@
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+import threading
+from typing import Optional
+from .model import TranslationCancelled, TranslatorModel
+
+
+class TranslationWorker(QThread):
+    """
+    A QThread subclass that runs translations off the GUI thread.
+    Only the most recent request is kept: submitting a new request supersedes
+    the pending one and cancels the running one at the next batch boundary,
+    while re-submitting an identical request is coalesced into the existing one.
+    In streaming mode, pieces of the translation are emitted as they are generated:
+    one sentence at a time with the model's own beam search, or token by token
+    with greedy decoding when stream_tokens is set.
+    """
+    translationStarted = pyqtSignal(int)
+    translationProgress = pyqtSignal(int, int, int)
+    translationChunk = pyqtSignal(int, str)
+    translationFinished = pyqtSignal(int, str)
+    translationCancelled = pyqtSignal(int)
+
+    def __init__(self, translator_model: TranslatorModel, parent: Optional[QObject] = None,
+                 streaming: bool = False, stream_tokens: bool = False) -> None:
+        """
+        Initialize the translation worker.
+
+        Args:
+            translator_model: Translator model used to run the requests
+            parent: Parent QObject (default: None)
+            streaming: Emit translationChunk while translating instead of only
+                the final result (default: False)
+            stream_tokens: Stream token by token with greedy decoding instead of
+                sentence by sentence with the model's generation config; greedy
+                translations are lower quality and cached separately (default: False)
+        """
+
+        super().__init__(parent)
+        self.translator_model = translator_model
+        self.streaming = streaming
+        self.stream_tokens = stream_tokens
+        self.condition = threading.Condition()
+        self.pending = None
+        self.active = None
+        self.latest_id = 0
+        self.is_running = True
+
+    def submit(self, text: str, source_lang: str, target_lang: str) -> int:
+        """
+        Queue a translation request, superseding any previous one.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language name
+            target_lang: Target language name
+
+        Returns:
+            Identifier of the request that will produce this translation
+        """
+
+        request = (text, source_lang.lower(), target_lang.lower())
+        with self.condition:
+            for queued in (self.pending, self.active):
+                if queued is not None and queued[0] == self.latest_id and queued[1:] == request:
+                    return self.latest_id
+
+            if self.pending is not None:
+                self.translationCancelled.emit(self.pending[0])
+            self.latest_id += 1
+            self.pending = (self.latest_id,) + request
+            self.condition.notify()
+            return self.latest_id
+
+    def cancel(self) -> None:
+        """
+        Cancel the pending request and the running one, if any.
+        """
+
+        with self.condition:
+            if self.pending is not None:
+                self.translationCancelled.emit(self.pending[0])
+                self.pending = None
+            self.latest_id += 1
+
+    def stop(self) -> None:
+        """
+        Stop the worker loop and wait for the thread to finish.
+        """
+
+        with self.condition:
+            self.is_running = False
+            self.pending = None
+            self.condition.notify()
+        self.wait()
+
+    def is_superseded(self, request_id: int) -> bool:
+        """
+        Check whether a request has been replaced by a newer one or cancelled.
+
+        Args:
+            request_id: Identifier of the request
+
+        Returns:
+            True if the request should stop as soon as possible
+        """
+
+        return not self.is_running or request_id != self.latest_id
+
+    def run(self) -> None:
+        """
+        Process translation requests until stop() is called.
+        Emits start, progress, completion and cancellation signals per request,
+        plus chunk signals in streaming mode.
+        """
+
+        while True:
+            with self.condition:
+                while self.pending is None and self.is_running:
+                    self.condition.wait()
+                if not self.is_running:
+                    return
+                self.active = self.pending
+                self.pending = None
+
+            request_id, text, source_lang, target_lang = self.active
+            self.translationStarted.emit(request_id)
+            should_cancel = lambda: self.is_superseded(request_id)
+            progress = lambda done, total: self.translationProgress.emit(request_id, done, total)
+            try:
+                if self.streaming:
+                    pieces = []
+                    for piece in self.translator_model.translate_stream(
+                            text, source_lang, target_lang, num_beams=1 if self.stream_tokens else None,
+                            should_cancel=should_cancel, progress=progress):
+                        pieces.append(piece)
+                        self.translationChunk.emit(request_id, piece)
+                    translation = ''.join(pieces)
+                else:
+                    translation = self.translator_model.translate_batch(
+                        [text], source_lang, target_lang, should_cancel=should_cancel, progress=progress)[0]
+                self.translationFinished.emit(request_id, translation)
+            except TranslationCancelled:
+                self.translationCancelled.emit(request_id)
+            except ValueError as e:
+                self.translationFinished.emit(request_id, f"Error: {str(e)}")
+            except Exception as e:
+                self.translationFinished.emit(request_id, f"Translation error: {str(e)}")
+            finally:
+                with self.condition:
+                    self.active = None
@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+from src.monitoring.metrics import METRICS
+from src.server.app import TranslationServer
+from src.translator.memory import TranslationMemory
+from src.translator.model import TranslatorModel
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Local HTTP translation service")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on (default: 8765)")
+    parser.add_argument("--max-batch-size", type=int, default=32,
+                        help="maximum texts merged into one forward pass (default: 32)")
+    parser.add_argument("--max-delay-ms", type=float, default=5.0,
+                        help="milliseconds a request waits for others to batch with (default: 5)")
+    parser.add_argument("--max-models", type=int, help="maximum number of models kept loaded")
+    parser.add_argument("--quantize", action="store_true", help="run int8 quantized models on the CPU")
+    parser.add_argument("--preload", metavar="LANGUAGE",
+                        help="load the models for this source language before serving")
+    parser.add_argument("--metrics", action="store_true",
+                        help="record hot-path timing spans, served at /metrics and /metrics/prometheus")
+    return parser.parse_args()
+
+async def serve(server):
+    await server.start()
+    print(f"Serving translations on http://{server.host}:{server.port}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+def main():
+    args = parse_args()
+    if args.metrics:
+        METRICS.enable()
+    translator_model = TranslatorModel(memory=TranslationMemory(), max_models=args.max_models,
+                                       quantize=args.quantize)
+    if args.preload:
+        for future in translator_model.preload(args.preload.lower()):
+            future.result()
+
+    server = TranslationServer(translator_model, host=args.host, port=args.port,
+                               max_batch_size=args.max_batch_size, max_delay=args.max_delay_ms / 1000)
+    try:
+        asyncio.run(serve(server))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        translator_model.shutdown()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file